@@ -0,0 +1,90 @@
+"""Structure-of-arrays store of world-space collision boxes."""
+
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from modules.base_classes import BoundingBox, Collidable
+
+
+class AABBStore:
+    """
+    Keeps every collidable's world-space min/max corners in two (N, 3) arrays.
+
+    Boxes are recomputed only when an object is added, moved or resized, so
+    overlap queries test cached numbers instead of building BoundingBox
+    objects for both sides of every check.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.mins = np.zeros((capacity, 3), dtype=np.float64)
+        self.maxs = np.zeros((capacity, 3), dtype=np.float64)
+        self.objects: List[Collidable] = []  # row -> object
+        self._rows: Dict[Collidable, int] = {}
+
+    def __contains__(self, obj: Collidable) -> bool:
+        return obj in self._rows
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def _write(self, row: int, box: BoundingBox) -> None:
+        self.mins[row] = (box.min_x, box.min_y, box.min_z)
+        self.maxs[row] = (box.max_x, box.max_y, box.max_z)
+
+    def add(self, obj: Collidable) -> None:
+        """Start tracking an object's box."""
+        if obj in self._rows:
+            self.update(obj)
+            return
+        row = len(self.objects)
+        if row == len(self.mins):
+            self.mins = np.concatenate([self.mins, np.zeros_like(self.mins)])
+            self.maxs = np.concatenate([self.maxs, np.zeros_like(self.maxs)])
+        self.objects.append(obj)
+        self._rows[obj] = row
+        self._write(row, obj.get_world_collision_box())
+
+    def update(self, obj: Collidable) -> None:
+        """Recompute an object's box after its position or size changed."""
+        row = self._rows.get(obj)
+        if row is not None:
+            self._write(row, obj.get_world_collision_box())
+
+    def remove(self, obj: Collidable) -> None:
+        """Stop tracking an object (swap-remove with the last row)."""
+        row = self._rows.pop(obj, None)
+        if row is None:
+            return
+        last = len(self.objects) - 1
+        if row != last:
+            moved = self.objects[last]
+            self.objects[row] = moved
+            self.mins[row] = self.mins[last]
+            self.maxs[row] = self.maxs[last]
+            self._rows[moved] = row
+        self.objects.pop()
+
+    def box(self, obj: Collidable) -> BoundingBox:
+        """Return the cached world-space box of a tracked object."""
+        row = self._rows[obj]
+        (min_x, min_y, min_z), (max_x, max_y, max_z) = self.mins[row], self.maxs[row]
+        return BoundingBox(min_x, max_x, min_y, max_y, min_z, max_z)
+
+    def query(self, box: BoundingBox, candidates: Optional[Iterable[Collidable]] = None) -> List[Collidable]:
+        """
+        Return the tracked objects whose boxes overlap `box` (touching counts,
+        as in BoundingBox.intersects). `candidates` limits the test to a
+        broadphase subset; by default every box is tested.
+        """
+        if candidates is None:
+            rows = np.arange(len(self.objects))
+        else:
+            rows = np.fromiter((self._rows[obj] for obj in candidates if obj in self._rows), dtype=np.intp)
+        if len(rows) == 0:
+            return []
+
+        mins = self.mins[rows]
+        maxs = self.maxs[rows]
+        lo = np.array((box.min_x, box.min_y, box.min_z))
+        hi = np.array((box.max_x, box.max_y, box.max_z))
+        hits = np.all((mins <= hi) & (maxs >= lo), axis=1)
+        return [self.objects[row] for row in rows[hits]]
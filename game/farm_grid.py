@@ -0,0 +1,467 @@
+"""Chunked farm-tile grid: dense per-chunk arrays instead of one DirtBlock object per tile."""
+
+import math
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+import numpy as np
+from render.backend import gl
+from modules.base_classes import BoundingBox, Vec3
+from modules.dirt_block import BlockState, FarmTileLogic
+from modules.items import ItemType
+from render.impostor import Impostor
+from render.instanced import InstancedMesh, InstanceProgram
+from render.lod import LOD_FULL, LOD_IMPOSTOR, LODSettings, box_distance
+from render.mesh import Mesh
+from render.render_queue import RenderQueue
+from utils.texture_atlas import AtlasRegion, TextureAtlas
+
+if TYPE_CHECKING:
+    from render.frustum import CullStats, Frustum
+
+CHUNK_SIZE = 16  # tiles per chunk side
+
+# Tile state codes stored in the chunk arrays; 0 means "no tile here"
+EMPTY = 0
+STATE_CODES = {BlockState.DIRT: 1, BlockState.FARMLAND: 2, BlockState.PLANTED: 3}
+CODE_STATES = {code: state for state, code in STATE_CODES.items()}
+PLANTED = STATE_CODES[BlockState.PLANTED]
+
+# Crop codes; 0 means nothing planted
+CROP_CODES = {item_type: i + 1 for i, item_type in enumerate(ItemType)}
+CODE_CROPS = {code: item_type for item_type, code in CROP_CODES.items()}
+
+# Unit cube faces as (x, y, z, u, v) corners, matching DirtBlock.draw
+_SIDE_FACES = np.array([
+    # Front
+    (-1, -1, 1, 0, 0), (1, -1, 1, 1, 0), (1, 1, 1, 1, 1), (-1, 1, 1, 0, 1),
+    # Back
+    (-1, -1, -1, 1, 0), (-1, 1, -1, 1, 1), (1, 1, -1, 0, 1), (1, -1, -1, 0, 0),
+    # Bottom
+    (-1, -1, -1, 1, 1), (1, -1, -1, 0, 1), (1, -1, 1, 0, 0), (-1, -1, 1, 1, 0),
+    # Left
+    (-1, -1, -1, 1, 0), (-1, 1, -1, 1, 1), (-1, 1, 1, 0, 1), (-1, -1, 1, 0, 0),
+    # Right
+    (1, -1, -1, 0, 0), (1, -1, 1, 1, 0), (1, 1, 1, 1, 1), (1, 1, -1, 0, 1),
+], dtype=np.float32)
+_TOP_FACE = np.array([(-1, 1, -1, 0, 1), (1, 1, -1, 1, 1), (1, 1, 1, 1, 0), (-1, 1, 1, 0, 0)], dtype=np.float32)
+_CROP_TOP_FACE = np.array([(-1, 1, -1, 0, 0), (1, 1, -1, 1, 0), (1, 1, 1, 1, 1), (-1, 1, 1, 0, 1)], dtype=np.float32)
+
+
+def tile_textures(state_code: int, crop_code: int) -> Tuple[str, str]:
+    """Return (side texture, top texture) paths for a tile."""
+    if state_code == STATE_CODES[BlockState.DIRT]:
+        return "assets/dirt.png", "assets/dirt.png"
+    if state_code == PLANTED and crop_code in CODE_CROPS:
+        crop_texture = f"assets/{CODE_CROPS[crop_code].value}.png"
+        return crop_texture, crop_texture
+    return "assets/farmland.png", "assets/farmland.png"
+
+
+class FarmChunk:
+    """CHUNK_SIZE x CHUNK_SIZE block of tiles stored as parallel arrays."""
+
+    def __init__(self, chunk_x: int, chunk_z: int):
+        shape = (CHUNK_SIZE, CHUNK_SIZE)
+        self.chunk_x = chunk_x
+        self.chunk_z = chunk_z
+        self.state = np.zeros(shape, dtype=np.int8)
+        self.crop = np.zeros(shape, dtype=np.int8)
+        self.growth_timer = np.zeros(shape, dtype=np.float32)
+        self.uses_remaining = np.full(shape, 3, dtype=np.int8)
+        self.tile_count = 0
+        # (atlas page texture, mesh kind) -> baked Mesh or InstancedMesh
+        self.meshes: Dict[Tuple[int, str], Union[Mesh, InstancedMesh]] = {}
+        self.impostor: Optional[Impostor] = None  # created the first time the chunk is far away
+        self.dirty = True
+
+    def rebuild(self, tile_size: float, tile_y: float, instanced: bool = False) -> None:
+        """
+        Rebuild this chunk's geometry after its tiles changed.
+        instanced: fill per-tile instance buffers for the shared unit-cube meshes
+        instead of baking every tile's vertices into one mesh per atlas page
+        """
+        if instanced:
+            self._rebuild_instanced(tile_size, tile_y)
+        else:
+            self._rebuild_baked(tile_size, tile_y)
+        if self.impostor is not None:
+            self.impostor.invalidate()
+        self.dirty = False
+
+    def draw_meshes(self, textured: bool = True) -> None:
+        """Draw every mesh now, binding each atlas page (untextured: geometry only)."""
+        for (page, _), mesh in self.meshes.items():
+            if textured:
+                gl.glBindTexture(gl.GL_TEXTURE_2D, page)
+                mesh.draw()
+            elif isinstance(mesh, InstancedMesh):
+                mesh.draw(textured=False)
+            else:
+                mesh.draw()
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+    def delete(self) -> None:
+        """Free the chunk's buffers and impostor."""
+        for mesh in self.meshes.values():
+            mesh.delete()
+        self.meshes = {}
+        if self.impostor is not None:
+            self.impostor.delete()
+            self.impostor = None
+
+    def _rebuild_baked(self, tile_size: float, tile_y: float) -> None:
+        for mesh in self.meshes.values():
+            mesh.delete()
+        self.meshes = {}
+
+        half = tile_size / 2
+        groups: Dict[int, List[np.ndarray]] = {}
+        occupied = np.argwhere(self.state != EMPTY)
+        for (lx, lz) in occupied:
+            state_code = int(self.state[lx, lz])
+            crop_code = int(self.crop[lx, lz])
+            side_texture, top_texture = tile_textures(state_code, crop_code)
+            top_face = _CROP_TOP_FACE if state_code == PLANTED and crop_code else _TOP_FACE
+            center = np.array([
+                (self.chunk_x * CHUNK_SIZE + lx) * tile_size,
+                tile_y,
+                (self.chunk_z * CHUNK_SIZE + lz) * tile_size,
+            ], dtype=np.float32)
+            for faces, texture_path in ((_SIDE_FACES, side_texture), (top_face, top_texture)):
+                region = TextureAtlas.get_region(texture_path)
+                page = region.texture_id if region else 0
+                groups.setdefault(page, []).append(_bake_faces(faces, center, half, region))
+
+        for page, parts in groups.items():
+            self.meshes[(page, "baked")] = Mesh(np.concatenate(parts).ravel(), textured=True)
+
+    def _rebuild_instanced(self, tile_size: float, tile_y: float) -> None:
+        occupied = np.argwhere(self.state != EMPTY)
+        states = self.state[occupied[:, 0], occupied[:, 1]]
+        crops = self.crop[occupied[:, 0], occupied[:, 1]]
+        centers = np.empty((len(occupied), 3), dtype=np.float32)
+        centers[:, 0] = (self.chunk_x * CHUNK_SIZE + occupied[:, 0]) * tile_size
+        centers[:, 1] = tile_y
+        centers[:, 2] = (self.chunk_z * CHUNK_SIZE + occupied[:, 1]) * tile_size
+
+        # Tiles sharing a (state, crop) pair share a texture; group them per
+        # (page, cube mesh) with each tile's atlas UV rect as instance data
+        groups: Dict[Tuple[int, str], List[Tuple[np.ndarray, Tuple[float, float, float, float]]]] = {}
+        for state_code, crop_code in set(zip(states.tolist(), crops.tolist())):
+            tiles = centers[(states == state_code) & (crops == crop_code)]
+            texture_path, _ = tile_textures(state_code, crop_code)  # sides and top always match
+            region = TextureAtlas.get_region(texture_path)
+            page = region.texture_id if region else 0
+            uv = region.uv if region else (0.0, 0.0, 1.0, 1.0)
+            cube = "crop_cube" if state_code == PLANTED and crop_code else "cube"
+            groups.setdefault((page, cube), []).append((tiles, uv))
+
+        # Reuse instance buffers of groups that are still present
+        for key in [key for key in self.meshes if key not in groups or key[1] == "baked"]:
+            self.meshes.pop(key).delete()
+        for (page, cube), parts in groups.items():
+            offsets = np.concatenate([tiles for tiles, _ in parts])
+            uv_rects = np.concatenate([np.tile(uv, (len(tiles), 1)) for tiles, uv in parts])
+            instances = self.meshes.get((page, cube))
+            if instances is None:
+                instances = self.meshes[(page, cube)] = InstancedMesh(_unit_mesh(cube), textured=page != 0)
+            instances.set_instances(offsets, np.full((len(offsets), 3), tile_size / 2), uv_rects)
+
+
+def _bake_faces(faces: np.ndarray, center: np.ndarray, half: float,
+                region: Optional[AtlasRegion] = None) -> np.ndarray:
+    """Turn unit-cube (x, y, z, u, v) corners into interleaved position/color/uv rows."""
+    rows = np.ones((len(faces), 8), dtype=np.float32)  # white vertex color
+    rows[:, :3] = faces[:, :3] * half + center
+    rows[:, 6:] = faces[:, 3:]
+    if region:
+        u0, v0, u1, v1 = region.uv
+        rows[:, 6:] = rows[:, 6:] * (u1 - u0, v1 - v0) + (u0, v0)
+    return rows
+
+
+_UNIT_MESHES: Dict[str, Mesh] = {}
+
+# Simplified mesh drawn in place of each cube at LOD_SIMPLE distance
+_LOD_MESHES = {"cube": "top", "crop_cube": "crop_top"}
+
+
+def _unit_mesh(cube: str) -> Mesh:
+    """
+    Shared unit cube ("cube", or "crop_cube" with the upright crop top) used as
+    the instanced tile mesh, or only its top face ("top", "crop_top").
+    """
+    if cube not in _UNIT_MESHES:
+        top_face = _CROP_TOP_FACE if cube.startswith("crop_") else _TOP_FACE
+        corners = np.concatenate([_SIDE_FACES, top_face]) if cube.endswith("cube") else top_face
+        _UNIT_MESHES[cube] = Mesh(_bake_faces(corners, np.zeros(3, dtype=np.float32), 1.0).ravel(), textured=True)
+    return _UNIT_MESHES[cube]
+
+
+class FarmTile(FarmTileLogic):
+    """Lightweight view of one grid tile, exposing the DirtBlock interface."""
+
+    def __init__(self, grid: "FarmGrid", tile_x: int, tile_z: int):
+        self.grid = grid
+        self.tile_x = tile_x
+        self.tile_z = tile_z
+        self._chunk, self._lx, self._lz = grid.locate(tile_x, tile_z)
+
+    @property
+    def position(self) -> Vec3:
+        return self.grid.tile_center(self.tile_x, self.tile_z)
+
+    @property
+    def growth_duration(self) -> float:
+        return self.grid.growth_duration
+
+    @property
+    def state(self) -> BlockState:
+        return CODE_STATES[int(self._chunk.state[self._lx, self._lz])]
+
+    @state.setter
+    def state(self, value: BlockState) -> None:
+        self._chunk.state[self._lx, self._lz] = STATE_CODES[value]
+        self._chunk.dirty = True
+
+    @property
+    def planted_item_type(self) -> Optional[ItemType]:
+        return CODE_CROPS.get(int(self._chunk.crop[self._lx, self._lz]))
+
+    @planted_item_type.setter
+    def planted_item_type(self, value: Optional[ItemType]) -> None:
+        self._chunk.crop[self._lx, self._lz] = CROP_CODES[value] if value else 0
+        self._chunk.dirty = True
+
+    @property
+    def growth_timer(self) -> float:
+        return float(self._chunk.growth_timer[self._lx, self._lz])
+
+    @growth_timer.setter
+    def growth_timer(self, value: float) -> None:
+        self._chunk.growth_timer[self._lx, self._lz] = value
+        if value > 0.0:
+            self.grid._growing.add((self._chunk.chunk_x, self._chunk.chunk_z))
+
+    @property
+    def uses_remaining(self) -> int:
+        return int(self._chunk.uses_remaining[self._lx, self._lz])
+
+    @uses_remaining.setter
+    def uses_remaining(self, value: int) -> None:
+        self._chunk.uses_remaining[self._lx, self._lz] = value
+
+
+class FarmGrid:
+    """
+    Farm tiles stored in dense chunks rather than as individual GameObjects.
+
+    Tiles live on an integer (tile_x, tile_z) lattice; tile (tx, tz) is a cube
+    centered at (tx * tile_size, tile_y, tz * tile_size), the same footprint a
+    DirtBlock of size tile_size would have there.
+    """
+
+    def __init__(self, tile_size: float = 1.0, tile_y: float = 0.0, growth_duration: float = 5.0,
+                 use_instancing: bool = True):
+        self.tile_size = tile_size
+        self.tile_y = tile_y
+        self.use_instancing = use_instancing  # falls back to baked meshes if unsupported
+        self.growth_duration = growth_duration
+        self.chunks: Dict[Tuple[int, int], FarmChunk] = {}
+        self._growing = set()  # keys of chunks that have a crop still counting down
+
+    # --- Tile addressing ---
+    def locate(self, tile_x: int, tile_z: int, create: bool = False) -> Tuple[Optional[FarmChunk], int, int]:
+        """Return (chunk, local_x, local_z) for a tile; chunk is None if missing and not created."""
+        key = (tile_x // CHUNK_SIZE, tile_z // CHUNK_SIZE)
+        chunk = self.chunks.get(key)
+        if chunk is None and create:
+            chunk = self.chunks[key] = FarmChunk(*key)
+        return chunk, tile_x % CHUNK_SIZE, tile_z % CHUNK_SIZE
+
+    def tile_center(self, tile_x: int, tile_z: int) -> Vec3:
+        return (tile_x * self.tile_size, self.tile_y, tile_z * self.tile_size)
+
+    def world_to_tile(self, x: float, z: float) -> Tuple[int, int]:
+        """Return the tile whose footprint contains a world-space point."""
+        return round(x / self.tile_size), round(z / self.tile_size)
+
+    def has_tile(self, tile_x: int, tile_z: int) -> bool:
+        chunk, lx, lz = self.locate(tile_x, tile_z)
+        return chunk is not None and chunk.state[lx, lz] != EMPTY
+
+    def tile_at(self, tile_x: int, tile_z: int) -> Optional[FarmTile]:
+        """Return an interactable view of a tile, or None if there is no tile there."""
+        if not self.has_tile(tile_x, tile_z):
+            return None
+        return FarmTile(self, tile_x, tile_z)
+
+    @property
+    def tile_count(self) -> int:
+        return sum(chunk.tile_count for chunk in self.chunks.values())
+
+    # --- Editing ---
+    def add_tile(self, tile_x: int, tile_z: int) -> None:
+        """Place a fresh dirt tile."""
+        chunk, lx, lz = self.locate(tile_x, tile_z, create=True)
+        if chunk.state[lx, lz] == EMPTY:
+            chunk.tile_count += 1
+        chunk.state[lx, lz] = STATE_CODES[BlockState.DIRT]
+        chunk.crop[lx, lz] = 0
+        chunk.growth_timer[lx, lz] = 0.0
+        chunk.uses_remaining[lx, lz] = 3
+        chunk.dirty = True
+
+    def remove_tile(self, tile_x: int, tile_z: int) -> None:
+        """Remove a tile; empty chunks are dropped."""
+        chunk, lx, lz = self.locate(tile_x, tile_z)
+        if chunk is None or chunk.state[lx, lz] == EMPTY:
+            return
+        chunk.state[lx, lz] = EMPTY
+        chunk.tile_count -= 1
+        chunk.dirty = True
+        if chunk.tile_count == 0:
+            chunk.delete()
+            key = (chunk.chunk_x, chunk.chunk_z)
+            del self.chunks[key]
+            self._growing.discard(key)
+
+    # --- Queries ---
+    def _tile_range(self, lo: float, hi: float) -> range:
+        """Tile indices along one axis whose footprint overlaps [lo, hi] (inclusive)."""
+        half = self.tile_size / 2
+        return range(math.ceil((lo - half) / self.tile_size), math.floor((hi + half) / self.tile_size) + 1)
+
+    def intersects(self, box: BoundingBox) -> bool:
+        """Check whether a world-space box touches any tile."""
+        half = self.tile_size / 2
+        if box.min_y > self.tile_y + half or box.max_y < self.tile_y - half:
+            return False
+        for tile_x in self._tile_range(box.min_x, box.max_x):
+            for tile_z in self._tile_range(box.min_z, box.max_z):
+                if self.has_tile(tile_x, tile_z):
+                    return True
+        return False
+
+    def nearest_tile(self, position: Vec3, max_distance: float) -> Optional[Tuple[FarmTile, float]]:
+        """Find the closest tile center within max_distance; returns (tile, distance)."""
+        nearest = None
+        nearest_sq = max_distance * max_distance
+        dy = self.tile_y - position[1]
+        for tile_x in self._tile_range(position[0] - max_distance, position[0] + max_distance):
+            dx = tile_x * self.tile_size - position[0]
+            for tile_z in self._tile_range(position[2] - max_distance, position[2] + max_distance):
+                dz = tile_z * self.tile_size - position[2]
+                distance_sq = dx * dx + dy * dy + dz * dz
+                if distance_sq <= nearest_sq and self.has_tile(tile_x, tile_z):
+                    nearest = (tile_x, tile_z)
+                    nearest_sq = distance_sq
+        if nearest is None:
+            return None
+        return FarmTile(self, *nearest), math.sqrt(nearest_sq)
+
+    def iter_collision_boxes(self) -> Iterator[BoundingBox]:
+        """Yield every tile's world-space box (for debug drawing)."""
+        half = self.tile_size / 2
+        for chunk in self.chunks.values():
+            for (lx, lz) in np.argwhere(chunk.state != EMPTY):
+                x, y, z = self.tile_center(chunk.chunk_x * CHUNK_SIZE + int(lx), chunk.chunk_z * CHUNK_SIZE + int(lz))
+                yield BoundingBox(x - half, x + half, y - half, y + half, z - half, z + half)
+
+    # --- Saving ---
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Every chunk's tile arrays stacked along a first axis, with the chunk keys."""
+        chunks = list(self.chunks.values())
+        shape = (len(chunks), CHUNK_SIZE, CHUNK_SIZE)
+        return {
+            "keys": np.array([(chunk.chunk_x, chunk.chunk_z) for chunk in chunks], dtype=np.int32).reshape(-1, 2),
+            "state": np.array([chunk.state for chunk in chunks], dtype=np.int8).reshape(shape),
+            "crop": np.array([chunk.crop for chunk in chunks], dtype=np.int8).reshape(shape),
+            "growth_timer": np.array([chunk.growth_timer for chunk in chunks], dtype=np.float32).reshape(shape),
+            "uses_remaining": np.array([chunk.uses_remaining for chunk in chunks], dtype=np.int8).reshape(shape),
+        }
+
+    def load_arrays(self, arrays: Dict[str, np.ndarray]) -> None:
+        """Replace every tile with stacked chunk arrays as returned by to_arrays()."""
+        for chunk in self.chunks.values():
+            chunk.delete()
+        self.chunks = {}
+        self._growing = set()
+        for i, (chunk_x, chunk_z) in enumerate(arrays["keys"].tolist()):
+            chunk = self.chunks[(chunk_x, chunk_z)] = FarmChunk(chunk_x, chunk_z)
+            chunk.state = arrays["state"][i].astype(np.int8)
+            chunk.crop = arrays["crop"][i].astype(np.int8)
+            chunk.growth_timer = arrays["growth_timer"][i].astype(np.float32)
+            chunk.uses_remaining = arrays["uses_remaining"][i].astype(np.int8)
+            chunk.tile_count = int(np.count_nonzero(chunk.state))
+            if ((chunk.state == PLANTED) & (chunk.growth_timer > 0.0)).any():
+                self._growing.add((chunk_x, chunk_z))
+
+    # --- Simulation ---
+    def update(self, delta_time: float) -> None:
+        """Count down growth timers, one vectorized step per chunk with growing crops."""
+        for _ in self.iter_update(delta_time):
+            pass
+
+    def iter_update(self, delta_time: float) -> Iterator[Tuple[int, int]]:
+        """
+        update() one chunk at a time, yielding (chunks done, chunk count) after each.
+        Any delta_time is exact (timers clamp at zero), so long jumps take one pass.
+        """
+        keys = list(self._growing)
+        for done, key in enumerate(keys, 1):
+            chunk = self.chunks[key]
+            growing = (chunk.state == PLANTED) & (chunk.growth_timer > 0.0)
+            if not growing.any():
+                self._growing.discard(key)
+            else:
+                chunk.growth_timer[growing] = np.maximum(chunk.growth_timer[growing] - delta_time, 0.0)
+            yield done, len(keys)
+
+    # --- Rendering ---
+    def chunk_bounds(self, chunk: FarmChunk) -> BoundingBox:
+        """World-space box around every tile a chunk can hold."""
+        half = self.tile_size / 2
+        span = CHUNK_SIZE * self.tile_size
+        min_x = chunk.chunk_x * span - half
+        min_z = chunk.chunk_z * span - half
+        return BoundingBox(min_x, min_x + span, self.tile_y - half, self.tile_y + half, min_z, min_z + span)
+
+    def draw(self, frustum: Optional["Frustum"] = None, stats: Optional["CullStats"] = None,
+             render_queue: Optional[RenderQueue] = None, eye: Optional[Vec3] = None,
+             lod: Optional[LODSettings] = None) -> None:
+        """
+        Draw all chunks, rebuilding only the ones whose tiles changed.
+        frustum: skip chunks outside the view (their tiles count as culled in stats)
+        render_queue: submit the chunk meshes there instead of drawing them now
+        eye, lod: draw chunks far from the camera position with fewer faces
+        (instanced tiles as their top quad) or as a pre-rendered impostor
+        """
+        queue = render_queue if render_queue is not None else RenderQueue()
+        instanced = self.use_instancing and InstanceProgram.supported()
+        for chunk in self.chunks.values():
+            bounds = self.chunk_bounds(chunk)
+            if frustum is not None and not frustum.box_visible(bounds):
+                if stats is not None:
+                    stats.culled += chunk.tile_count
+                continue
+            if stats is not None:
+                stats.drawn += chunk.tile_count
+            if chunk.dirty:
+                chunk.rebuild(self.tile_size, self.tile_y, instanced)
+            center = ((bounds.min_x + bounds.max_x) / 2, self.tile_y, (bounds.min_z + bounds.max_z) / 2)
+            level = LOD_FULL if eye is None or lod is None else lod.select(box_distance(eye, bounds))
+
+            if level >= LOD_IMPOSTOR:
+                if chunk.impostor is None:
+                    chunk.impostor = Impostor(size=CHUNK_SIZE * 16)
+                if chunk.impostor.capture(bounds, chunk.draw_meshes, partial(chunk.draw_meshes, textured=False)):
+                    queue.submit(partial(chunk.impostor.draw, bounds), texture=chunk.impostor.texture_id, position=center)
+                    continue
+            for (page, kind), mesh in chunk.meshes.items():
+                if level > LOD_FULL and kind in _LOD_MESHES:
+                    queue.submit(partial(mesh.draw, _unit_mesh(_LOD_MESHES[kind])), texture=page, position=center)
+                else:
+                    queue.submit(mesh.draw, texture=page, position=center)
+        if render_queue is None:
+            queue.flush()
@@ -0,0 +1,68 @@
+"""Fixed-rate simulation ticks decoupled from the render frame rate."""
+
+from typing import Dict, Iterable, TYPE_CHECKING
+from modules.base_classes import Vec3
+
+if TYPE_CHECKING:
+    from modules.base_classes import GameObject
+
+
+class FixedTimestep:
+    """
+    Accumulates real frame time and hands it out as whole simulation ticks.
+
+    Every tick advances the world by exactly `tick_time`, so results don't
+    depend on the frame rate and a slow frame can't produce one huge step.
+    At most `max_ticks_per_frame` ticks run per frame; time beyond that is
+    dropped (the game slows down instead of spiralling further behind).
+    """
+
+    def __init__(self, tick_rate: float = 30.0, max_ticks_per_frame: int = 5):
+        self.tick_rate = tick_rate
+        self.tick_time = 1.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0.0
+        self.ticks = 0  # total ticks run
+        self.dropped_time = 0.0  # seconds discarded by the catch-up cap
+
+    def advance(self, frame_time: float) -> int:
+        """Add one frame's elapsed time; returns how many ticks to run now."""
+        self.accumulator += frame_time
+        ticks = int(self.accumulator / self.tick_time)
+        if ticks > self.max_ticks_per_frame:
+            ticks = self.max_ticks_per_frame
+            dropped = self.accumulator - ticks * self.tick_time
+            self.dropped_time += dropped
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.tick_time
+        self.ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        """How far rendering is between the last two ticks (0 = previous tick, 1 = latest)."""
+        return min(self.accumulator / self.tick_time, 1.0)
+
+
+class PositionInterpolator:
+    """Remembers object positions before each tick so frames can be drawn in between ticks."""
+
+    def __init__(self):
+        self._previous: Dict["GameObject", Vec3] = {}
+
+    def capture(self, objects: Iterable["GameObject"]) -> None:
+        """Store positions as the 'previous' state; call right before each tick."""
+        self._previous = {obj: obj.position for obj in objects}
+
+    def position(self, obj: "GameObject", alpha: float) -> Vec3:
+        """Position between the previous and current tick (current if not captured)."""
+        previous = self._previous.get(obj)
+        if previous is None:
+            return obj.position
+        current = obj.position
+        return (
+            previous[0] + (current[0] - previous[0]) * alpha,
+            previous[1] + (current[1] - previous[1]) * alpha,
+            previous[2] + (current[2] - previous[2]) * alpha,
+        )
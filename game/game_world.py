@@ -1,88 +1,281 @@
-from OpenGL.GL import *
-from OpenGL.GLU import *
-from typing import Optional, List, Tuple
+from render.backend import gl
+from typing import Callable, Optional, List, Tuple, Union
 from modules.player import Player
-from modules.base_classes import GameObject, Collidable
+from modules.base_classes import GameObject, Collidable, Interactable, Pickable, BoundingBox, Vec3
 from ui.dialogue_box import DialogueBox
 from utils.utils import draw_collision_box
 from ui.hotbar import Hotbar
 from ui.inventory import Inventory
 from modules.chest import Chest
+from modules.dirt_block import DirtBlock
+from render.static_batcher import StaticBatcher
+from game.farm_grid import FarmGrid
+from game.growth_engine import GrowthEngine
+from game.growth_scheduler import GrowthScheduler
+from game.spatial_hash import SpatialHash
+from game.aabb_store import AABBStore
+from game.interactable_index import InteractableIndex
+from game.object_index import ObjectIndex
 import math
 
 
 class GameWorld:
     """Manages all game objects and interactions."""
 
-    def __init__(self):
-        self.objects: List[GameObject] = []
+    def __init__(self, growth_mode: str = "scheduled", headless: bool = False):
+        """
+        growth_mode: how DirtBlock growth advances.
+            "scheduled"  - ready times in a min-heap; a tick only touches crops that finish
+            "batched"    - all timers counted down in one NumPy step per tick
+            "per_object" - each DirtBlock counts down in its own update() (small worlds)
+        headless: simulation only (servers, fast-forwarding, load tests); the world
+            can't be drawn and plays no sounds. Neither this module nor the objects
+            import pygame or OpenGL until something is drawn, so no display is needed.
+        """
+        self.headless = headless
+        self.time = 0.0  # game seconds simulated so far
+        # Every object, plus one index per capability so per-frame loops
+        # never have to isinstance-filter the whole world
+        self.objects: ObjectIndex[GameObject] = ObjectIndex()
+        self.collidables: ObjectIndex[Collidable] = ObjectIndex()
+        self.interactables: ObjectIndex[GameObject] = ObjectIndex()
+        self.updatables: ObjectIndex[GameObject] = ObjectIndex()  # objects whose update() does work
+        self.drawables: ObjectIndex[GameObject] = ObjectIndex()  # objects not baked into a static batch
         self.player: Optional[Player] = None
+        self._despawn_queue: List[GameObject] = []  # destroyed at the end of the current tick
         self.dialogue_box = DialogueBox()
         self.opened_chest: Optional[Chest] = None
+        self.static_batcher = StaticBatcher()
+        self.farm_grid = FarmGrid()
+        self.collision_hash: SpatialHash[Collidable] = SpatialHash(cell_size=4.0)
+        self.aabb_store = AABBStore()
+        self.interactable_index = InteractableIndex(cell_size=4.0)
+        self.growth_tracker: Optional[Union[GrowthScheduler, GrowthEngine]] = None
+        if growth_mode == "scheduled":
+            self.growth_tracker = GrowthScheduler()
+        elif growth_mode == "batched":
+            self.growth_tracker = GrowthEngine()
+        elif growth_mode != "per_object":
+            raise ValueError(f"Unknown growth mode: {growth_mode}")
 
     def add_object(self, obj: GameObject) -> None:
         """Add an object to the world."""
-        self.objects.append(obj)
+        self.objects.add(obj)
+        obj._world = self
+        if isinstance(obj, DirtBlock) and self.growth_tracker is not None:
+            obj.attach_growth_tracker(self.growth_tracker)
+        if isinstance(obj, Collidable):
+            self.collidables.add(obj)
+            self.aabb_store.add(obj)
+            self.collision_hash.insert(obj, self.aabb_store.box(obj))
+        if isinstance(obj, Interactable):
+            self.interactables.add(obj)
+            self.interactable_index.add(obj)
+        if self._needs_update(obj):
+            self.updatables.add(obj)
+        self.static_batcher.add(obj)
+        if obj not in self.static_batcher:
+            self.drawables.add(obj)
         if isinstance(obj, Player):
             self.player = obj
 
+    def remove_object(self, obj: GameObject) -> None:
+        """Remove an object from the world right away, along with every index entry for it."""
+        if obj not in self.objects:
+            return
+        if obj is self.opened_chest:
+            self.close_chest()
+        self.objects.remove(obj)
+        self.collidables.remove(obj)  # type: ignore
+        self.interactables.remove(obj)
+        self.updatables.remove(obj)
+        self.drawables.remove(obj)
+        if isinstance(obj, Collidable):
+            self.aabb_store.remove(obj)
+            self.collision_hash.remove(obj)
+        self.interactable_index.remove(obj)
+        self.static_batcher.remove(obj)
+        if isinstance(obj, DirtBlock) and obj.growth_tracker is self.growth_tracker:
+            obj.attach_growth_tracker(None)
+        if obj is self.player:
+            self.player = None
+        obj._world = None
+
+    def despawn(self, obj: GameObject) -> None:
+        """Schedule an object for removal at the end of the current tick."""
+        if obj in self.objects and obj not in self._despawn_queue:
+            self._despawn_queue.append(obj)
+
+    def _flush_despawns(self) -> None:
+        """Destroy everything despawned during this tick."""
+        queue, self._despawn_queue = self._despawn_queue, []
+        for obj in queue:
+            self.remove_object(obj)
+
+    @staticmethod
+    def _needs_update(obj: GameObject) -> bool:
+        """Skip objects whose update() is the no-op base version (or handled by a tracker)."""
+        if type(obj).update is GameObject.update:
+            return False
+        if isinstance(obj, DirtBlock) and obj.growth_tracker is not None:
+            return False
+        return True
+
+    def _refresh_static(self, obj: GameObject) -> None:
+        """Re-check an object's static batching after a state change and sync drawables."""
+        self.static_batcher.refresh(obj)
+        if obj not in self.objects:
+            return
+        if obj in self.static_batcher:
+            self.drawables.remove(obj)
+        else:
+            self.drawables.add(obj)
+
     def get_collidables(self) -> List[Collidable]:
         """Get all collidable objects."""
-        return [obj for obj in self.objects if isinstance(obj, Collidable)]
+        return list(self.collidables)
+
+    def on_object_moved(self, obj: GameObject) -> None:
+        """Keep spatial indexes in sync after an object's position or size changed."""
+        if isinstance(obj, Collidable) and obj in self.aabb_store:
+            self.aabb_store.update(obj)
+            self.collision_hash.update(obj, self.aabb_store.box(obj))
+        if isinstance(obj, Interactable):
+            self.interactable_index.update(obj)
+
+    def get_collidables_near(self, box: BoundingBox) -> List[Collidable]:
+        """Broadphase: collidables sharing a spatial-hash cell with the box."""
+        return self.collision_hash.query(box)
+
+    def get_overlapping(self, box: BoundingBox) -> List[Collidable]:
+        """Collidables whose world boxes overlap the box (hash broadphase + vectorized test)."""
+        return self.aabb_store.query(box, self.collision_hash.query(box))
+
+    def move_player(self, direction: Vec3, delta_time: float) -> None:
+        """Move the player, blocked by collidable objects and farm tiles."""
+        if self.player:
+            nearby = self.get_collidables_near(self.player.get_swept_box(direction, delta_time))
+            destination_box = self.player.get_world_collision_box(self.player.get_destination(direction, delta_time))
+            blockers = self.aabb_store.query(destination_box, nearby)
+            self.player.move(direction, delta_time, blockers, self.farm_grid)
 
     def update(self, delta_time: float) -> None:
         """Update all objects."""
-        for obj in self.objects:
+        for obj in self.updatables:
             obj.update(delta_time)
+        if self.growth_tracker is not None:
+            self.growth_tracker.advance(delta_time)
+        self.farm_grid.update(delta_time)
         self.dialogue_box.update(delta_time)
+        self._flush_despawns()
+        self.time += delta_time
+
+    def fast_forward(self, seconds: float, progress: Optional[Callable[[float], None]] = None) -> None:
+        """
+        Advance game time by `seconds` in one jump, without drawing.
+
+        Growth is resolved in closed form: every timer jumps straight to
+        max(remaining - seconds, 0) instead of being stepped tick by tick, and
+        objects' update() gets the whole jump in a single call. Nothing moves.
+        progress(fraction) is called as farm chunks are processed, so the caller
+        can keep its window responsive and show how far along the jump is.
+        """
+        if seconds <= 0.0:
+            return
+        for obj in self.updatables:
+            obj.update(seconds)
+        if self.growth_tracker is not None:
+            self.growth_tracker.advance(seconds)
+        for done, total in self.farm_grid.iter_update(seconds):
+            if progress is not None:
+                progress(done / total)
+        self.dialogue_box.update(seconds)
+        self._flush_despawns()
+        self.time += seconds
+        if progress is not None:
+            progress(1.0)
 
     def draw(self, window_width: int, window_height: int) -> None:
         """Draw all objects."""
-        for obj in self.objects:
-            from OpenGL.GL import glPushMatrix, glPopMatrix, glTranslatef
-
-            glPushMatrix()
-            glTranslatef(*obj.position)
+        if self.headless:
+            raise RuntimeError("A headless GameWorld can't be drawn")
+        self.static_batcher.draw()
+        self.farm_grid.draw()
+
+        for obj in self.drawables:
+            gl.glPushMatrix()
+            gl.glTranslatef(*obj.position)
             obj.draw()
-            glPopMatrix()
+            gl.glPopMatrix()
 
         self.dialogue_box.draw(window_width, window_height)
 
+    def find_interactable(self) -> Optional[Interactable]:
+        """Find the nearest interactable object or farm tile within the player's reach."""
+        if not self.player:
+            return None
+
+        reach = self.player.interaction_range
+        nearest: Optional[Interactable] = None
+        nearest_sq = float("inf")
+
+        object_hit = self.interactable_index.nearest(self.player.position, reach)
+        if object_hit:
+            nearest, nearest_sq = object_hit  # type: ignore
+
+        tile_hit = self.farm_grid.nearest_tile(self.player.position, reach)
+        if tile_hit:
+            tile, tile_distance = tile_hit
+            if tile_distance * tile_distance < nearest_sq:
+                nearest = tile
+        return nearest
+
     def handle_player_interaction(self) -> None:
         """Handle player trying to interact with nearby objects."""
         if not self.player:
             return
 
-        interactable = self.player.find_interactable(self.objects)
+        interactable = self.find_interactable()
         if interactable:
             message = self.player.interact_with(interactable)
+            self._refresh_static(interactable)  # type: ignore
             self.dialogue_box.show_message(message)
 
+            # Picked-up items leave the world instead of lingering invisibly
+            if isinstance(interactable, Pickable) and interactable.picked_up:
+                self.despawn(interactable)  # type: ignore
+
     def draw_collisions(self):
-        for obj in self.objects:
-            if isinstance(obj, Collidable):
-                glPushMatrix()
-                glTranslatef(*obj.position)
-                glScalef(*obj.size)
+        if self.headless:
+            raise RuntimeError("A headless GameWorld can't be drawn")
+        for obj in self.collidables:
+            gl.glPushMatrix()
+            gl.glTranslatef(*obj.position)
+            gl.glScalef(*obj.size)
+
+            # Draw in different colors for different objects
+            if isinstance(obj, Player):
+                draw_collision_box(obj.get_collision_box(), (0.0, 1.0, 0.0, 0.5))  # Green for player
+            else:
+                draw_collision_box(obj.get_collision_box(), (1.0, 0.0, 0.0, 0.5))  # Red for others
 
-                # Draw in different colors for different objects
-                if isinstance(obj, Player):
-                    draw_collision_box(obj.get_collision_box(), (0.0, 1.0, 0.0, 0.5))  # Green for player
-                else:
-                    draw_collision_box(obj.get_collision_box(), (1.0, 0.0, 0.0, 0.5))  # Red for others
+            gl.glPopMatrix()
 
-                glPopMatrix()
+        for box in self.farm_grid.iter_collision_boxes():
+            draw_collision_box(box, (1.0, 0.0, 0.0, 0.5))
 
     # chest handling
     def open_chest(self, chest: Chest):
         """Open a chest inventory UI."""
         self.opened_chest = chest
         chest.is_open = True
+        self._refresh_static(chest)
 
     def close_chest(self):
         """Close the currently open chest."""
         if self.opened_chest:
             self.opened_chest.is_open = False
+            self._refresh_static(self.opened_chest)
             self.opened_chest = None
 
     def handle_inventory_click(self, mouse_x: int, mouse_y: int, window_width: int, window_height: int):
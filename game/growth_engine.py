@@ -0,0 +1,65 @@
+"""Batched crop-growth countdown for DirtBlock objects."""
+
+from typing import Dict, List, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from modules.dirt_block import DirtBlock
+
+
+class GrowthEngine:
+    """
+    Keeps every registered block's growth timer in one NumPy array.
+
+    A block gets a slot the first time it is planted and keeps it until it
+    is unregistered, so indices returned by advance() stay valid until the
+    next unregister() call.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.timers = np.zeros(capacity, dtype=np.float32)
+        self.blocks: List["DirtBlock"] = []  # slot -> block
+        self._slots: Dict["DirtBlock", int] = {}
+
+    def __contains__(self, block: "DirtBlock") -> bool:
+        return block in self._slots
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def set_remaining(self, block: "DirtBlock", seconds: float) -> None:
+        """Set a block's remaining growth time, giving it a slot if needed."""
+        slot = self._slots.get(block)
+        if slot is None:
+            slot = len(self.blocks)
+            if slot == len(self.timers):
+                self.timers = np.concatenate([self.timers, np.zeros(len(self.timers), dtype=np.float32)])
+            self.blocks.append(block)
+            self._slots[block] = slot
+        self.timers[slot] = seconds
+
+    def remaining(self, block: "DirtBlock") -> float:
+        """Remaining growth time of a registered block."""
+        return float(self.timers[self._slots[block]])
+
+    def unregister(self, block: "DirtBlock") -> None:
+        """Free a block's slot (swap-remove with the last slot)."""
+        slot = self._slots.pop(block, None)
+        if slot is None:
+            return
+        last = len(self.blocks) - 1
+        if slot != last:
+            moved = self.blocks[last]
+            self.blocks[slot] = moved
+            self.timers[slot] = self.timers[last]
+            self._slots[moved] = slot
+        self.blocks.pop()
+        self.timers[last] = 0.0
+
+    def advance(self, delta_time: float) -> np.ndarray:
+        """Count every timer down by delta_time; return slots of crops that just finished."""
+        active = self.timers[:len(self.blocks)]
+        growing = active > 0.0
+        np.subtract(active, delta_time, out=active, where=growing)
+        np.maximum(active, 0.0, out=active)
+        return np.flatnonzero(growing & (active <= 0.0))
@@ -0,0 +1,55 @@
+"""Event-driven crop growth: absolute ready times in a min-heap."""
+
+import heapq
+import itertools
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from modules.dirt_block import DirtBlock
+
+
+class GrowthScheduler:
+    """
+    Tracks when each planted block will be ready instead of counting it down.
+
+    Remaining growth is computed on demand from the ready time, so a tick
+    only touches the crops that finish during it. Replanting a block pushes
+    a new heap entry; the outdated one is skipped when it surfaces.
+    """
+
+    def __init__(self):
+        self.time = 0.0  # Scheduler clock in seconds
+        self._heap: List[Tuple[float, int, "DirtBlock"]] = []
+        self._ready_at: Dict["DirtBlock", float] = {}
+        self._counter = itertools.count()  # Tie-breaker so blocks are never compared
+
+    def __contains__(self, block: "DirtBlock") -> bool:
+        return block in self._ready_at
+
+    def __len__(self) -> int:
+        return len(self._ready_at)
+
+    def set_remaining(self, block: "DirtBlock", seconds: float) -> None:
+        """Schedule a block to be ready `seconds` from now."""
+        ready_at = self.time + max(seconds, 0.0)
+        self._ready_at[block] = ready_at
+        if seconds > 0.0:
+            heapq.heappush(self._heap, (ready_at, next(self._counter), block))
+
+    def remaining(self, block: "DirtBlock") -> float:
+        """Remaining growth time of a scheduled block."""
+        return max(self._ready_at[block] - self.time, 0.0)
+
+    def unregister(self, block: "DirtBlock") -> None:
+        """Forget a block; its pending heap entry becomes stale."""
+        self._ready_at.pop(block, None)
+
+    def advance(self, delta_time: float) -> List["DirtBlock"]:
+        """Move the clock forward; return blocks whose crops finished during this step."""
+        self.time += delta_time
+        due = []
+        while self._heap and self._heap[0][0] <= self.time:
+            ready_at, _, block = heapq.heappop(self._heap)
+            if self._ready_at.get(block) == ready_at:
+                due.append(block)
+        return due
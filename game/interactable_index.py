@@ -0,0 +1,52 @@
+"""Grid-bucket index for radius-limited nearest-interactable queries."""
+
+from typing import Optional, Tuple
+from modules.base_classes import BoundingBox, GameObject, Vec3
+from game.spatial_hash import SpatialHash
+
+
+def _point_box(position: Vec3, radius: float = 0.0) -> BoundingBox:
+    x, y, z = position
+    return BoundingBox(x - radius, x + radius, y - radius, y + radius, z - radius, z + radius)
+
+
+class InteractableIndex:
+    """Buckets Interactable objects by position so a query only visits nearby cells."""
+
+    def __init__(self, cell_size: float = 4.0):
+        self._hash: SpatialHash[GameObject] = SpatialHash(cell_size)
+
+    def __contains__(self, obj: GameObject) -> bool:
+        return obj in self._hash
+
+    def __len__(self) -> int:
+        return len(self._hash)
+
+    def add(self, obj: GameObject) -> None:
+        self._hash.insert(obj, _point_box(obj.position))
+
+    def update(self, obj: GameObject) -> None:
+        """Re-bucket an object after it moved."""
+        if obj in self._hash:
+            self._hash.update(obj, _point_box(obj.position))
+
+    def remove(self, obj: GameObject) -> None:
+        self._hash.remove(obj)
+
+    def nearest(self, position: Vec3, max_distance: float) -> Optional[Tuple[GameObject, float]]:
+        """
+        Closest object that is still interactable within max_distance.
+        Returns (object, squared distance) or None.
+        """
+        nearest = None
+        nearest_sq = max_distance * max_distance
+        px, py, pz = position
+        for obj in self._hash.query(_point_box(position, max_distance)):
+            ox, oy, oz = obj.position
+            distance_sq = (ox - px) ** 2 + (oy - py) ** 2 + (oz - pz) ** 2
+            if distance_sq <= nearest_sq and obj.is_interactable():  # type: ignore
+                nearest = obj
+                nearest_sq = distance_sq
+        if nearest is None:
+            return None
+        return nearest, nearest_sq
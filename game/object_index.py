@@ -0,0 +1,67 @@
+"""Unordered object collections with O(1) add/remove, safe to modify while iterating."""
+
+from typing import Dict, Generic, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+class ObjectIndex(Generic[T]):
+    """
+    A list of objects with swap-remove deletion.
+
+    Removing while the index is being iterated only marks the object; it is
+    skipped for the rest of the pass and actually removed once every active
+    iteration has finished. Iteration order is not stable across removals.
+    """
+
+    def __init__(self):
+        self._items: List[T] = []
+        self._slots: Dict[T, int] = {}
+        self._pending: Dict[T, None] = {}  # removals deferred until iteration ends
+        self._iterating = 0
+
+    def __contains__(self, obj: T) -> bool:
+        return obj in self._slots and obj not in self._pending
+
+    def __len__(self) -> int:
+        return len(self._items) - len(self._pending)
+
+    def __iter__(self) -> Iterator[T]:
+        self._iterating += 1
+        try:
+            i = 0
+            while i < len(self._items):
+                obj = self._items[i]
+                if obj not in self._pending:
+                    yield obj
+                i += 1
+        finally:
+            self._iterating -= 1
+            if self._iterating == 0 and self._pending:
+                for obj in list(self._pending):
+                    self._swap_remove(obj)
+                self._pending.clear()
+
+    def add(self, obj: T) -> None:
+        if obj in self._pending:
+            del self._pending[obj]  # re-added before the deferred removal ran
+            return
+        if obj in self._slots:
+            return
+        self._slots[obj] = len(self._items)
+        self._items.append(obj)
+
+    def remove(self, obj: T) -> None:
+        if obj not in self._slots:
+            return
+        if self._iterating:
+            self._pending[obj] = None
+        else:
+            self._swap_remove(obj)
+
+    def _swap_remove(self, obj: T) -> None:
+        slot = self._slots.pop(obj)
+        last = self._items.pop()
+        if last is not obj:
+            self._items[slot] = last
+            self._slots[last] = slot
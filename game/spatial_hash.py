@@ -0,0 +1,86 @@
+"""Uniform-grid spatial hash over the ground (x/z) plane."""
+
+import math
+from typing import Dict, Generic, List, Set, Tuple, TypeVar
+from modules.base_classes import BoundingBox
+
+T = TypeVar("T")
+CellRange = Tuple[int, int, int, int]  # min_ix, max_ix, min_iz, max_iz (inclusive)
+
+
+class SpatialHash(Generic[T]):
+    """
+    Buckets objects by the world-space cells their boxes cover.
+
+    Height is ignored: the world is flat, so cells are columns on the x/z
+    plane. Objects are re-bucketed only when their box crosses a cell border.
+    """
+
+    def __init__(self, cell_size: float = 4.0):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[T]] = {}
+        self._object_cells: Dict[T, CellRange] = {}
+
+    def __contains__(self, obj: T) -> bool:
+        return obj in self._object_cells
+
+    def __len__(self) -> int:
+        return len(self._object_cells)
+
+    def _cell_range(self, box: BoundingBox) -> CellRange:
+        cell = self.cell_size
+        return (
+            math.floor(box.min_x / cell), math.floor(box.max_x / cell),
+            math.floor(box.min_z / cell), math.floor(box.max_z / cell),
+        )
+
+    def _add_to_cells(self, obj: T, cells: CellRange) -> None:
+        for ix in range(cells[0], cells[1] + 1):
+            for iz in range(cells[2], cells[3] + 1):
+                self._cells.setdefault((ix, iz), set()).add(obj)
+
+    def _remove_from_cells(self, obj: T, cells: CellRange) -> None:
+        for ix in range(cells[0], cells[1] + 1):
+            for iz in range(cells[2], cells[3] + 1):
+                bucket = self._cells.get((ix, iz))
+                if bucket is not None:
+                    bucket.discard(obj)
+                    if not bucket:
+                        del self._cells[(ix, iz)]
+
+    def insert(self, obj: T, box: BoundingBox) -> None:
+        """Add an object (or re-bucket it if already present)."""
+        if obj in self._object_cells:
+            self.update(obj, box)
+            return
+        cells = self._cell_range(box)
+        self._object_cells[obj] = cells
+        self._add_to_cells(obj, cells)
+
+    def update(self, obj: T, box: BoundingBox) -> None:
+        """Re-bucket an object after it moved or changed size."""
+        old_cells = self._object_cells.get(obj)
+        cells = self._cell_range(box)
+        if old_cells == cells:
+            return
+        if old_cells is not None:
+            self._remove_from_cells(obj, old_cells)
+        self._object_cells[obj] = cells
+        self._add_to_cells(obj, cells)
+
+    def remove(self, obj: T) -> None:
+        """Drop an object from every cell it occupies."""
+        cells = self._object_cells.pop(obj, None)
+        if cells is not None:
+            self._remove_from_cells(obj, cells)
+
+    def query(self, box: BoundingBox) -> List[T]:
+        """Return every object sharing at least one cell with the box."""
+        min_ix, max_ix, min_iz, max_iz = self._cell_range(box)
+        found: Set[T] = set()
+        for ix in range(min_ix, max_ix + 1):
+            for iz in range(min_iz, max_iz + 1):
+                bucket = self._cells.get((ix, iz))
+                if bucket:
+                    found.update(bucket)
+        return list(found)
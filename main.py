@@ -1,13 +1,22 @@
 from game.game_world import GameWorld
-from modules import Table, Chest, Hoe, Crate, Player, Item, ItemType, DirtBlock, SellingPoint
+from game.fixed_timestep import FixedTimestep, PositionInterpolator
+from game.farm_save import load_farm, save_farm
+import os
+from modules import Table, Chest, Hoe, Crate, Player, Item, ItemType, SellingPoint
 import math
+from functools import partial
+import numpy as np
 import pygame
 from pygame.locals import DOUBLEBUF, OPENGL
-from OpenGL.GL import *
-from OpenGL.GLU import gluPerspective, gluLookAt, gluOrtho2D
+from render.backend import gl
 from utils.load_texture import pls_load_texture
-from utils.texture_cache import TextureCache
-from OpenGL.GL import glBegin, glEnd, glVertex3f, glColor3f, GL_QUADS, glTexCoord2f
+from utils.texture_atlas import TextureAtlas
+from ui.text_renderer import TextRenderer
+from ui.hud_compositor import HUDCompositor
+from render.frustum import CullStats, Frustum
+from render.ground import GroundRenderer
+from render.lod import LODSettings, ProxyMeshes
+from render.render_queue import RenderQueue
 
 
 camera_zoom_z = 10.0
@@ -16,43 +25,24 @@ MAX_ZOOM_Z = 20.0
 
 debug_mode = True
 
-
-def draw_ground():
-    """Draw ground plane with grass texture."""
-    glBindTexture(GL_TEXTURE_2D, grass_texture_id)
-    glColor3f(1.0, 1.0, 1.0)
-
-    size = 50.0
-    glBegin(GL_QUADS)
-
-    glTexCoord2f(0, 0)
-    glVertex3f(-size, -0.01, size)
-
-    glTexCoord2f(0, 5)
-    glVertex3f(-size, -0.01, -size)
-
-    glTexCoord2f(5, 5)
-    glVertex3f(size, -0.01, -size)
-
-    glTexCoord2f(5, 0)
-    glVertex3f(size, -0.01, size)
-
-    glEnd()
-    glBindTexture(GL_TEXTURE_2D, 0)
+TICK_RATE = 30.0  # simulation ticks per second, independent of the frame rate
+MAX_TICKS_PER_FRAME = 5  # catch-up cap after a slow frame
+FAST_FORWARD_SECONDS = 3600.0  # game time skipped by the T key
+SAVE_PATH = "farm_save.npz"  # farm tiles, saved on quit and caught up on the next start
 
 
 def draw_coins_ui(window_width: int, window_height: int, coins: float):
     """Draw coins display in top-right corner."""
-    glMatrixMode(GL_PROJECTION)
-    glPushMatrix()
-    glLoadIdentity()
-    gluOrtho2D(0, window_width, 0, window_height)
-    glMatrixMode(GL_MODELVIEW)
-    glPushMatrix()
-    glLoadIdentity()
-    glDisable(GL_DEPTH_TEST)
-    glEnable(GL_BLEND)
-    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    gl.glMatrixMode(gl.GL_PROJECTION)
+    gl.glPushMatrix()
+    gl.glLoadIdentity()
+    gl.gluOrtho2D(0, window_width, 0, window_height)
+    gl.glMatrixMode(gl.GL_MODELVIEW)
+    gl.glPushMatrix()
+    gl.glLoadIdentity()
+    gl.glDisable(gl.GL_DEPTH_TEST)
+    gl.glEnable(gl.GL_BLEND)
+    gl.glBlendFuncSeparate(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA, gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
 
     coin_size = 30
     padding = 10
@@ -60,57 +50,144 @@ def draw_coins_ui(window_width: int, window_height: int, coins: float):
     pos_y = window_height - coin_size - padding
 
     # Draw coin texture
-    coin_texture_id = TextureCache.get_texture("assets/coin.png")
-    if coin_texture_id:
-        glBindTexture(GL_TEXTURE_2D, coin_texture_id)
-        glColor3f(1.0, 1.0, 1.0)
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 0)
-        glVertex2f(pos_x, pos_y)
-        glTexCoord2f(1, 0)
-        glVertex2f(pos_x + coin_size, pos_y)
-        glTexCoord2f(1, 1)
-        glVertex2f(pos_x + coin_size, pos_y + coin_size)
-        glTexCoord2f(0, 1)
-        glVertex2f(pos_x, pos_y + coin_size)
-        glEnd()
-        glBindTexture(GL_TEXTURE_2D, 0)
+    coin_region = TextureAtlas.get_region("assets/coin.png")
+    if coin_region:
+        u0, v0, u1, v1 = coin_region.uv
+        gl.glBindTexture(gl.GL_TEXTURE_2D, coin_region.texture_id)
+        gl.glColor3f(1.0, 1.0, 1.0)
+        gl.glBegin(gl.GL_QUADS)
+        gl.glTexCoord2f(u0, v0)
+        gl.glVertex2f(pos_x, pos_y)
+        gl.glTexCoord2f(u1, v0)
+        gl.glVertex2f(pos_x + coin_size, pos_y)
+        gl.glTexCoord2f(u1, v1)
+        gl.glVertex2f(pos_x + coin_size, pos_y + coin_size)
+        gl.glTexCoord2f(u0, v1)
+        gl.glVertex2f(pos_x, pos_y + coin_size)
+        gl.glEnd()
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
 
     # Draw coin amount text
-    font = pygame.font.Font(None, 24)
-    text_surface = font.render(f"${coins:.1f}", True, (255, 255, 255))
-    text_data = pygame.image.tostring(text_surface, "RGBA", True)
-
-    text_id = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, text_id)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, text_surface.get_width(), text_surface.get_height(), 0, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
-
-    text_x = pos_x - text_surface.get_width() - 10
-    text_y = pos_y + (coin_size - text_surface.get_height()) / 2
-
-    glColor3f(1.0, 1.0, 1.0)
-    glBegin(GL_QUADS)
-    glTexCoord2f(0, 0)
-    glVertex2f(text_x, text_y)
-    glTexCoord2f(1, 0)
-    glVertex2f(text_x + text_surface.get_width(), text_y)
-    glTexCoord2f(1, 1)
-    glVertex2f(text_x + text_surface.get_width(), text_y + text_surface.get_height())
-    glTexCoord2f(0, 1)
-    glVertex2f(text_x, text_y + text_surface.get_height())
-    glEnd()
-
-    glDeleteTextures([text_id])
-    glBindTexture(GL_TEXTURE_2D, 0)
-
-    glDisable(GL_BLEND)
-    glEnable(GL_DEPTH_TEST)
-    glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
-    glPopMatrix()
-    glMatrixMode(GL_MODELVIEW)
+    text = f"${coins:.1f}"
+    text_width, text_height = TextRenderer.measure(text, 24)
+    text_x = pos_x - text_width - 10
+    text_y = pos_y + (coin_size - text_height) / 2
+    TextRenderer.draw_text(text, text_x, text_y, 24)
+
+    gl.glDisable(gl.GL_BLEND)
+    gl.glEnable(gl.GL_DEPTH_TEST)
+    gl.glPopMatrix()
+    gl.glMatrixMode(gl.GL_PROJECTION)
+    gl.glPopMatrix()
+    gl.glMatrixMode(gl.GL_MODELVIEW)
+
+
+def draw_progress_bar(window_width: int, window_height: int, fraction: float, label: str):
+    """Draw a centered progress bar with a label over a cleared screen."""
+    gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
+    gl.glMatrixMode(gl.GL_PROJECTION)
+    gl.glPushMatrix()
+    gl.glLoadIdentity()
+    gl.gluOrtho2D(0, window_width, 0, window_height)
+    gl.glMatrixMode(gl.GL_MODELVIEW)
+    gl.glPushMatrix()
+    gl.glLoadIdentity()
+    gl.glDisable(gl.GL_DEPTH_TEST)
+    gl.glEnable(gl.GL_BLEND)
+    gl.glBlendFuncSeparate(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA, gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
+
+    bar_width = window_width / 2
+    bar_height = 20
+    x0 = (window_width - bar_width) / 2
+    y0 = (window_height - bar_height) / 2
+    for color, width in (((0.2, 0.2, 0.2), bar_width), ((1.0, 0.85, 0.0), bar_width * fraction)):
+        gl.glColor3f(*color)
+        gl.glBegin(gl.GL_QUADS)
+        gl.glVertex2f(x0, y0)
+        gl.glVertex2f(x0 + width, y0)
+        gl.glVertex2f(x0 + width, y0 + bar_height)
+        gl.glVertex2f(x0, y0 + bar_height)
+        gl.glEnd()
+
+    text_width, _ = TextRenderer.measure(label, 24)
+    TextRenderer.draw_text(label, (window_width - text_width) / 2, y0 + bar_height + 10, 24)
+
+    gl.glDisable(gl.GL_BLEND)
+    gl.glEnable(gl.GL_DEPTH_TEST)
+    gl.glPopMatrix()
+    gl.glMatrixMode(gl.GL_PROJECTION)
+    gl.glPopMatrix()
+    gl.glMatrixMode(gl.GL_MODELVIEW)
+
+
+def fast_forward(world: GameWorld, seconds: float, display):
+    """Skip game time, showing progress and keeping the window responsive during long jumps."""
+    label = f"Fast-forwarding {seconds / 3600:g}h..."
+    last_shown = 0
+
+    def show_progress(fraction: float):
+        nonlocal last_shown
+        now = pygame.time.get_ticks()
+        if now - last_shown < 50 and fraction < 1.0:
+            return  # redraw at most every 50 ms
+        last_shown = now
+        pygame.event.pump()
+        draw_progress_bar(*display, fraction, label)
+        pygame.display.flip()
+
+    world.fast_forward(seconds, show_progress)
+    world.dialogue_box.show_message(f"Skipped ahead {seconds / 3600:g}h")
+
+
+def draw_player(player: Player, position):
+    """Draw the player model at `position` (its interpolated render position)."""
+    gl.glPushMatrix()
+    gl.glTranslatef(*position)
+    gl.glTranslatef(0, 1, 0)
+    gl.glScalef(0.2, 0.2, 0.2)
+    player.draw()
+    gl.glPopMatrix()
+
+
+def draw_object(obj, mesh=None):
+    """Draw a world object (or a simplified `mesh` of it) under its position/size transform."""
+    gl.glPushMatrix()
+    gl.glTranslatef(*obj.position)
+    gl.glScalef(*obj.size)
+    if mesh is not None:
+        mesh.draw()
+    else:
+        obj.draw()
+    gl.glPopMatrix()
+
+
+def hud_state(world: GameWorld) -> tuple:
+    """Everything the HUD widgets draw from; the HUD is re-rendered when this changes."""
+    return (
+        world.dialogue_box.state_key(),
+        world.player.hotbar.state_key(),
+        round(world.player.coins, 1),
+        world.player.inventory.state_key(),
+        world.opened_chest and world.opened_chest.inventory.state_key(),
+    )
+
+
+def draw_ui(world: GameWorld, display):
+    """Draw every HUD widget."""
+    world.dialogue_box.draw(*display)
+    world.player.hotbar.draw(*display)
+    draw_coins_ui(*display, world.player.coins)
+
+    # paleyr inventory
+    if world.player.inventory.is_open and not world.opened_chest:
+        world.player.inventory.draw(*display, "Inventory", 100)
+
+    # both inventories
+    if world.opened_chest:
+        world.opened_chest.inventory.draw(*display, "Chest", display[1] // 2)
+
+        if world.player:
+            world.player.inventory.draw(*display, "Inventory", 100)
 
 
 pygame.init()
@@ -132,17 +209,24 @@ pygame.display.set_mode(display, DOUBLEBUF | OPENGL)
 pygame.display.set_caption("3D Game with Interactions + Zoom")
 
 # OpenGL setup
-glMatrixMode(GL_PROJECTION)
-glLoadIdentity()
-gluPerspective(45, display[0] / display[1], 0.1, 50.0)
+gl.glMatrixMode(gl.GL_PROJECTION)
+gl.glLoadIdentity()
+gl.gluPerspective(45, display[0] / display[1], 0.1, 50.0)
 
-glMatrixMode(GL_MODELVIEW)
-glLoadIdentity()
-glEnable(GL_DEPTH_TEST)
-glEnable(GL_TEXTURE_2D)
+gl.glMatrixMode(gl.GL_MODELVIEW)
+gl.glLoadIdentity()
+gl.glEnable(gl.GL_DEPTH_TEST)
+gl.glEnable(gl.GL_TEXTURE_2D)
 
 # Load texture
 grass_texture_id = pls_load_texture("assets/grass_background.webp")
+ground = GroundRenderer(grass_texture_id)
+TextureAtlas.build()  # pack item/tile images into shared atlas pages
+
+hud = HUDCompositor(*display)
+cull_stats = CullStats()  # drawn/culled object counts for the last frame
+render_queue = RenderQueue()
+lod_settings = LODSettings()  # distances where distant geometry gets simplified
 
 world = GameWorld()
 
@@ -162,10 +246,10 @@ world.add_object(Crate(position=(3, 0, -3), size=(0.5, 0.5, 0.5)))
 world.add_object(Table(position=(8, 0, 0), size=(0.7, 0.7, 0.7)))
 world.add_object(Hoe(position=(8, 0.8, 0), size=(0.7, 0.7, 0.7)))
 
-# Add dirt blocks for farming
-world.add_object(DirtBlock(position=(-3, 0, 3), size=(1.0, 1.0, 1.0)))
-world.add_object(DirtBlock(position=(-2, 0, 3), size=(1.0, 1.0, 1.0)))
-world.add_object(DirtBlock(position=(-1, 0, 3), size=(1.0, 1.0, 1.0)))
+# Add dirt tiles for farming
+world.farm_grid.add_tile(-3, 3)
+world.farm_grid.add_tile(-2, 3)
+world.farm_grid.add_tile(-1, 3)
 
 # Add selling point
 world.add_object(SellingPoint(position=(0, 0, -5), size=(1.5, 1.5, 1.5)))
@@ -175,12 +259,19 @@ world.add_object(chest)
 chest.inventory.add_item(Item(ItemType.TOMATO_SEED, 5))
 chest.inventory.add_item(Item(ItemType.BURGER, 3))
 
+# Restore the saved farm; crops grow for the time the game was closed
+if os.path.exists(SAVE_PATH):
+    away = load_farm(world, SAVE_PATH)
+    world.dialogue_box.show_message(f"Welcome back! Your crops grew for {away / 3600:.1f}h")
+
 # main
 clock = pygame.time.Clock()
+timestep = FixedTimestep(TICK_RATE, MAX_TICKS_PER_FRAME)
+interpolator = PositionInterpolator()  # player position before the latest tick
 running = True
 
 while running:
-    delta_time = clock.tick(60) / 1000.0
+    frame_time = clock.tick(60) / 1000.0
 
     # --- SINGLE EVENT LOOP START ---
     for event in pygame.event.get():
@@ -202,7 +293,7 @@ while running:
             elif event.key == pygame.K_e:
                 # Check if clicking on chest
                 if world.player:
-                    interactable = world.player.find_interactable(world.objects)
+                    interactable = world.find_interactable()
                     if isinstance(interactable, Chest):
                         if world.opened_chest == interactable:
                             world.close_chest()
@@ -211,6 +302,10 @@ while running:
                     else:
                         world.handle_player_interaction()
 
+            elif event.key == pygame.K_t:
+                fast_forward(world, FAST_FORWARD_SECONDS, display)
+                clock.tick()  # don't count the jump as frame time
+
             elif event.key == pygame.K_TAB:
                 # Close chest if open, otherwise toggle inventory
                 if world.opened_chest:
@@ -267,65 +362,76 @@ while running:
         length = math.sqrt(direction[0] ** 2 + direction[1] ** 2 + direction[2] ** 2)
         direction = [d / length for d in direction]
 
-    player.move(tuple(direction), delta_time, world.get_collidables())
+    # Run the simulation in fixed ticks; input held this frame applies to each of them
+    for _ in range(timestep.advance(frame_time)):
+        interpolator.capture((player,))
+        world.move_player(tuple(direction), timestep.tick_time)
+        world.update(timestep.tick_time)
 
-    # Update world
-    world.update(delta_time)
+    # Draw the player (and camera) between the last two ticks
+    render_position = interpolator.position(player, timestep.alpha)
 
     # Camera to follow player
-    glMatrixMode(GL_MODELVIEW)
-    glLoadIdentity()
+    gl.glMatrixMode(gl.GL_MODELVIEW)
+    gl.glLoadIdentity()
     # fmt: off
-    gluLookAt(
-        player.position[0], player.position[1] + 8, player.position[2] + camera_zoom_z,
-        player.position[0], player.position[1] + 1, player.position[2],
+    gl.gluLookAt(
+        render_position[0], render_position[1] + 8, render_position[2] + camera_zoom_z,
+        render_position[0], render_position[1] + 1, render_position[2],
         0, 1, 0,
     )
     # fmt: on
 
-    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
 
-    draw_ground()
+    # World draws are queued and submitted sorted by texture/depth
+    camera_eye = (render_position[0], render_position[1] + 8, render_position[2] + camera_zoom_z)
+    render_queue.begin(camera_eye)
 
     # Draw player
-    glPushMatrix()
-    glTranslatef(*player.position)
-    glTranslatef(0, 1, 0)
-    glScalef(0.2, 0.2, 0.2)
-    player.draw()
-    glPopMatrix()
+    render_queue.submit(partial(draw_player, player, render_position), position=render_position)
+
+    # Everything below is culled against the camera frustum
+    frustum = Frustum.from_gl()
+    cull_stats.reset()
+
+    # Draw the ground chunks around the camera
+    ground.draw(camera_eye, frustum, render_queue)
+
+    # Draw static props in one call per material and map cell
+    world.static_batcher.draw(render_queue, frustum, camera_eye, lod_settings)
+
+    # Draw farm tiles, one mesh per atlas page per visible chunk (simplified when far away)
+    world.farm_grid.draw(frustum, cull_stats, render_queue, camera_eye, lod_settings)
 
     # Draw objects
-    for obj in world.objects:
-        if obj is not player:
-            glPushMatrix()
-            glTranslatef(*obj.position)
-            glScalef(*obj.size)
-            obj.draw()
-            glPopMatrix()
+    objects = [obj for obj in world.drawables if obj is not player]
+    if objects:
+        centers = np.array([obj.position for obj in objects], dtype=np.float64)
+        radii = [obj.cull_radius * max(obj.size) for obj in objects]
+        for obj, visible in zip(objects, frustum.spheres_visible(centers, radii)):
+            if not visible:
+                cull_stats.culled += 1
+                continue
+            cull_stats.drawn += 1
+            proxy = None
+            if math.dist(obj.position, camera_eye) >= lod_settings.simple_distance:
+                proxy = ProxyMeshes.get(obj)
+            render_queue.submit(partial(draw_object, obj, proxy), position=obj.position)
+
+    render_queue.flush()
 
     # Debug collisions
     if debug_mode:
         world.draw_collisions()
 
-    # UI
-    world.dialogue_box.draw(*display)
-    world.player.hotbar.draw(*display)
-    draw_coins_ui(*display, world.player.coins)
-
-    # paleyr inventory
-    if world.player.inventory.is_open and not world.opened_chest:
-        world.player.inventory.draw(*display, "Inventory", 100)
-
-    # both inventories
-    if world.opened_chest:
-        world.opened_chest.inventory.draw(*display, "Chest", display[1] // 2)
-
-        if world.player:
-            world.player.inventory.draw(*display, "Inventory", 100)
+    # UI, redrawn into the HUD texture only when its state changes
+    hud.draw(hud_state(world), lambda: draw_ui(world, display))
 
     pygame.display.flip()
 
+save_farm(world, SAVE_PATH)
+
 pygame.mixer.music.stop()
 pygame.mixer.quit()
 pygame.quit()
\ No newline at end of file
@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from .items import Item  
 
 
 if TYPE_CHECKING:
     from .player import Player
+    from render.mesh import MeshBuilder
+    from game.game_world import GameWorld
 
 Vec3 = Tuple[float, float, float]
 Vec2 = Tuple[float, float]
@@ -37,14 +39,53 @@ class BoundingBox:
             self.max_z + position[2],
         )
 
+    def union(self, other: "BoundingBox") -> "BoundingBox":
+        """Return the smallest box containing both boxes."""
+        return BoundingBox(
+            min(self.min_x, other.min_x),
+            max(self.max_x, other.max_x),
+            min(self.min_y, other.min_y),
+            max(self.max_y, other.max_y),
+            min(self.min_z, other.min_z),
+            max(self.max_z, other.max_z),
+        )
+
 
 class GameObject(ABC):
     """Base class for all game objects."""
 
+    # World this object was added to; told about position/size changes so it
+    # can keep its spatial indexes current
+    _world: Optional["GameWorld"] = None
+
+    # Radius around position, in local units (scaled by the largest size
+    # component), that contains everything draw() renders; used for culling
+    cull_radius: float = 2.5
+
     def __init__(self, position: Vec3 = (0.0, 0.0, 0.0), size: Vec3 = (1, 1, 1)):
         self.position: Vec3 = position
         self.size: Vec3 = size
 
+    @property
+    def position(self) -> Vec3:
+        return self._position
+
+    @position.setter
+    def position(self, value: Vec3) -> None:
+        self._position = value
+        if self._world is not None:
+            self._world.on_object_moved(self)
+
+    @property
+    def size(self) -> Vec3:
+        return self._size
+
+    @size.setter
+    def size(self, value: Vec3) -> None:
+        self._size = value
+        if self._world is not None:
+            self._world.on_object_moved(self)
+
     @abstractmethod
     def draw(self) -> None:
         """Render this object."""
@@ -63,8 +104,11 @@ class Collidable(GameObject):
         """Return the collision box in local coordinates."""
         pass
 
-    def get_world_collision_box(self) -> BoundingBox:
-        """Return the collision box in world coordinates with scaling applied."""
+    def get_world_collision_box(self, position: Optional[Vec3] = None) -> BoundingBox:
+        """
+        Return the collision box in world coordinates with scaling applied.
+        position: evaluate the box as if the object stood here instead
+        """
         local_box = self.get_collision_box()
         scaled_box = BoundingBox(
             local_box.min_x * self.size[0],
@@ -74,7 +118,7 @@ class Collidable(GameObject):
             local_box.min_z * self.size[2],
             local_box.max_z * self.size[2],
         )
-        return scaled_box.translate(self.position)
+        return scaled_box.translate(self.position if position is None else position)
 
     def collides_with(self, other: "Collidable") -> bool:
         """Check if this object collides with another collidable object."""
@@ -97,10 +141,33 @@ class Interactable(ABC):
         """Return the prompt text (e.g., 'Press E to interact')."""
         pass
 
+    def is_interactable(self) -> bool:
+        """Return False once the object can no longer be interacted with."""
+        return True
+
+
+class Batchable(ABC):
+    """Interface for props whose geometry can be baked into a static world batch."""
+
+    # Objects sharing a material are baked into the same world-space buffer
+    batch_material: str = "default"
+
+    @abstractmethod
+    def build_mesh(self, builder: "MeshBuilder") -> None:
+        """Emit this object's geometry in local (unscaled, untranslated) space."""
+        pass
+
+    def is_static(self) -> bool:
+        """Return True while the object looks the same every frame."""
+        return True
+
 
 class Pickable(ABC):
     """Interface for objects that can be picked up by the player."""
 
+    # Set once the item is in the player's inventory; GameWorld then despawns it
+    picked_up: bool = False
+
     @abstractmethod
     def get_item_type(self) -> "ItemType": # type: ignore
         """Return the item type when picked up."""
@@ -1,71 +1,54 @@
-from OpenGL.GL import *  
-from .base_classes import GameObject, Interactable, Collidable  
+from .base_classes import GameObject, Interactable, Collidable, Batchable  
 from .items import Item, ItemType  
 from ui.inventory import Inventory  
+from render.mesh import MeshBuilder
 from typing import TYPE_CHECKING  
   
 if TYPE_CHECKING:  
     from .player import Player  
   
-class Chest(Interactable, Collidable):  
+class Chest(Interactable, Collidable, Batchable):  
+    batch_material = "wood"
+
     def __init__(self, position=(0, 0, 0), size=(1.0, 1.0, 1.0)):  
         super().__init__(position, size)  
         self.inventory = Inventory(rows=3, cols=5)
         self.is_open = False  
       
-    def draw(self):  
-        # Draw chest box  
-        glColor3f(0.5, 0.3, 0.1)  # Brown wood color  
-        glBegin(GL_QUADS)  
-          
-        width, height, depth = 0.8, 0.8, 0.8  
-          
-        # Front face  
-        glVertex3f(-width, 0, -depth)  
-        glVertex3f(width, 0, -depth)  
-        glVertex3f(width, height, -depth)  
-        glVertex3f(-width, height, -depth)  
-          
-        # Back face  
-        glVertex3f(width, 0, depth)  
-        glVertex3f(-width, 0, depth)  
-        glVertex3f(-width, height, depth)  
-        glVertex3f(width, height, depth)  
-          
-        # Top face (lid)  
-        if self.is_open:  
-            # Open lid at 45 degrees  
-            glVertex3f(-width, height, -depth)  
-            glVertex3f(width, height, -depth)  
-            glVertex3f(width, height + width, 0)  
-            glVertex3f(-width, height + width, 0)  
-        else:  
-            # Closed lid  
-            glVertex3f(-width, height, -depth)  
-            glVertex3f(width, height, -depth)  
-            glVertex3f(width, height, depth)  
-            glVertex3f(-width, height, depth)  
-          
-        # Bottom face  
-        glVertex3f(-width, 0, depth)  
-        glVertex3f(width, 0, depth)  
-        glVertex3f(width, 0, -depth)  
-        glVertex3f(-width, 0, -depth)  
-          
-        # Left face  
-        glVertex3f(-width, 0, -depth)  
-        glVertex3f(-width, 0, depth)  
-        glVertex3f(-width, height, depth)  
-        glVertex3f(-width, height, -depth)  
-          
-        # Right face  
-        glVertex3f(width, 0, -depth)  
-        glVertex3f(width, 0, depth)  
-        glVertex3f(width, height, depth)  
-        glVertex3f(width, height, -depth)  
-          
-        glEnd()  
-      
+    def build_mesh(self, builder: MeshBuilder) -> None:
+        """Emit the chest box, with the lid raised when open."""
+        color = (0.5, 0.3, 0.1)  # Brown wood color
+        width, height, depth = 0.8, 0.8, 0.8
+
+        # Front face
+        builder.add_quad(((-width, 0, -depth), (width, 0, -depth), (width, height, -depth), (-width, height, -depth)), color)
+        # Back face
+        builder.add_quad(((width, 0, depth), (-width, 0, depth), (-width, height, depth), (width, height, depth)), color)
+
+        # Top face (lid)
+        if self.is_open:
+            # Open lid at 45 degrees
+            builder.add_quad(((-width, height, -depth), (width, height, -depth), (width, height + width, 0), (-width, height + width, 0)), color)
+        else:
+            # Closed lid
+            builder.add_quad(((-width, height, -depth), (width, height, -depth), (width, height, depth), (-width, height, depth)), color)
+
+        # Bottom face
+        builder.add_quad(((-width, 0, depth), (width, 0, depth), (width, 0, -depth), (-width, 0, -depth)), color)
+        # Left face
+        builder.add_quad(((-width, 0, -depth), (-width, 0, depth), (-width, height, depth), (-width, height, -depth)), color)
+        # Right face
+        builder.add_quad(((width, 0, -depth), (width, 0, depth), (width, height, depth), (width, height, -depth)), color)
+
+    def is_static(self) -> bool:
+        """Only a closed chest can live in the static batch."""
+        return not self.is_open
+
+    def draw(self):
+        builder = MeshBuilder()
+        self.build_mesh(builder)
+        builder.draw_immediate()
+
     def get_collision_box(self):  
         """Chest collision box."""  
         from .base_classes import BoundingBox  
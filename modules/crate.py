@@ -1,57 +1,29 @@
-from OpenGL.GL import *
-from OpenGL.GLU import *
 from typing import Optional, List
-from .base_classes import Vec3, Collidable, Interactable, BoundingBox
+from .base_classes import Vec3, Collidable, Interactable, Batchable, BoundingBox
 from .player import Player
-from OpenGL.GL import glBegin, glEnd, glVertex3f, glColor3f, GL_QUADS
+from render.mesh import MeshBuilder
 import math
 
 
-class Crate(Collidable, Interactable):
+class Crate(Collidable, Interactable, Batchable):
     """A crate that can be collided with and interacted with."""
 
+    batch_material = "wood"
+
     def __init__(self, position: Vec3 = (0.0, 0.0, 0.0), size=0.8):
         super().__init__(position, size)
         self.has_been_opened = False
 
-    def draw(self) -> None:
-        """Draw a simple crate."""
+    def build_mesh(self, builder: MeshBuilder) -> None:
+        """Emit the crate cube."""
         local_size = 1
+        builder.add_box(-local_size, local_size, 0, local_size * 2, -local_size, local_size, (0.6, 0.4, 0.2))  # Brown color
 
-        glColor3f(0.6, 0.4, 0.2)  # Brown color
-
-        glBegin(GL_QUADS)
-        # Front
-        glVertex3f(-local_size, 0, local_size)
-        glVertex3f(local_size, 0, local_size)
-        glVertex3f(local_size, local_size * 2, local_size)
-        glVertex3f(-local_size, local_size * 2, local_size)
-        # Back
-        glVertex3f(local_size, 0, -local_size)
-        glVertex3f(-local_size, 0, -local_size)
-        glVertex3f(-local_size, local_size * 2, -local_size)
-        glVertex3f(local_size, local_size * 2, -local_size)
-        # Left
-        glVertex3f(-local_size, 0, -local_size)
-        glVertex3f(-local_size, 0, local_size)
-        glVertex3f(-local_size, local_size * 2, local_size)
-        glVertex3f(-local_size, local_size * 2, -local_size)
-        # Right
-        glVertex3f(local_size, 0, local_size)
-        glVertex3f(local_size, 0, -local_size)
-        glVertex3f(local_size, local_size * 2, -local_size)
-        glVertex3f(local_size, local_size * 2, local_size)
-        # Top
-        glVertex3f(-local_size, local_size * 2, local_size)
-        glVertex3f(local_size, local_size * 2, local_size)
-        glVertex3f(local_size, local_size * 2, -local_size)
-        glVertex3f(-local_size, local_size * 2, -local_size)
-        # Bottom
-        glVertex3f(-local_size, 0, -local_size)
-        glVertex3f(local_size, 0, -local_size)
-        glVertex3f(local_size, 0, local_size)
-        glVertex3f(-local_size, 0, local_size)
-        glEnd()
+    def draw(self) -> None:
+        """Draw a simple crate."""
+        builder = MeshBuilder()
+        self.build_mesh(builder)
+        builder.draw_immediate()
 
     def get_collision_box(self) -> BoundingBox:
         """Crate collision box."""
@@ -1,10 +1,15 @@
 from enum import Enum
-from typing import Optional
-from OpenGL.GL import *
-from OpenGL.GLU import *
+from typing import Optional, Union, TYPE_CHECKING
+from render.backend import gl
 from modules.base_classes import Collidable, Interactable, BoundingBox, Vec3
 from modules.items import Item, ItemType
-from utils.texture_cache import TextureCache
+from utils.texture_atlas import TextureAtlas
+
+if TYPE_CHECKING:
+    from game.growth_engine import GrowthEngine
+    from game.growth_scheduler import GrowthScheduler
+
+    GrowthTracker = Union[GrowthEngine, GrowthScheduler]
 
 
 class BlockState(Enum):
@@ -14,20 +19,19 @@ class BlockState(Enum):
     PLANTED = "planted"  # Has crop growing, texture: crop texture on top
 
 
-class DirtBlock(Collidable, Interactable):
-    """A dirt block that can be tilled and farmed."""
+class FarmTileLogic(Interactable):
+    """
+    Till/plant/harvest rules shared by DirtBlock objects and FarmGrid tiles.
 
-    def __init__(self, position: Vec3 = (0.0, 0.0, 0.0), size: Vec3 = (1.0, 1.0, 1.0)):
-        super().__init__(position, size)
-        self.state = BlockState.DIRT
-        self.uses_remaining = 3  # Can be used 3 times before returning to dirt
-        self.planted_item_type: Optional[ItemType] = None  # What's planted on this block
-        self.growth_timer = 0.0  # Time until crop is ready to harvest
-        self.growth_duration = 5.0  # 5 seconds to grow
+    Subclasses provide state, uses_remaining, planted_item_type, growth_timer
+    and growth_duration, either as plain attributes or as properties.
+    """
 
-    def get_collision_box(self) -> BoundingBox:
-        """Return collision box for this block."""
-        return BoundingBox(-0.5, 0.5, -0.5, 0.5, -0.5, 0.5)
+    state: BlockState
+    uses_remaining: int
+    planted_item_type: Optional[ItemType]
+    growth_timer: float
+    growth_duration: float
 
     def on_interact(self, interactor) -> str:
         """Handle interaction based on block state and what player is holding."""
@@ -144,8 +148,47 @@ class DirtBlock(Collidable, Interactable):
             return "Press E to check growth"
         return "Press E to interact"
 
+
+class DirtBlock(Collidable, FarmTileLogic):
+    """A dirt block that can be tilled and farmed."""
+
+    def __init__(self, position: Vec3 = (0.0, 0.0, 0.0), size: Vec3 = (1.0, 1.0, 1.0)):
+        super().__init__(position, size)
+        self.state = BlockState.DIRT
+        self.uses_remaining = 3  # Can be used 3 times before returning to dirt
+        self.planted_item_type: Optional[ItemType] = None  # What's planted on this block
+        self.growth_tracker: Optional["GrowthTracker"] = None  # Shared timer storage, set by GameWorld
+        self.growth_timer = 0.0  # Time until crop is ready to harvest
+        self.growth_duration = 5.0  # 5 seconds to grow
+
+    @property
+    def growth_timer(self) -> float:
+        if self.growth_tracker is not None and self in self.growth_tracker:
+            return self.growth_tracker.remaining(self)
+        return self._growth_timer
+
+    @growth_timer.setter
+    def growth_timer(self, value: float) -> None:
+        if self.growth_tracker is not None and (value > 0.0 or self in self.growth_tracker):
+            self.growth_tracker.set_remaining(self, value)
+        self._growth_timer = value
+
+    def attach_growth_tracker(self, tracker: Optional["GrowthTracker"]) -> None:
+        """Move this block's timer into (or, with None, out of) a world-level tracker."""
+        remaining = self.growth_timer
+        if self.growth_tracker is not None:
+            self.growth_tracker.unregister(self)
+        self.growth_tracker = tracker
+        self.growth_timer = remaining
+
+    def get_collision_box(self) -> BoundingBox:
+        """Return collision box for this block."""
+        return BoundingBox(-0.5, 0.5, -0.5, 0.5, -0.5, 0.5)
+
     def update(self, delta_time: float) -> None:
         """Update block state (countdown growth timer)."""
+        if self.growth_tracker is not None:
+            return  # Advanced by the world's growth tracker
         if self.state == BlockState.PLANTED and self.growth_timer > 0.0:
             self.growth_timer -= delta_time
             if self.growth_timer < 0.0:
@@ -167,147 +210,108 @@ class DirtBlock(Collidable, Interactable):
         else:
             texture_path = "assets/dirt.png"
 
-        texture_id = TextureCache.get_texture(texture_path)
+        region = TextureAtlas.get_region(texture_path)
 
         # Draw cube with texture
         size_x = self.size[0] / 2
         size_y = self.size[1] / 2
         size_z = self.size[2] / 2
 
-        glColor3f(1.0, 1.0, 1.0)
+        gl.glColor3f(1.0, 1.0, 1.0)
 
-        if texture_id:
-            glBindTexture(GL_TEXTURE_2D, texture_id)
+        if region:
+            gl.glBindTexture(gl.GL_TEXTURE_2D, region.texture_id)
 
-            glBegin(GL_QUADS)
+            def corner(u: float, v: float, x: float, y: float, z: float) -> None:
+                gl.glTexCoord2f(*region.map_uv(u, v))
+                gl.glVertex3f(x, y, z)
+
+            gl.glBegin(gl.GL_QUADS)
 
             # Front face
-            glTexCoord2f(0, 0)
-            glVertex3f(-size_x, -size_y, size_z)
-            glTexCoord2f(1, 0)
-            glVertex3f(size_x, -size_y, size_z)
-            glTexCoord2f(1, 1)
-            glVertex3f(size_x, size_y, size_z)
-            glTexCoord2f(0, 1)
-            glVertex3f(-size_x, size_y, size_z)
+            corner(0, 0, -size_x, -size_y, size_z)
+            corner(1, 0, size_x, -size_y, size_z)
+            corner(1, 1, size_x, size_y, size_z)
+            corner(0, 1, -size_x, size_y, size_z)
 
             # Back face
-            glTexCoord2f(1, 0)
-            glVertex3f(-size_x, -size_y, -size_z)
-            glTexCoord2f(1, 1)
-            glVertex3f(-size_x, size_y, -size_z)
-            glTexCoord2f(0, 1)
-            glVertex3f(size_x, size_y, -size_z)
-            glTexCoord2f(0, 0)
-            glVertex3f(size_x, -size_y, -size_z)
-
-            # Top face (for planted state, use crop texture)
+            corner(1, 0, -size_x, -size_y, -size_z)
+            corner(1, 1, -size_x, size_y, -size_z)
+            corner(0, 1, size_x, size_y, -size_z)
+            corner(0, 0, size_x, -size_y, -size_z)
+
+            # Top face (the crop texture is drawn upright, farmland/dirt flipped)
             if self.state == BlockState.PLANTED and self.planted_item_type:
-                glEnd()
-                glBindTexture(GL_TEXTURE_2D, 0)
-                
-                # Draw crop texture on top
-                crop_texture_path = f"assets/{self.planted_item_type.value}.png"
-                crop_texture_id = TextureCache.get_texture(crop_texture_path)
-                if crop_texture_id:
-                    glBindTexture(GL_TEXTURE_2D, crop_texture_id)
-                
-                glBegin(GL_QUADS)
-                glTexCoord2f(0, 0)
-                glVertex3f(-size_x, size_y, -size_z)
-                glTexCoord2f(1, 0)
-                glVertex3f(size_x, size_y, -size_z)
-                glTexCoord2f(1, 1)
-                glVertex3f(size_x, size_y, size_z)
-                glTexCoord2f(0, 1)
-                glVertex3f(-size_x, size_y, size_z)
-                glEnd()
-                
-                glBindTexture(GL_TEXTURE_2D, 0)
-                glBegin(GL_QUADS)
+                corner(0, 0, -size_x, size_y, -size_z)
+                corner(1, 0, size_x, size_y, -size_z)
+                corner(1, 1, size_x, size_y, size_z)
+                corner(0, 1, -size_x, size_y, size_z)
             else:
-                # Regular farmland/dirt top
-                glTexCoord2f(0, 1)
-                glVertex3f(-size_x, size_y, -size_z)
-                glTexCoord2f(1, 1)
-                glVertex3f(size_x, size_y, -size_z)
-                glTexCoord2f(1, 0)
-                glVertex3f(size_x, size_y, size_z)
-                glTexCoord2f(0, 0)
-                glVertex3f(-size_x, size_y, size_z)
+                corner(0, 1, -size_x, size_y, -size_z)
+                corner(1, 1, size_x, size_y, -size_z)
+                corner(1, 0, size_x, size_y, size_z)
+                corner(0, 0, -size_x, size_y, size_z)
 
             # Bottom face
-            glTexCoord2f(1, 1)
-            glVertex3f(-size_x, -size_y, -size_z)
-            glTexCoord2f(0, 1)
-            glVertex3f(size_x, -size_y, -size_z)
-            glTexCoord2f(0, 0)
-            glVertex3f(size_x, -size_y, size_z)
-            glTexCoord2f(1, 0)
-            glVertex3f(-size_x, -size_y, size_z)
+            corner(1, 1, -size_x, -size_y, -size_z)
+            corner(0, 1, size_x, -size_y, -size_z)
+            corner(0, 0, size_x, -size_y, size_z)
+            corner(1, 0, -size_x, -size_y, size_z)
 
             # Left face
-            glTexCoord2f(1, 0)
-            glVertex3f(-size_x, -size_y, -size_z)
-            glTexCoord2f(1, 1)
-            glVertex3f(-size_x, size_y, -size_z)
-            glTexCoord2f(0, 1)
-            glVertex3f(-size_x, size_y, size_z)
-            glTexCoord2f(0, 0)
-            glVertex3f(-size_x, -size_y, size_z)
+            corner(1, 0, -size_x, -size_y, -size_z)
+            corner(1, 1, -size_x, size_y, -size_z)
+            corner(0, 1, -size_x, size_y, size_z)
+            corner(0, 0, -size_x, -size_y, size_z)
 
             # Right face
-            glTexCoord2f(0, 0)
-            glVertex3f(size_x, -size_y, -size_z)
-            glTexCoord2f(1, 0)
-            glVertex3f(size_x, -size_y, size_z)
-            glTexCoord2f(1, 1)
-            glVertex3f(size_x, size_y, size_z)
-            glTexCoord2f(0, 1)
-            glVertex3f(size_x, size_y, -size_z)
-
-            glEnd()
-            glBindTexture(GL_TEXTURE_2D, 0)
+            corner(0, 0, size_x, -size_y, -size_z)
+            corner(1, 0, size_x, -size_y, size_z)
+            corner(1, 1, size_x, size_y, size_z)
+            corner(0, 1, size_x, size_y, -size_z)
+
+            gl.glEnd()
+            gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
         else:
             # Fallback color rendering if texture not available
             color = (0.6, 0.4, 0.2) if self.state == BlockState.DIRT else (0.5, 0.3, 0.1)
-            glColor3f(*color)
-            glBegin(GL_QUADS)
+            gl.glColor3f(*color)
+            gl.glBegin(gl.GL_QUADS)
 
             # Front
-            glVertex3f(-size_x, -size_y, size_z)
-            glVertex3f(size_x, -size_y, size_z)
-            glVertex3f(size_x, size_y, size_z)
-            glVertex3f(-size_x, size_y, size_z)
+            gl.glVertex3f(-size_x, -size_y, size_z)
+            gl.glVertex3f(size_x, -size_y, size_z)
+            gl.glVertex3f(size_x, size_y, size_z)
+            gl.glVertex3f(-size_x, size_y, size_z)
 
             # Back
-            glVertex3f(-size_x, -size_y, -size_z)
-            glVertex3f(-size_x, size_y, -size_z)
-            glVertex3f(size_x, size_y, -size_z)
-            glVertex3f(size_x, -size_y, -size_z)
+            gl.glVertex3f(-size_x, -size_y, -size_z)
+            gl.glVertex3f(-size_x, size_y, -size_z)
+            gl.glVertex3f(size_x, size_y, -size_z)
+            gl.glVertex3f(size_x, -size_y, -size_z)
 
             # Top
-            glVertex3f(-size_x, size_y, -size_z)
-            glVertex3f(size_x, size_y, -size_z)
-            glVertex3f(size_x, size_y, size_z)
-            glVertex3f(-size_x, size_y, size_z)
+            gl.glVertex3f(-size_x, size_y, -size_z)
+            gl.glVertex3f(size_x, size_y, -size_z)
+            gl.glVertex3f(size_x, size_y, size_z)
+            gl.glVertex3f(-size_x, size_y, size_z)
 
             # Bottom
-            glVertex3f(-size_x, -size_y, -size_z)
-            glVertex3f(size_x, -size_y, -size_z)
-            glVertex3f(size_x, -size_y, size_z)
-            glVertex3f(-size_x, -size_y, size_z)
+            gl.glVertex3f(-size_x, -size_y, -size_z)
+            gl.glVertex3f(size_x, -size_y, -size_z)
+            gl.glVertex3f(size_x, -size_y, size_z)
+            gl.glVertex3f(-size_x, -size_y, size_z)
 
             # Left
-            glVertex3f(-size_x, -size_y, -size_z)
-            glVertex3f(-size_x, size_y, -size_z)
-            glVertex3f(-size_x, size_y, size_z)
-            glVertex3f(-size_x, -size_y, size_z)
+            gl.glVertex3f(-size_x, -size_y, -size_z)
+            gl.glVertex3f(-size_x, size_y, -size_z)
+            gl.glVertex3f(-size_x, size_y, size_z)
+            gl.glVertex3f(-size_x, -size_y, size_z)
 
             # Right
-            glVertex3f(size_x, -size_y, -size_z)
-            glVertex3f(size_x, -size_y, size_z)
-            glVertex3f(size_x, size_y, size_z)
-            glVertex3f(size_x, size_y, -size_z)
+            gl.glVertex3f(size_x, -size_y, -size_z)
+            gl.glVertex3f(size_x, -size_y, size_z)
+            gl.glVertex3f(size_x, size_y, size_z)
+            gl.glVertex3f(size_x, size_y, -size_z)
 
-            glEnd()
+            gl.glEnd()
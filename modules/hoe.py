@@ -1,77 +1,53 @@
-from OpenGL.GL import *
-from .base_classes import GameObject, Collidable, Interactable, Pickable
+from .base_classes import GameObject, Collidable, Interactable, Pickable, Batchable
 from typing import TYPE_CHECKING
 from .player import Player
 from .items import Item, ItemType
+from render.mesh import MeshBuilder
 
 
-class Hoe(GameObject, Interactable, Pickable):
+class Hoe(GameObject, Interactable, Pickable, Batchable):
+    batch_material = "tool"
+
     def __init__(self, position=(0, 0, 0), size=(1, 1, 1)):
         super().__init__(position, size)
         self.picked_up = False
 
-    def draw(self):
-        if self.picked_up:
-            return
-
-        # Brown wooden handle
-        glColor3f(0.55, 0.27, 0.07)  # Brown color
-        glBegin(GL_QUADS)
-        # Handle sides (simplified as a rectangular prism)
+    def build_mesh(self, builder: MeshBuilder) -> None:
+        # Brown wooden handle (simplified as a rectangular prism)
+        handle_color = (0.55, 0.27, 0.07)
         handle_length = 2.0
         handle_width = 0.1
         handle_height = 0.1
+        w, h, l = handle_width, handle_height, -handle_length
 
-        # Front face
-        glVertex3f(-handle_width, 0, 0)
-        glVertex3f(handle_width, 0, 0)
-        glVertex3f(handle_width, handle_height, 0)
-        glVertex3f(-handle_width, handle_height, 0)
-
-        # Back face
-        glVertex3f(handle_width, 0, -handle_length)
-        glVertex3f(-handle_width, 0, -handle_length)
-        glVertex3f(-handle_width, handle_height, -handle_length)
-        glVertex3f(handle_width, handle_height, -handle_length)
-
-        # Top face
-        glVertex3f(-handle_width, handle_height, 0)
-        glVertex3f(handle_width, handle_height, 0)
-        glVertex3f(handle_width, handle_height, -handle_length)
-        glVertex3f(-handle_width, handle_height, -handle_length)
-
-        # Bottom face
-        glVertex3f(-handle_width, 0, 0)
-        glVertex3f(handle_width, 0, 0)
-        glVertex3f(handle_width, 0, -handle_length)
-        glVertex3f(-handle_width, 0, -handle_length)
+        builder.add_quad(((-w, 0, 0), (w, 0, 0), (w, h, 0), (-w, h, 0)), handle_color)  # Front face
+        builder.add_quad(((w, 0, l), (-w, 0, l), (-w, h, l), (w, h, l)), handle_color)  # Back face
+        builder.add_quad(((-w, h, 0), (w, h, 0), (w, h, l), (-w, h, l)), handle_color)  # Top face
+        builder.add_quad(((-w, 0, 0), (w, 0, 0), (w, 0, l), (-w, 0, l)), handle_color)  # Bottom face
+        builder.add_quad(((-w, 0, 0), (-w, 0, l), (-w, h, l), (-w, h, 0)), handle_color)  # Left face
+        builder.add_quad(((w, 0, 0), (w, 0, l), (w, h, l), (w, h, 0)), handle_color)  # Right face
 
-        # Left face
-        glVertex3f(-handle_width, 0, 0)
-        glVertex3f(-handle_width, 0, -handle_length)
-        glVertex3f(-handle_width, handle_height, -handle_length)
-        glVertex3f(-handle_width, handle_height, 0)
-
-        # Right face
-        glVertex3f(handle_width, 0, 0)
-        glVertex3f(handle_width, 0, -handle_length)
-        glVertex3f(handle_width, handle_height, -handle_length)
-        glVertex3f(handle_width, handle_height, 0)
-        glEnd()
-
-        # Black metal blade
-        glColor3f(0.1, 0.1, 0.1)  # Dark gray/black
-        glBegin(GL_QUADS)
+        # Black metal blade (attached to end of handle)
         blade_width = 0.4
         blade_height = 0.05
         blade_length = 0.3
+        builder.add_quad((
+            (-blade_width, 0, -handle_length - blade_length),
+            (blade_width, 0, -handle_length - blade_length),
+            (blade_width, blade_height, -handle_length),
+            (-blade_width, blade_height, -handle_length),
+        ), (0.1, 0.1, 0.1))
+
+    def is_static(self) -> bool:
+        return not self.picked_up
+
+    def draw(self):
+        if self.picked_up:
+            return
 
-        # Blade (attached to end of handle)
-        glVertex3f(-blade_width, 0, -handle_length - blade_length)
-        glVertex3f(blade_width, 0, -handle_length - blade_length)
-        glVertex3f(blade_width, blade_height, -handle_length)
-        glVertex3f(-blade_width, blade_height, -handle_length)
-        glEnd()
+        builder = MeshBuilder()
+        self.build_mesh(builder)
+        builder.draw_immediate()
 
     def on_interact(self, interactor: "Player") -> str:
         return self.on_pickup(interactor)
@@ -79,6 +55,9 @@ class Hoe(GameObject, Interactable, Pickable):
     def get_interaction_prompt(self) -> str:
         return "Pick up hoe"
 
+    def is_interactable(self) -> bool:
+        return not self.picked_up
+
     def get_item_type(self) -> ItemType:
         return ItemType.HOE
 
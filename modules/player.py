@@ -1,17 +1,22 @@
-from OpenGL.GL import *
-from OpenGL.GLU import *
-from typing import Optional, List
+from render.backend import gl
+from typing import Optional, List, TYPE_CHECKING
 from .base_classes import Vec3, Collidable, Interactable, GameObject, BoundingBox
 import math
 from ui.inventory import Inventory  
 from ui.hotbar import Hotbar
 from modules.items import Item, ItemType  
+from render.mesh import Mesh, MeshBuilder
+
+if TYPE_CHECKING:
+    from game.farm_grid import FarmGrid
 
 
 
 class Player(Collidable):
     """Player character with movement and interaction capabilities."""
 
+    _mesh: Optional[Mesh] = None
+
     def __init__(self, position: Vec3 = (0.0, 0.0, 0.0)):
         super().__init__(position)
         self.velocity: Vec3 = (0.0, 0.0, 0.0)
@@ -22,260 +27,59 @@ class Player(Collidable):
         self.hotbar = Hotbar()
         self.coins: float = 0.0
 
-    def draw(self) -> None:
-        # Apply rotation before drawing
-        glRotatef(self.rotation_y, 0, 1, 0)  # Rotate around Y axis
-        
+    @staticmethod
+    def build_mesh() -> Mesh:
+        """Bake head, face, body, arms and legs into a single vertex buffer."""
+        builder = MeshBuilder()
+        skin = (1.0, 0.85, 0.7)
+        shirt = (0.2, 0.45, 0.85)  # Steve-ish blue
+        pants = (0.08, 0.2, 0.6)  # dark blue
+
         # --- Head (cube) ---
-        # head bounds
         hx0, hx1 = -1.0, 1.0
         hy0, hy1 = 0.0, 1.0
         hz0, hz1 = -1.0, 1.0
-
-        # skin color
-        glColor3f(1.0, 0.85, 0.7)
-        glBegin(GL_QUADS)
-        # front (z = hz1)
-        glVertex3f(hx0, hy0, hz1)
-        glVertex3f(hx1, hy0, hz1)
-        glVertex3f(hx1, hy1, hz1)
-        glVertex3f(hx0, hy1, hz1)
-        # back (z = hz0)
-        glVertex3f(hx1, hy0, hz0)
-        glVertex3f(hx0, hy0, hz0)
-        glVertex3f(hx0, hy1, hz0)
-        glVertex3f(hx1, hy1, hz0)
-        # left (x = hx0)
-        glVertex3f(hx0, hy0, hz0)
-        glVertex3f(hx0, hy0, hz1)
-        glVertex3f(hx0, hy1, hz1)
-        glVertex3f(hx0, hy1, hz0)
-        # right (x = hx1)
-        glVertex3f(hx1, hy0, hz1)
-        glVertex3f(hx1, hy0, hz0)
-        glVertex3f(hx1, hy1, hz0)
-        glVertex3f(hx1, hy1, hz1)
-        # top
-        glVertex3f(hx0, hy1, hz1)
-        glVertex3f(hx1, hy1, hz1)
-        glVertex3f(hx1, hy1, hz0)
-        glVertex3f(hx0, hy1, hz0)
-        # bottom (neck area)
-        glVertex3f(hx0, hy0, hz0)
-        glVertex3f(hx1, hy0, hz0)
-        glVertex3f(hx1, hy0, hz1)
-        glVertex3f(hx0, hy0, hz1)
-        glEnd()
+        builder.add_box(hx0, hx1, hy0, hy1, hz0, hz1, skin)
 
         # --- Eyes (on front face, slightly in front to avoid z-fighting) ---
-        # white eye plates
         eye_z = hz1 + 0.01
-        # left white
-        glColor3f(1, 1, 1)
-        glBegin(GL_QUADS)
-        glVertex3f(-0.5, 0.65, eye_z)
-        glVertex3f(-0.15, 0.65, eye_z)
-        glVertex3f(-0.15, 0.9, eye_z)
-        glVertex3f(-0.5, 0.9, eye_z)
-        glEnd()
-        # right white
-        glBegin(GL_QUADS)
-        glVertex3f(0.15, 0.65, eye_z)
-        glVertex3f(0.5, 0.65, eye_z)
-        glVertex3f(0.5, 0.9, eye_z)
-        glVertex3f(0.15, 0.9, eye_z)
-        glEnd()
+        builder.add_quad(((-0.5, 0.65, eye_z), (-0.15, 0.65, eye_z), (-0.15, 0.9, eye_z), (-0.5, 0.9, eye_z)), (1, 1, 1))
+        builder.add_quad(((0.15, 0.65, eye_z), (0.5, 0.65, eye_z), (0.5, 0.9, eye_z), (0.15, 0.9, eye_z)), (1, 1, 1))
 
         # black pupils (big & cute)
         pupil_z = hz1 + 0.02
-        glColor3f(0, 0, 0)
-        glBegin(GL_QUADS)
-        # left pupil
-        glVertex3f(-0.43, 0.69, pupil_z)
-        glVertex3f(-0.22, 0.69, pupil_z)
-        glVertex3f(-0.22, 0.86, pupil_z)
-        glVertex3f(-0.43, 0.86, pupil_z)
-        # right pupil
-        glVertex3f(0.22, 0.69, pupil_z)
-        glVertex3f(0.43, 0.69, pupil_z)
-        glVertex3f(0.43, 0.86, pupil_z)
-        glVertex3f(0.22, 0.86, pupil_z)
-        glEnd()
+        builder.add_quad(((-0.43, 0.69, pupil_z), (-0.22, 0.69, pupil_z), (-0.22, 0.86, pupil_z), (-0.43, 0.86, pupil_z)), (0, 0, 0))
+        builder.add_quad(((0.22, 0.69, pupil_z), (0.43, 0.69, pupil_z), (0.43, 0.86, pupil_z), (0.22, 0.86, pupil_z)), (0, 0, 0))
 
         # small mouth
         mouth_z = hz1 + 0.02
-        glColor3f(0.6, 0.15, 0.15)
-        glBegin(GL_QUADS)
-        glVertex3f(-0.25, 0.35, mouth_z)
-        glVertex3f(0.25, 0.35, mouth_z)
-        glVertex3f(0.25, 0.45, mouth_z)
-        glVertex3f(-0.25, 0.45, mouth_z)
-        glEnd()
+        builder.add_quad(((-0.25, 0.35, mouth_z), (0.25, 0.35, mouth_z), (0.25, 0.45, mouth_z), (-0.25, 0.45, mouth_z)), (0.6, 0.15, 0.15))
 
         # --- Body (shirt) ---
-        bx0, bx1 = -1.2, 1.2
-        by0, by1 = -1.5, 0.0
         bz0, bz1 = -0.6, 0.6
-        # shirt color (Steve-ish blue)
-        glColor3f(0.2, 0.45, 0.85)
-        glBegin(GL_QUADS)
-        # front
-        glVertex3f(bx0, by0, bz1)
-        glVertex3f(bx1, by0, bz1)
-        glVertex3f(bx1, by1, bz1)
-        glVertex3f(bx0, by1, bz1)
-        # back
-        glVertex3f(bx1, by0, bz0)
-        glVertex3f(bx0, by0, bz0)
-        glVertex3f(bx0, by1, bz0)
-        glVertex3f(bx1, by1, bz0)
-        # left
-        glVertex3f(bx0, by0, bz0)
-        glVertex3f(bx0, by0, bz1)
-        glVertex3f(bx0, by1, bz1)
-        glVertex3f(bx0, by1, bz0)
-        # right
-        glVertex3f(bx1, by0, bz1)
-        glVertex3f(bx1, by0, bz0)
-        glVertex3f(bx1, by1, bz0)
-        glVertex3f(bx1, by1, bz1)
-        # top (neck area)
-        glVertex3f(bx0, by1, bz1)
-        glVertex3f(bx1, by1, bz1)
-        glVertex3f(bx1, by1, bz0)
-        glVertex3f(bx0, by1, bz0)
-        # bottom
-        glVertex3f(bx0, by0, bz0)
-        glVertex3f(bx1, by0, bz0)
-        glVertex3f(bx1, by0, bz1)
-        glVertex3f(bx0, by0, bz1)
-        glEnd()
-
-        # --- Arms (sleeves) ---
-        ax_in, ax_out = -1.2, -1.6
-        # left arm
-        glColor3f(0.2, 0.45, 0.85)
-        glBegin(GL_QUADS)
-        # front
-        glVertex3f(ax_out, -0.5, bz1)
-        glVertex3f(ax_in, -0.5, bz1)
-        glVertex3f(ax_in, 0.2, bz1)
-        glVertex3f(ax_out, 0.2, bz1)
-        # back
-        glVertex3f(ax_in, -0.5, bz0)
-        glVertex3f(ax_out, -0.5, bz0)
-        glVertex3f(ax_out, 0.2, bz0)
-        glVertex3f(ax_in, 0.2, bz0)
-        # top
-        glVertex3f(ax_out, 0.2, bz1)
-        glVertex3f(ax_in, 0.2, bz1)
-        glVertex3f(ax_in, 0.2, bz0)
-        glVertex3f(ax_out, 0.2, bz0)
-        # bottom
-        glVertex3f(ax_out, -0.5, bz0)
-        glVertex3f(ax_in, -0.5, bz0)
-        glVertex3f(ax_in, -0.5, bz1)
-        glVertex3f(ax_out, -0.5, bz1)
-        glEnd()
-
-        # right arm (mirror)
-        ax_in_r, ax_out_r = 1.2, 1.6
-        glColor3f(0.2, 0.45, 0.85)
-        glBegin(GL_QUADS)
-        glVertex3f(ax_in_r, -0.5, bz1)
-        glVertex3f(ax_out_r, -0.5, bz1)
-        glVertex3f(ax_out_r, 0.2, bz1)
-        glVertex3f(ax_in_r, 0.2, bz1)
-
-        glVertex3f(ax_out_r, -0.5, bz0)
-        glVertex3f(ax_in_r, -0.5, bz0)
-        glVertex3f(ax_in_r, 0.2, bz0)
-        glVertex3f(ax_out_r, 0.2, bz0)
-
-        glVertex3f(ax_in_r, 0.2, bz1)
-        glVertex3f(ax_out_r, 0.2, bz1)
-        glVertex3f(ax_out_r, 0.2, bz0)
-        glVertex3f(ax_in_r, 0.2, bz0)
-
-        glVertex3f(ax_in_r, -0.5, bz0)
-        glVertex3f(ax_out_r, -0.5, bz0)
-        glVertex3f(ax_out_r, -0.5, bz1)
-        glVertex3f(ax_in_r, -0.5, bz1)
-        glEnd()
+        builder.add_box(-1.2, 1.2, -1.5, 0.0, bz0, bz1, shirt)
+
+        # --- Arms (sleeves, open on the sides) ---
+        arm_faces = ("front", "back", "top", "bottom")
+        builder.add_box(-1.6, -1.2, -0.5, 0.2, bz0, bz1, shirt, arm_faces)
+        builder.add_box(1.2, 1.6, -0.5, 0.2, bz0, bz1, shirt, arm_faces)
 
         # --- Legs (pants) ---
-        # left leg
-        lx0, lx1 = -0.6, -0.1
         ly0, ly1 = -3.0, -1.5
         lz0, lz1 = -0.5, 0.5
-        glColor3f(0.08, 0.2, 0.6)  # dark blue pants
-        glBegin(GL_QUADS)
-        # front
-        glVertex3f(lx0, ly0, lz1)
-        glVertex3f(lx1, ly0, lz1)
-        glVertex3f(lx1, ly1, lz1)
-        glVertex3f(lx0, ly1, lz1)
-        # back
-        glVertex3f(lx1, ly0, lz0)
-        glVertex3f(lx0, ly0, lz0)
-        glVertex3f(lx0, ly1, lz0)
-        glVertex3f(lx1, ly1, lz0)
-        # left
-        glVertex3f(lx0, ly0, lz0)
-        glVertex3f(lx0, ly0, lz1)
-        glVertex3f(lx0, ly1, lz1)
-        glVertex3f(lx0, ly1, lz0)
-        # right
-        glVertex3f(lx1, ly0, lz1)
-        glVertex3f(lx1, ly0, lz0)
-        glVertex3f(lx1, ly1, lz0)
-        glVertex3f(lx1, ly1, lz1)
-        # top
-        glVertex3f(lx0, ly1, lz1)
-        glVertex3f(lx1, ly1, lz1)
-        glVertex3f(lx1, ly1, lz0)
-        glVertex3f(lx0, ly1, lz0)
-        # bottom
-        glVertex3f(lx0, ly0, lz0)
-        glVertex3f(lx1, ly0, lz0)
-        glVertex3f(lx1, ly0, lz1)
-        glVertex3f(lx0, ly0, lz1)
-        glEnd()
-
-        # right leg
-        rx0, rx1 = 0.1, 0.6
-        glColor3f(0.08, 0.2, 0.6)
-        glBegin(GL_QUADS)
-        glVertex3f(rx0, ly0, lz1)
-        glVertex3f(rx1, ly0, lz1)
-        glVertex3f(rx1, ly1, lz1)
-        glVertex3f(rx0, ly1, lz1)
-
-        glVertex3f(rx1, ly0, lz0)
-        glVertex3f(rx0, ly0, lz0)
-        glVertex3f(rx0, ly1, lz0)
-        glVertex3f(rx1, ly1, lz0)
-
-        glVertex3f(rx0, ly0, lz0)
-        glVertex3f(rx0, ly0, lz1)
-        glVertex3f(rx0, ly1, lz1)
-        glVertex3f(rx0, ly1, lz0)
-
-        glVertex3f(rx1, ly0, lz1)
-        glVertex3f(rx1, ly0, lz0)
-        glVertex3f(rx1, ly1, lz0)
-        glVertex3f(rx1, ly1, lz1)
-
-        glVertex3f(rx0, ly1, lz1)
-        glVertex3f(rx1, ly1, lz1)
-        glVertex3f(rx1, ly1, lz0)
-        glVertex3f(rx0, ly1, lz0)
-
-        glVertex3f(rx0, ly0, lz0)
-        glVertex3f(rx1, ly0, lz0)
-        glVertex3f(rx1, ly0, lz1)
-        glVertex3f(rx0, ly0, lz1)
-        glEnd()
+        builder.add_box(-0.6, -0.1, ly0, ly1, lz0, lz1, pants)
+        builder.add_box(0.1, 0.6, ly0, ly1, lz0, lz1, pants)
+
+        return builder.build()
+
+    def draw(self) -> None:
+        # Mesh is shared by every player and baked the first time one is drawn
+        if Player._mesh is None:
+            Player._mesh = Player.build_mesh()
+
+        # Apply rotation before drawing
+        gl.glRotatef(self.rotation_y, 0, 1, 0)  # Rotate around Y axis
+        Player._mesh.draw()
 
     def get_collision_box(self) -> BoundingBox:
         """Player's collision box (approximate body bounds)."""
@@ -291,10 +95,34 @@ class Player(Collidable):
         return self.inventory.add_item(item)
 
 
-    def move(self, direction: Vec3, delta_time: float, collidables: List[Collidable]) -> None:
+    def get_move_delta(self, direction: Vec3, delta_time: float) -> Vec3:
+        """Displacement for moving in `direction` for delta_time seconds."""
+        return (
+            direction[0] * self.speed * delta_time,
+            direction[1] * self.speed * delta_time,
+            direction[2] * self.speed * delta_time,
+        )
+
+    def get_destination(self, direction: Vec3, delta_time: float) -> Vec3:
+        """Where this move would end up if nothing blocks it."""
+        move_delta = self.get_move_delta(direction, delta_time)
+        return (
+            self.position[0] + move_delta[0],
+            self.position[1] + move_delta[1],
+            self.position[2] + move_delta[2],
+        )
+
+    def get_swept_box(self, direction: Vec3, delta_time: float) -> BoundingBox:
+        """World-space box covering the player both now and after this move."""
+        destination = self.get_destination(direction, delta_time)
+        return self.get_world_collision_box().union(self.get_world_collision_box(destination))
+
+    def move(self, direction: Vec3, delta_time: float, collidables: List[Collidable], farm_grid: Optional["FarmGrid"] = None) -> None:
         """
         Move player in given direction, checking for collisions.
         direction: normalized direction vector (x, y, z)
+        collidables: objects that may block the move (all of them, or a broadphase subset)
+        farm_grid: optional grid whose tiles also block movement
         """
         if direction == (0, 0, 0):
             self.velocity = (0.0, 0.0, 0.0)
@@ -308,31 +136,25 @@ class Player(Collidable):
             self.rotation_y = angle
 
         # Calculate new position
-        move_delta = (
-            direction[0] * self.speed * delta_time,
-            direction[1] * self.speed * delta_time,
-            direction[2] * self.speed * delta_time,
-        )
-
-        new_position = (
-            self.position[0] + move_delta[0],
-            self.position[1] + move_delta[1],
-            self.position[2] + move_delta[2],
-        )
+        move_delta = self.get_move_delta(direction, delta_time)
+        new_position = self.get_destination(direction, delta_time)
 
-        old_position = self.position
-        self.position = new_position
+        # Test the destination box without moving there first
+        new_box = self.get_world_collision_box(new_position)
 
         collision_detected = False
         for obj in collidables:
-            if obj is not self and self.collides_with(obj):
+            if obj is not self and new_box.intersects(obj.get_world_collision_box()):
                 collision_detected = True
                 break
 
+        if not collision_detected and farm_grid is not None:
+            collision_detected = farm_grid.intersects(new_box)
+
         if collision_detected:
-            self.position = old_position
             self.velocity = (0.0, 0.0, 0.0)
         else:
+            self.position = new_position
             self.velocity = move_delta
 
     def is_moving(self) -> bool:
@@ -345,18 +167,19 @@ class Player(Collidable):
         Returns the object and its distance, or None if none found.
         """
         nearest: Optional[Interactable] = None
-        nearest_distance = float("inf")
+        nearest_distance_sq = float("inf")
+        range_sq = self.interaction_range * self.interaction_range
 
         for obj in objects:
-            if isinstance(obj, Interactable):
+            if isinstance(obj, Interactable) and obj.is_interactable():
                 dx = obj.position[0] - self.position[0]
                 dy = obj.position[1] - self.position[1]
                 dz = obj.position[2] - self.position[2]
-                distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+                distance_sq = dx * dx + dy * dy + dz * dz
 
-                if distance <= self.interaction_range and distance < nearest_distance:
+                if distance_sq <= range_sq and distance_sq < nearest_distance_sq:
                     nearest = obj
-                    nearest_distance = distance
+                    nearest_distance_sq = distance_sq
 
         return nearest
 
@@ -1,14 +1,14 @@
-from modules.base_classes import Collidable, Interactable, BoundingBox, Vec3
+from modules.base_classes import Collidable, Interactable, Batchable, BoundingBox, Vec3
 from modules.items import Item, ItemType
-from OpenGL.GL import *
-from OpenGL.GLU import *
-import pygame
+from render.mesh import MeshBuilder
 import os
 
 
-class SellingPoint(Collidable, Interactable):
+class SellingPoint(Collidable, Interactable, Batchable):
     """A selling point where the player can sell items."""
 
+    batch_material = "gold"
+
     def __init__(self, position: Vec3 = (0.0, 0.0, 0.0), size: Vec3 = (1.0, 1.0, 1.0)):
         super().__init__(position, size)
 
@@ -46,6 +46,9 @@ class SellingPoint(Collidable, Interactable):
     
     def _play_sell_sound(self) -> None:
         """Play the sell sound effect."""
+        if self._world is not None and self._world.headless:
+            return
+        import pygame
         sound_path = "./assets/sell.mp3"
         try:
             if os.path.exists(sound_path):
@@ -58,59 +61,32 @@ class SellingPoint(Collidable, Interactable):
         """Return interaction prompt text."""
         return "Press E to sell held item"
 
-    def draw(self) -> None:
-        """Draw the selling point as a pedestal."""
+    def build_mesh(self, builder: MeshBuilder) -> None:
+        """Emit the pedestal and its top accent."""
         size_x = self.size[0] / 2
         size_y = self.size[1] / 2
         size_z = self.size[2] / 2
 
         # Main pedestal - yellow/gold color
-        glColor3f(1.0, 0.85, 0.0)
-        glBegin(GL_QUADS)
-
-        # Front
-        glVertex3f(-size_x, -size_y, size_z)
-        glVertex3f(size_x, -size_y, size_z)
-        glVertex3f(size_x, size_y, size_z)
-        glVertex3f(-size_x, size_y, size_z)
-
-        # Back
-        glVertex3f(-size_x, -size_y, -size_z)
-        glVertex3f(-size_x, size_y, -size_z)
-        glVertex3f(size_x, size_y, -size_z)
-        glVertex3f(size_x, -size_y, -size_z)
-
-        # Top
-        glVertex3f(-size_x, size_y, -size_z)
-        glVertex3f(size_x, size_y, -size_z)
-        glVertex3f(size_x, size_y, size_z)
-        glVertex3f(-size_x, size_y, size_z)
-
-        # Bottom
-        glVertex3f(-size_x, -size_y, -size_z)
-        glVertex3f(size_x, -size_y, -size_z)
-        glVertex3f(size_x, -size_y, size_z)
-        glVertex3f(-size_x, -size_y, size_z)
-
-        # Left
-        glVertex3f(-size_x, -size_y, -size_z)
-        glVertex3f(-size_x, size_y, -size_z)
-        glVertex3f(-size_x, size_y, size_z)
-        glVertex3f(-size_x, -size_y, size_z)
-
-        # Right
-        glVertex3f(size_x, -size_y, -size_z)
-        glVertex3f(size_x, -size_y, size_z)
-        glVertex3f(size_x, size_y, size_z)
-        glVertex3f(size_x, size_y, -size_z)
-
-        glEnd()
+        gold = (1.0, 0.85, 0.0)
+        builder.add_quad(((-size_x, -size_y, size_z), (size_x, -size_y, size_z), (size_x, size_y, size_z), (-size_x, size_y, size_z)), gold)  # Front
+        builder.add_quad(((-size_x, -size_y, -size_z), (-size_x, size_y, -size_z), (size_x, size_y, -size_z), (size_x, -size_y, -size_z)), gold)  # Back
+        builder.add_quad(((-size_x, size_y, -size_z), (size_x, size_y, -size_z), (size_x, size_y, size_z), (-size_x, size_y, size_z)), gold)  # Top
+        builder.add_quad(((-size_x, -size_y, -size_z), (size_x, -size_y, -size_z), (size_x, -size_y, size_z), (-size_x, -size_y, size_z)), gold)  # Bottom
+        builder.add_quad(((-size_x, -size_y, -size_z), (-size_x, size_y, -size_z), (-size_x, size_y, size_z), (-size_x, -size_y, size_z)), gold)  # Left
+        builder.add_quad(((size_x, -size_y, -size_z), (size_x, -size_y, size_z), (size_x, size_y, size_z), (size_x, size_y, -size_z)), gold)  # Right
 
         # Top accent - brighter gold
-        glColor3f(1.0, 1.0, 0.2)
-        glBegin(GL_QUADS)
-        glVertex3f(-size_x * 0.8, size_y + 0.1, -size_z * 0.8)
-        glVertex3f(size_x * 0.8, size_y + 0.1, -size_z * 0.8)
-        glVertex3f(size_x * 0.8, size_y + 0.1, size_z * 0.8)
-        glVertex3f(-size_x * 0.8, size_y + 0.1, size_z * 0.8)
-        glEnd()
+        accent_y = size_y + 0.1
+        builder.add_quad((
+            (-size_x * 0.8, accent_y, -size_z * 0.8),
+            (size_x * 0.8, accent_y, -size_z * 0.8),
+            (size_x * 0.8, accent_y, size_z * 0.8),
+            (-size_x * 0.8, accent_y, size_z * 0.8),
+        ), (1.0, 1.0, 0.2))
+
+    def draw(self) -> None:
+        """Draw the selling point as a pedestal."""
+        builder = MeshBuilder()
+        self.build_mesh(builder)
+        builder.draw_immediate()
@@ -1,9 +1,11 @@
-from OpenGL.GL import *
 from .base_classes import GameObject
-from modules.base_classes import BoundingBox, Collidable
+from modules.base_classes import BoundingBox, Collidable, Batchable
+from render.mesh import MeshBuilder
 
 
-class Table(Collidable):
+class Table(Collidable, Batchable):
+    batch_material = "wood"
+
     def __init__(self, position=(0, 0, 0), size=(1, 1, 1)):
         super().__init__(position, size)
         self.top_width = 2.0
@@ -11,50 +13,28 @@ class Table(Collidable):
         self.top_height = 0.1
         self.table_height = 1.0
 
-    def draw(self):
-        # Table top
-        glColor3f(0.6, 0.4, 0.2)  # Wood color
-        glBegin(GL_QUADS)
+    def build_mesh(self, builder: MeshBuilder) -> None:
+        color = (0.6, 0.4, 0.2)  # Wood color
         top_width = self.top_width
         top_depth = self.top_depth
-        top_height = self.top_height
         table_height = self.table_height
 
         # Table top
-        glVertex3f(-top_width, table_height, -top_depth)
-        glVertex3f(top_width, table_height, -top_depth)
-        glVertex3f(top_width, table_height, top_depth)
-        glVertex3f(-top_width, table_height, top_depth)
-        glEnd()
+        builder.add_quad(((-top_width, table_height, -top_depth), (top_width, table_height, -top_depth), (top_width, table_height, top_depth), (-top_width, table_height, top_depth)), color)
 
         # Table legs (4 legs)
         leg_width = 0.1
-        glBegin(GL_QUADS)
-
-        # Front left leg
-        glVertex3f(-top_width + 0.1, 0, -top_depth + 0.1)
-        glVertex3f(-top_width + 0.1 + leg_width, 0, -top_depth + 0.1)
-        glVertex3f(-top_width + 0.1 + leg_width, table_height, -top_depth + 0.1)
-        glVertex3f(-top_width + 0.1, table_height, -top_depth + 0.1)
+        front_z = -top_depth + 0.1
+        back_z = top_depth - 0.1 - leg_width
+        left_x = -top_width + 0.1
+        right_x = top_width - 0.1 - leg_width
+        for x, z in ((left_x, front_z), (right_x, front_z), (left_x, back_z), (right_x, back_z)):
+            builder.add_quad(((x, 0, z), (x + leg_width, 0, z), (x + leg_width, table_height, z), (x, table_height, z)), color)
 
-        # Front right leg
-        glVertex3f(top_width - 0.1 - leg_width, 0, -top_depth + 0.1)
-        glVertex3f(top_width - 0.1, 0, -top_depth + 0.1)
-        glVertex3f(top_width - 0.1, table_height, -top_depth + 0.1)
-        glVertex3f(top_width - 0.1 - leg_width, table_height, -top_depth + 0.1)
-
-        # Back left leg
-        glVertex3f(-top_width + 0.1, 0, top_depth - 0.1 - leg_width)
-        glVertex3f(-top_width + 0.1 + leg_width, 0, top_depth - 0.1 - leg_width)
-        glVertex3f(-top_width + 0.1 + leg_width, table_height, top_depth - 0.1 - leg_width)
-        glVertex3f(-top_width + 0.1, table_height, top_depth - 0.1 - leg_width)
-
-        # Back right leg
-        glVertex3f(top_width - 0.1 - leg_width, 0, top_depth - 0.1 - leg_width)
-        glVertex3f(top_width - 0.1, 0, top_depth - 0.1 - leg_width)
-        glVertex3f(top_width - 0.1, table_height, top_depth - 0.1 - leg_width)
-        glVertex3f(top_width - 0.1 - leg_width, table_height, top_depth - 0.1 - leg_width)
-        glEnd()
+    def draw(self):
+        builder = MeshBuilder()
+        self.build_mesh(builder)
+        builder.draw_immediate()
 
     def get_collision_box(self) -> BoundingBox:
         # fmt: off
@@ -0,0 +1,314 @@
+"""
+Render backends: every GL/GLU call in the game goes through the `gl` proxy.
+
+    from render.backend import gl
+    gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
+
+By default the proxy forwards to PyOpenGL (GLBackend). A RecordingBackend
+can be swapped in with use_backend() to run the same draw code without a GL
+context and count what a frame would have sent to the GPU:
+
+    recorder = RecordingBackend()
+    use_backend(recorder)
+    ...draw a frame...
+    print(recorder.end_frame())
+"""
+
+import itertools
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+
+class GLBackend:
+    """Forwards every gl*/glu*/GL_* name to PyOpenGL (imported on first use)."""
+
+    def __init__(self):
+        from OpenGL import GL, GLU
+        from OpenGL.GL import shaders
+        self._modules = (GL, GLU)
+        self._shaders = shaders
+
+    def __getattr__(self, name: str) -> Any:
+        for module in self._modules:
+            if hasattr(module, name):
+                return getattr(module, name)
+        raise AttributeError(name)
+
+    def compile_program(self, vertex_source: str, fragment_source: str) -> int:
+        """Compile and link a vertex + fragment shader program."""
+        return self._shaders.compileProgram(
+            self._shaders.compileShader(vertex_source, self.GL_VERTEX_SHADER),
+            self._shaders.compileShader(fragment_source, self.GL_FRAGMENT_SHADER),
+        )
+
+
+@dataclass
+class FrameStats:
+    """What one frame sent to the GPU, as counted by a RecordingBackend."""
+
+    draw_calls: int = 0
+    vertices: int = 0
+    texture_binds: int = 0
+    uploads: int = 0
+    upload_bytes: int = 0
+    state_changes: int = 0
+
+
+# Calls counted as render-state changes by RecordingBackend
+_STATE_CALLS = {
+    "glEnable", "glDisable", "glBlendFunc", "glBlendFuncSeparate", "glUseProgram", "glBindFramebuffer",
+    "glColorMask", "glAlphaFunc", "glDepthFunc", "glLineWidth", "glViewport",
+}
+
+
+def _load_constants() -> Dict[str, int]:
+    """PyOpenGL's GL_* values if it can be imported here, else none (synthesized on lookup)."""
+    try:
+        from OpenGL import GL
+    except Exception:
+        return {}
+    return {name: int(getattr(GL, name)) for name in dir(GL) if name.startswith("GL_") and isinstance(getattr(GL, name), int)}
+
+
+class RecordingBackend:
+    """
+    Counts draw calls, vertices, texture binds, uploads and state changes
+    without touching a GPU.
+
+    The matrix stacks, viewport and clear color are tracked so queries like
+    glGetFloatv(GL_MODELVIEW_MATRIX) (used for frustum culling) return what a
+    real context would; object creation returns fresh ids and everything else
+    is a no-op.
+    """
+
+    def __init__(self):
+        self.stats = FrameStats()
+        self.frames: List[FrameStats] = []  # finished frames, oldest first
+        self._constants = _load_constants()
+        self._synthetic_constants = itertools.count(0x10000)
+        self._ids = itertools.count(1)
+        self._in_begin = False
+        self._begin_vertices = 0
+        self._matrix_mode = self.GL_MODELVIEW
+        self._stacks = {self.GL_MODELVIEW: [np.identity(4)], self.GL_PROJECTION: [np.identity(4)],
+                        self.GL_TEXTURE: [np.identity(4)]}
+        self._viewport = np.zeros(4, dtype=np.int32)
+        self._clear_color = np.zeros(4, dtype=np.float32)
+
+    def end_frame(self) -> FrameStats:
+        """Finish the current frame and return its stats."""
+        stats, self.stats = self.stats, FrameStats()
+        self.frames.append(stats)
+        return stats
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("GL_"):
+            if name not in self._constants:
+                self._constants[name] = next(self._synthetic_constants)
+            return self._constants[name]
+        if name.startswith("gl"):
+            if name in _STATE_CALLS:
+                return self._state_change
+            if name.startswith("glVertex") and name[8:9].isdigit():  # glVertex2f, glVertex3f, ...
+                return self._vertex
+            if name.startswith(("glGen", "glCreate")) and not name.startswith("glGenerate"):
+                return self._generate
+            return self._no_op
+        raise AttributeError(name)
+
+    # --- Counted calls ---
+    def _no_op(self, *args, **kwargs) -> None:
+        return None
+
+    def _state_change(self, *args) -> None:
+        self.stats.state_changes += 1
+
+    def _generate(self, count: int = 1, *args) -> Any:
+        ids = [next(self._ids) for _ in range(count)]
+        return ids[0] if count == 1 else ids
+
+    def _vertex(self, *args) -> None:
+        if self._in_begin:
+            self._begin_vertices += 1
+
+    def glBegin(self, mode: int) -> None:
+        self._in_begin = True
+        self._begin_vertices = 0
+
+    def glEnd(self) -> None:
+        self._in_begin = False
+        self.stats.draw_calls += 1
+        self.stats.vertices += self._begin_vertices
+
+    def glDrawArrays(self, mode: int, first: int, count: int) -> None:
+        self.stats.draw_calls += 1
+        self.stats.vertices += count
+
+    def glDrawArraysInstanced(self, mode: int, first: int, count: int, instance_count: int) -> None:
+        self.stats.draw_calls += 1
+        self.stats.vertices += count * instance_count
+
+    def glBindTexture(self, target: int, texture: int) -> None:
+        self.stats.texture_binds += 1
+
+    def glTexImage2D(self, target, level, internal_format, width, height, border, data_format, data_type, data) -> None:
+        self._upload(width * height * 4)
+
+    def glTexSubImage2D(self, target, level, x, y, width, height, data_format, data_type, data) -> None:
+        self._upload(width * height * 4)
+
+    def glBufferData(self, target: int, size: int, data: Any, usage: int) -> None:
+        self._upload(size)
+
+    def _upload(self, size: int) -> None:
+        self.stats.uploads += 1
+        self.stats.upload_bytes += int(size)
+
+    def glViewport(self, x: int, y: int, width: int, height: int) -> None:
+        self._viewport[:] = (x, y, width, height)
+        self.stats.state_changes += 1
+
+    def glClearColor(self, r: float, g: float, b: float, a: float) -> None:
+        self._clear_color[:] = (r, g, b, a)
+
+    def glCheckFramebufferStatus(self, target: int) -> int:
+        return self.GL_FRAMEBUFFER_COMPLETE
+
+    def compile_program(self, vertex_source: str, fragment_source: str) -> int:
+        return next(self._ids)
+
+    def glGetAttribLocation(self, program: int, name: str) -> int:
+        return next(self._ids) % 16
+
+    def glGetUniformLocation(self, program: int, name: str) -> int:
+        return next(self._ids)
+
+    # --- Matrices and queries ---
+    def _multiply(self, matrix: np.ndarray) -> None:
+        stack = self._stacks[self._matrix_mode]
+        stack[-1] = stack[-1] @ matrix
+
+    def glMatrixMode(self, mode: int) -> None:
+        self._matrix_mode = mode
+
+    def glLoadIdentity(self) -> None:
+        self._stacks[self._matrix_mode][-1] = np.identity(4)
+
+    def glPushMatrix(self) -> None:
+        stack = self._stacks[self._matrix_mode]
+        stack.append(stack[-1].copy())
+
+    def glPopMatrix(self) -> None:
+        self._stacks[self._matrix_mode].pop()
+
+    def glTranslatef(self, x: float, y: float, z: float) -> None:
+        matrix = np.identity(4)
+        matrix[:3, 3] = (x, y, z)
+        self._multiply(matrix)
+
+    def glScalef(self, x: float, y: float, z: float) -> None:
+        self._multiply(np.diag((x, y, z, 1.0)))
+
+    def glRotatef(self, angle: float, x: float, y: float, z: float) -> None:
+        axis = np.array((x, y, z), dtype=np.float64)
+        x, y, z = axis / np.linalg.norm(axis)
+        c, s = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+        matrix = np.identity(4)
+        matrix[:3, :3] = (
+            (x * x * (1 - c) + c, x * y * (1 - c) - z * s, x * z * (1 - c) + y * s),
+            (y * x * (1 - c) + z * s, y * y * (1 - c) + c, y * z * (1 - c) - x * s),
+            (x * z * (1 - c) - y * s, y * z * (1 - c) + x * s, z * z * (1 - c) + c),
+        )
+        self._multiply(matrix)
+
+    def glOrtho(self, left: float, right: float, bottom: float, top: float, near: float, far: float) -> None:
+        matrix = np.identity(4)
+        matrix[0, 0] = 2 / (right - left)
+        matrix[1, 1] = 2 / (top - bottom)
+        matrix[2, 2] = -2 / (far - near)
+        matrix[:3, 3] = (-(right + left) / (right - left), -(top + bottom) / (top - bottom), -(far + near) / (far - near))
+        self._multiply(matrix)
+
+    def gluOrtho2D(self, left: float, right: float, bottom: float, top: float) -> None:
+        self.glOrtho(left, right, bottom, top, -1.0, 1.0)
+
+    def gluPerspective(self, fovy: float, aspect: float, near: float, far: float) -> None:
+        f = 1 / math.tan(math.radians(fovy) / 2)
+        matrix = np.zeros((4, 4))
+        matrix[0, 0] = f / aspect
+        matrix[1, 1] = f
+        matrix[2, 2] = (far + near) / (near - far)
+        matrix[2, 3] = 2 * far * near / (near - far)
+        matrix[3, 2] = -1.0
+        self._multiply(matrix)
+
+    def gluLookAt(self, eye_x, eye_y, eye_z, center_x, center_y, center_z, up_x, up_y, up_z) -> None:
+        eye = np.array((eye_x, eye_y, eye_z), dtype=np.float64)
+        forward = np.array((center_x, center_y, center_z), dtype=np.float64) - eye
+        forward /= np.linalg.norm(forward)
+        side = np.cross(forward, (up_x, up_y, up_z))
+        side /= np.linalg.norm(side)
+        up = np.cross(side, forward)
+        matrix = np.identity(4)
+        matrix[0, :3], matrix[1, :3], matrix[2, :3] = side, up, -forward
+        self._multiply(matrix)
+        self.glTranslatef(*-eye)
+
+    def glGetFloatv(self, name: int) -> np.ndarray:
+        """Column-major matrices like PyOpenGL, plus the clear color."""
+        matrices = {self.GL_MODELVIEW_MATRIX: self.GL_MODELVIEW, self.GL_PROJECTION_MATRIX: self.GL_PROJECTION,
+                    self.GL_TEXTURE_MATRIX: self.GL_TEXTURE}
+        if name in matrices:
+            return self._stacks[matrices[name]][-1].T.astype(np.float32)
+        if name == self.GL_COLOR_CLEAR_VALUE:
+            return self._clear_color.copy()
+        return np.zeros(16, dtype=np.float32)
+
+    def glGetIntegerv(self, name: int) -> np.ndarray:
+        if name == self.GL_VIEWPORT:
+            return self._viewport.copy()
+        return np.zeros(4, dtype=np.int32)
+
+
+class GLProxy:
+    """
+    Stand-in for the OpenGL namespace that forwards to the active backend.
+
+    Looked-up names are cached on the proxy, so after the first call a
+    gl.glVertex3f lookup costs the same as any attribute access; switching
+    backends drops the cache.
+    """
+
+    def __init__(self):
+        self._backend: Optional[Any] = None
+
+    @property
+    def backend(self) -> Any:
+        if self._backend is None:
+            self._backend = GLBackend()
+        return self._backend
+
+    def use(self, backend: Any) -> None:
+        self.__dict__.clear()
+        self._backend = backend
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = getattr(self.backend, name)
+        setattr(self, name, value)
+        return value
+
+
+gl = GLProxy()
+
+
+def use_backend(backend: Any) -> None:
+    """Route every following gl.* call to `backend` (a GLBackend or RecordingBackend)."""
+    gl.use(backend)
+
+
+def current_backend() -> Any:
+    return gl.backend
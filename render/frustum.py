@@ -0,0 +1,64 @@
+"""View-frustum culling against the current camera."""
+
+from dataclasses import dataclass
+from typing import Sequence
+import numpy as np
+from render.backend import gl
+from modules.base_classes import BoundingBox, Vec3
+
+
+@dataclass
+class CullStats:
+    """Objects drawn vs. skipped by frustum culling in the current frame."""
+
+    drawn: int = 0
+    culled: int = 0
+
+    def reset(self) -> None:
+        self.drawn = 0
+        self.culled = 0
+
+
+class Frustum:
+    """The six clip planes of a projection * modelview matrix, as (a, b, c, d) rows facing inward."""
+
+    def __init__(self, planes: np.ndarray):
+        self.planes = planes
+        self.normals = planes[:, :3]
+        self.offsets = planes[:, 3]
+
+    @classmethod
+    def from_matrices(cls, projection: np.ndarray, modelview: np.ndarray) -> "Frustum":
+        """Build from column-major 4x4 matrices, as returned by glGetFloatv."""
+        clip = np.asarray(projection, dtype=np.float64).reshape(4, 4).T @ np.asarray(modelview, dtype=np.float64).reshape(4, 4).T
+        planes = np.array([
+            clip[3] + clip[0],  # left
+            clip[3] - clip[0],  # right
+            clip[3] + clip[1],  # bottom
+            clip[3] - clip[1],  # top
+            clip[3] + clip[2],  # near
+            clip[3] - clip[2],  # far
+        ])
+        planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+        return cls(planes)
+
+    @classmethod
+    def from_gl(cls) -> "Frustum":
+        """Build from the GL projection and modelview matrices currently loaded."""
+        return cls.from_matrices(gl.glGetFloatv(gl.GL_PROJECTION_MATRIX), gl.glGetFloatv(gl.GL_MODELVIEW_MATRIX))
+
+    def sphere_visible(self, center: Vec3, radius: float) -> bool:
+        """True if any part of the sphere may be inside the frustum."""
+        return bool(np.all(self.normals @ np.asarray(center, dtype=np.float64) + self.offsets >= -radius))
+
+    def spheres_visible(self, centers: np.ndarray, radii: Sequence[float]) -> np.ndarray:
+        """Vectorized sphere_visible for (N, 3) centers; returns an (N,) bool mask."""
+        distances = np.asarray(centers, dtype=np.float64) @ self.normals.T + self.offsets  # (N, 6)
+        return np.all(distances >= -np.asarray(radii, dtype=np.float64)[:, None], axis=1)
+
+    def box_visible(self, box: BoundingBox) -> bool:
+        """True if any part of the box may be inside the frustum (tests the corner furthest along each plane normal)."""
+        lo = np.array((box.min_x, box.min_y, box.min_z))
+        hi = np.array((box.max_x, box.max_y, box.max_z))
+        corners = np.where(self.normals >= 0, hi, lo)  # (6, 3)
+        return bool(np.all(np.einsum("ij,ij->i", corners, self.normals) + self.offsets >= 0))
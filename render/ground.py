@@ -0,0 +1,81 @@
+"""Endless ground plane drawn as camera-relative, frustum-culled chunks."""
+
+import math
+from functools import partial
+from typing import Iterator, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+from render.backend import gl
+from modules.base_classes import BoundingBox, Vec3
+from render.mesh import Mesh
+from render.render_queue import RenderQueue
+
+if TYPE_CHECKING:
+    from render.frustum import Frustum
+
+
+class GroundRenderer:
+    """
+    Tiles a repeating ground texture over square chunks around the camera.
+
+    Each chunk is exactly one repeat of the texture, so every chunk draws the
+    same shared quad translated into place. Only chunks within view_distance
+    of the camera and inside the frustum are drawn, so the ground has no
+    fixed extent and distant or off-screen parts cost nothing.
+    """
+
+    def __init__(self, texture_id: int, chunk_size: float = 20.0, view_distance: float = 50.0, height: float = -0.01):
+        self.texture_id = texture_id
+        self.chunk_size = chunk_size
+        self.view_distance = view_distance  # match the projection's far plane
+        self.height = height
+        self.chunks_drawn = 0  # for profiling
+        half = chunk_size / 2
+        # One chunk centered on the origin, texture v running toward -z
+        self._quad = Mesh(np.array([
+            -half, height, half, 1, 1, 1, 0, 0,
+            -half, height, -half, 1, 1, 1, 0, 1,
+            half, height, -half, 1, 1, 1, 1, 1,
+            half, height, half, 1, 1, 1, 1, 0,
+        ], dtype=np.float32), textured=True)
+
+    def chunk_bounds(self, chunk_x: int, chunk_z: int) -> BoundingBox:
+        half = self.chunk_size / 2
+        x, z = chunk_x * self.chunk_size, chunk_z * self.chunk_size
+        return BoundingBox(x - half, x + half, self.height, self.height, z - half, z + half)
+
+    def visible_chunks(self, eye: Vec3, frustum: Optional["Frustum"] = None) -> Iterator[Tuple[int, int]]:
+        """Chunks that may be within view_distance of the camera (and inside the frustum, if given)."""
+        # The far plane's corners lie beyond view_distance; pad by a chunk and let the frustum trim
+        reach = self.view_distance + self.chunk_size
+        half = self.chunk_size / 2
+        first_x = math.floor((eye[0] - reach + half) / self.chunk_size)
+        last_x = math.floor((eye[0] + reach + half) / self.chunk_size)
+        first_z = math.floor((eye[2] - reach + half) / self.chunk_size)
+        last_z = math.floor((eye[2] + reach + half) / self.chunk_size)
+        for chunk_x in range(first_x, last_x + 1):
+            for chunk_z in range(first_z, last_z + 1):
+                if frustum is None or frustum.box_visible(self.chunk_bounds(chunk_x, chunk_z)):
+                    yield chunk_x, chunk_z
+
+    def _draw_chunk(self, chunk_x: int, chunk_z: int) -> None:
+        gl.glPushMatrix()
+        gl.glTranslatef(chunk_x * self.chunk_size, 0.0, chunk_z * self.chunk_size)
+        self._quad.draw()
+        gl.glPopMatrix()
+
+    def draw(self, eye: Vec3, frustum: Optional["Frustum"] = None, render_queue: Optional[RenderQueue] = None) -> None:
+        """
+        Draw the ground around the camera position `eye` (expects world-space modelview).
+        render_queue: submit the chunks there instead of drawing them now
+        """
+        queue = render_queue if render_queue is not None else RenderQueue()
+        self.chunks_drawn = 0
+        for chunk_x, chunk_z in self.visible_chunks(eye, frustum):
+            center = (chunk_x * self.chunk_size, self.height, chunk_z * self.chunk_size)
+            queue.submit(partial(self._draw_chunk, chunk_x, chunk_z), texture=self.texture_id, position=center)
+            self.chunks_drawn += 1
+        if render_queue is None:
+            queue.flush()
+
+    def delete(self) -> None:
+        self._quad.delete()
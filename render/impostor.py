@@ -0,0 +1,152 @@
+"""Impostors: a chunk of geometry pre-rendered from above into one textured quad."""
+
+from typing import Callable, Optional
+from render.backend import gl
+from modules.base_classes import BoundingBox
+
+
+class Impostor:
+    """
+    Top-down snapshot of flat geometry (e.g. a farm chunk) drawn as a single
+    alpha-tested quad at the geometry's top height.
+
+    The snapshot is rendered into a mipmapped texture on first draw and
+    again after invalidate(); transparent texels where nothing was drawn are
+    discarded with the alpha test, so sparse chunks keep their shape.
+    """
+
+    def __init__(self, size: int = 256):
+        self.size = size
+        self.enabled = True  # falls back to the real geometry if the FBO can't be created
+        self._framebuffer: Optional[int] = None
+        self._depth_buffer: Optional[int] = None
+        self._texture: Optional[int] = None
+        self._valid = False
+
+    @property
+    def texture_id(self) -> int:
+        return self._texture or 0
+
+    @property
+    def valid(self) -> bool:
+        return self._valid
+
+    def _create_target(self) -> None:
+        self._texture = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._texture)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR_MIPMAP_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA8, self.size, self.size, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, None)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        self._depth_buffer = gl.glGenRenderbuffers(1)
+        gl.glBindRenderbuffer(gl.GL_RENDERBUFFER, self._depth_buffer)
+        gl.glRenderbufferStorage(gl.GL_RENDERBUFFER, gl.GL_DEPTH_COMPONENT24, self.size, self.size)
+        gl.glBindRenderbuffer(gl.GL_RENDERBUFFER, 0)
+
+        self._framebuffer = gl.glGenFramebuffers(1)
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, self._framebuffer)
+        gl.glFramebufferTexture2D(gl.GL_FRAMEBUFFER, gl.GL_COLOR_ATTACHMENT0, gl.GL_TEXTURE_2D, self._texture, 0)
+        gl.glFramebufferRenderbuffer(gl.GL_FRAMEBUFFER, gl.GL_DEPTH_ATTACHMENT, gl.GL_RENDERBUFFER, self._depth_buffer)
+        complete = gl.glCheckFramebufferStatus(gl.GL_FRAMEBUFFER) == gl.GL_FRAMEBUFFER_COMPLETE
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, 0)
+        if not complete:
+            self.delete()
+            self.enabled = False
+
+    def invalidate(self) -> None:
+        """Re-render the snapshot on the next capture()."""
+        self._valid = False
+
+    def capture(self, bounds: BoundingBox, draw_color: Callable[[], None], draw_coverage: Callable[[], None]) -> bool:
+        """
+        Render the geometry inside `bounds` looking straight down, if the
+        snapshot is stale. draw_color draws it normally (texture bound as
+        needed); draw_coverage draws it again untextured, and only marks
+        which texels are covered. Returns False if impostors are unavailable.
+        """
+        if self.enabled and self._framebuffer is None:
+            self._create_target()
+        if not self.enabled:
+            return False
+        if self._valid:
+            return True
+
+        viewport = gl.glGetIntegerv(gl.GL_VIEWPORT)
+        clear_color = gl.glGetFloatv(gl.GL_COLOR_CLEAR_VALUE)
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, self._framebuffer)
+        gl.glViewport(0, 0, self.size, self.size)
+        gl.glClearColor(0.0, 0.0, 0.0, 0.0)
+        gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
+
+        # Texture u follows +x and v follows -z, looking down from above bounds
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
+        half_x = (bounds.max_x - bounds.min_x) / 2
+        half_z = (bounds.max_z - bounds.min_z) / 2
+        height = bounds.max_y - bounds.min_y
+        gl.glOrtho(-half_x, half_x, -half_z, half_z, 0.5, height + 1.5)
+        gl.glMatrixMode(gl.GL_MODELVIEW)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
+        center_x = (bounds.min_x + bounds.max_x) / 2
+        center_z = (bounds.min_z + bounds.max_z) / 2
+        gl.gluLookAt(center_x, bounds.max_y + 1.0, center_z, center_x, bounds.min_y, center_z, 0, 0, -1)
+
+        gl.glColorMask(gl.GL_TRUE, gl.GL_TRUE, gl.GL_TRUE, gl.GL_FALSE)
+        draw_color()
+        gl.glColorMask(gl.GL_FALSE, gl.GL_FALSE, gl.GL_FALSE, gl.GL_TRUE)
+        gl.glDisable(gl.GL_TEXTURE_2D)
+        gl.glDisable(gl.GL_DEPTH_TEST)  # coverage only, draw order doesn't matter
+        gl.glColor4f(1.0, 1.0, 1.0, 1.0)
+        draw_coverage()
+        gl.glEnable(gl.GL_DEPTH_TEST)
+        gl.glEnable(gl.GL_TEXTURE_2D)
+        gl.glColorMask(gl.GL_TRUE, gl.GL_TRUE, gl.GL_TRUE, gl.GL_TRUE)
+
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_MODELVIEW)
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, 0)
+        gl.glViewport(*viewport)
+        gl.glClearColor(*clear_color)
+
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._texture)
+        gl.glGenerateMipmap(gl.GL_TEXTURE_2D)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        self._valid = True
+        return True
+
+    def draw(self, bounds: BoundingBox) -> None:
+        """Draw the snapshot as a quad at the top of `bounds` (expects its texture bound)."""
+        gl.glEnable(gl.GL_ALPHA_TEST)
+        gl.glAlphaFunc(gl.GL_GREATER, 0.5)
+        gl.glColor3f(1.0, 1.0, 1.0)
+        gl.glBegin(gl.GL_QUADS)
+        gl.glTexCoord2f(0, 0)
+        gl.glVertex3f(bounds.min_x, bounds.max_y, bounds.max_z)
+        gl.glTexCoord2f(1, 0)
+        gl.glVertex3f(bounds.max_x, bounds.max_y, bounds.max_z)
+        gl.glTexCoord2f(1, 1)
+        gl.glVertex3f(bounds.max_x, bounds.max_y, bounds.min_z)
+        gl.glTexCoord2f(0, 1)
+        gl.glVertex3f(bounds.min_x, bounds.max_y, bounds.min_z)
+        gl.glEnd()
+        gl.glDisable(gl.GL_ALPHA_TEST)
+
+    def delete(self) -> None:
+        """Free the framebuffer and its texture."""
+        if self._framebuffer is not None:
+            gl.glDeleteFramebuffers(1, [self._framebuffer])
+            self._framebuffer = None
+        if self._depth_buffer is not None:
+            gl.glDeleteRenderbuffers(1, [self._depth_buffer])
+            self._depth_buffer = None
+        if self._texture is not None:
+            gl.glDeleteTextures([self._texture])
+            self._texture = None
+        self._valid = False
@@ -0,0 +1,161 @@
+"""Instanced drawing: one mesh, many per-instance transforms, one draw call."""
+
+import ctypes
+from typing import Optional
+import numpy as np
+from render.backend import gl
+from render.mesh import Mesh
+
+# Fixed-function inputs (gl_Vertex, gl_Color, gl_MultiTexCoord0) come from the
+# mesh's client arrays; the instance_* attributes advance once per instance
+_VERTEX_SHADER = """
+#version 120
+attribute vec3 instance_offset;
+attribute vec3 instance_scale;
+attribute vec4 instance_uv_rect;
+varying vec2 uv;
+varying vec4 color;
+
+void main() {
+    vec3 position = gl_Vertex.xyz * instance_scale + instance_offset;
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(position, 1.0);
+    uv = instance_uv_rect.xy + gl_MultiTexCoord0.xy * (instance_uv_rect.zw - instance_uv_rect.xy);
+    color = gl_Color;
+}
+"""
+
+_FRAGMENT_SHADER = """
+#version 120
+uniform sampler2D texture0;
+uniform bool textured;
+varying vec2 uv;
+varying vec4 color;
+
+void main() {
+    gl_FragColor = textured ? texture2D(texture0, uv) * color : color;
+}
+"""
+
+# offset (3) + scale (3) + uv rect (4)
+INSTANCE_COMPONENTS = 10
+
+
+class InstanceProgram:
+    """The shared instancing shader, compiled on first use."""
+
+    _program: Optional[int] = None
+    _supported: Optional[bool] = None
+    attributes: dict = {}
+    textured_uniform = -1
+
+    @classmethod
+    def supported(cls) -> bool:
+        """True if the context can draw instanced (needs a current GL context)."""
+        if cls._supported is None:
+            cls._supported = False
+            if bool(gl.glDrawArraysInstanced) and bool(gl.glVertexAttribDivisor):
+                try:
+                    cls._compile()
+                    cls._supported = True
+                except Exception as e:
+                    print(f"Instanced rendering unavailable: {e}")
+        return cls._supported
+
+    @classmethod
+    def _compile(cls) -> None:
+        cls._program = gl.compile_program(_VERTEX_SHADER, _FRAGMENT_SHADER)
+        cls.attributes = {
+            name: gl.glGetAttribLocation(cls._program, name)
+            for name in ("instance_offset", "instance_scale", "instance_uv_rect")
+        }
+        cls.textured_uniform = gl.glGetUniformLocation(cls._program, "textured")
+        gl.glUseProgram(cls._program)
+        gl.glUniform1i(gl.glGetUniformLocation(cls._program, "texture0"), 0)
+        gl.glUseProgram(0)
+
+    @classmethod
+    def use(cls, textured: bool) -> None:
+        gl.glUseProgram(cls._program)
+        gl.glUniform1i(cls.textured_uniform, int(textured))
+
+
+class InstancedMesh:
+    """
+    Draws a shared Mesh once per instance with glDrawArraysInstanced.
+
+    Each instance has an offset, a scale and a UV rectangle (e.g. an atlas
+    region) that the mesh's 0..1 texcoords are mapped into, so instances
+    can show different textures from the same atlas page.
+    """
+
+    def __init__(self, mesh: Mesh, textured: bool = True):
+        self.mesh = mesh
+        self.textured = textured and mesh.textured
+        self.instances = np.zeros((0, INSTANCE_COMPONENTS), dtype=np.float32)
+        self._vbo: Optional[int] = None
+        self._uploaded = False
+
+    @property
+    def instance_count(self) -> int:
+        return len(self.instances)
+
+    def set_instances(self, offsets: np.ndarray, scales: np.ndarray, uv_rects: Optional[np.ndarray] = None) -> None:
+        """Replace all instances; uv_rects defaults to the full 0..1 texture."""
+        count = len(offsets)
+        instances = np.empty((count, INSTANCE_COMPONENTS), dtype=np.float32)
+        instances[:, 0:3] = offsets
+        instances[:, 3:6] = scales
+        instances[:, 6:10] = (0.0, 0.0, 1.0, 1.0) if uv_rects is None else uv_rects
+        self.instances = instances
+        self._uploaded = False
+
+    def upload(self) -> None:
+        """Upload the instance buffer (done lazily on draw after changes)."""
+        if self._vbo is None:
+            self._vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, self.instances.nbytes, self.instances, gl.GL_DYNAMIC_DRAW)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+        self._uploaded = True
+
+    def draw(self, mesh: Optional[Mesh] = None, textured: Optional[bool] = None) -> None:
+        """
+        Draw every instance with one call (expects world-space modelview).
+        mesh: draw the instances with another base mesh (e.g. a simpler LOD)
+        textured: override whether the texture is sampled
+        """
+        mesh = mesh or self.mesh
+        if self.instance_count == 0 or mesh.vertex_count == 0:
+            return
+        if not self._uploaded:
+            self.upload()
+
+        InstanceProgram.use(self.textured if textured is None else textured and self.textured)
+        mesh.bind_arrays()
+
+        stride = INSTANCE_COMPONENTS * 4
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
+        locations = []
+        for name, size, offset in (("instance_offset", 3, 0), ("instance_scale", 3, 12), ("instance_uv_rect", 4, 24)):
+            location = InstanceProgram.attributes[name]
+            if location < 0:
+                continue  # optimized out
+            gl.glEnableVertexAttribArray(location)
+            gl.glVertexAttribPointer(location, size, gl.GL_FLOAT, gl.GL_FALSE, stride, ctypes.c_void_p(offset))
+            gl.glVertexAttribDivisor(location, 1)
+            locations.append(location)
+
+        gl.glDrawArraysInstanced(mesh.mode, 0, mesh.vertex_count, self.instance_count)
+
+        for location in locations:
+            gl.glVertexAttribDivisor(location, 0)
+            gl.glDisableVertexAttribArray(location)
+        mesh.unbind_arrays()
+        gl.glUseProgram(0)
+
+    def delete(self) -> None:
+        """Free the instance buffer (the shared mesh is left alone)."""
+        if self._vbo is not None:
+            gl.glDeleteBuffers(1, [self._vbo])
+            self._vbo = None
+        self._uploaded = False
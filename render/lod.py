@@ -0,0 +1,74 @@
+"""Distance-based level of detail: level selection and simplified prop geometry."""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import numpy as np
+from modules.base_classes import Batchable, BoundingBox, GameObject, Vec3
+from render.mesh import Mesh, MeshBuilder
+
+LOD_FULL = 0  # full geometry
+LOD_SIMPLE = 1  # props as one box, farm tiles as their top quad
+LOD_IMPOSTOR = 2  # farm chunks as one pre-rendered textured quad
+
+
+@dataclass
+class LODSettings:
+    """Camera distances at which geometry switches to cheaper levels."""
+
+    simple_distance: float = 25.0
+    impostor_distance: float = 38.0
+
+    def select(self, distance: float) -> int:
+        if distance >= self.impostor_distance:
+            return LOD_IMPOSTOR
+        if distance >= self.simple_distance:
+            return LOD_SIMPLE
+        return LOD_FULL
+
+
+def box_distance(eye: Vec3, box: BoundingBox) -> float:
+    """Distance from a point to the closest point of a box (0 if inside)."""
+    dx = max(box.min_x - eye[0], 0.0, eye[0] - box.max_x)
+    dy = max(box.min_y - eye[1], 0.0, eye[1] - box.max_y)
+    dz = max(box.min_z - eye[2], 0.0, eye[2] - box.max_z)
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+def add_proxy_box(vertices: np.ndarray, builder: MeshBuilder) -> None:
+    """
+    Emit one box enclosing untextured (N, 6) position/color rows, colored
+    with their average color, e.g. a prop's local geometry.
+    """
+    if len(vertices) == 0:
+        return
+    (x0, y0, z0), (x1, y1, z1) = vertices[:, :3].min(axis=0), vertices[:, :3].max(axis=0)
+    color = tuple(float(c) for c in vertices[:, 3:6].mean(axis=0))
+    builder.add_box(float(x0), float(x1), float(y0), float(y1), float(z0), float(z1), color)  # type: ignore
+
+
+class ProxyMeshes:
+    """Simplified single-box local mesh per prop type, static state and size."""
+
+    _meshes: Dict[Tuple[type, bool, Tuple[float, ...]], Optional[Mesh]] = {}
+
+    @classmethod
+    def get(cls, obj: GameObject) -> Optional[Mesh]:
+        """Return the proxy mesh of a Batchable object, or None if it has no batchable geometry."""
+        if not isinstance(obj, Batchable):
+            return None
+        key = (type(obj), obj.is_static(), tuple(obj.size))  # some props build geometry from their size
+        if key not in cls._meshes:
+            full = MeshBuilder()
+            obj.build_mesh(full)
+            proxy = MeshBuilder()
+            add_proxy_box(np.array(full.vertices, dtype=np.float32).reshape(-1, 6), proxy)
+            cls._meshes[key] = proxy.build() if proxy.vertices else None
+        return cls._meshes[key]
+
+    @classmethod
+    def clear_cache(cls):
+        for mesh in cls._meshes.values():
+            if mesh is not None:
+                mesh.delete()
+        cls._meshes.clear()
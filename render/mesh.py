@@ -0,0 +1,117 @@
+"""Vertex-buffer meshes for geometry that is built once and drawn many times."""
+
+import ctypes
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from render.backend import gl
+
+Color = Tuple[float, float, float]
+Point = Tuple[float, float, float]
+UV = Tuple[float, float]
+
+# Faces emitted by MeshBuilder.add_box, in the same order and winding the
+# immediate-mode draw code has always used.
+BOX_FACES = ("front", "back", "left", "right", "top", "bottom")
+
+
+class Mesh:
+    """Interleaved position/color(/texcoord) vertex buffer drawn with one call."""
+
+    def __init__(self, data: np.ndarray, textured: bool = False, mode: Optional[int] = None):
+        """mode: primitive type, GL_QUADS by default."""
+        self.data = np.ascontiguousarray(data, dtype=np.float32)
+        self.textured = textured
+        self.mode = gl.GL_QUADS if mode is None else mode
+        self.components = 8 if textured else 6
+        self.vertex_count = len(self.data) // self.components
+        self._vbo: Optional[int] = None
+
+    def upload(self) -> None:
+        """Upload vertex data to the GPU (done lazily on first draw)."""
+        if self._vbo is None:
+            self._vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, self.data.nbytes, self.data, gl.GL_STATIC_DRAW)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+    def bind_arrays(self) -> None:
+        """Point the vertex/color(/texcoord) client arrays at this mesh's buffer."""
+        if self._vbo is None:
+            self.upload()
+
+        stride = self.components * 4
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glEnableClientState(gl.GL_COLOR_ARRAY)
+        gl.glVertexPointer(3, gl.GL_FLOAT, stride, ctypes.c_void_p(0))
+        gl.glColorPointer(3, gl.GL_FLOAT, stride, ctypes.c_void_p(12))
+        if self.textured:
+            gl.glEnableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+            gl.glTexCoordPointer(2, gl.GL_FLOAT, stride, ctypes.c_void_p(24))
+
+    def unbind_arrays(self) -> None:
+        if self.textured:
+            gl.glDisableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glDisableClientState(gl.GL_COLOR_ARRAY)
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+    def draw(self) -> None:
+        """Draw the whole mesh under the current modelview transform."""
+        if self.vertex_count == 0:
+            return
+        self.bind_arrays()
+        gl.glDrawArrays(self.mode, 0, self.vertex_count)
+        self.unbind_arrays()
+
+    def delete(self) -> None:
+        """Free the GPU buffer."""
+        if self._vbo is not None:
+            gl.glDeleteBuffers(1, [self._vbo])
+            self._vbo = None
+
+
+class MeshBuilder:
+    """Collect quads on the CPU and bake them into a Mesh."""
+
+    def __init__(self, textured: bool = False):
+        self.textured = textured
+        self.vertices: List[float] = []
+
+    def add_quad(self, corners: Sequence[Point], color: Color, uvs: Optional[Sequence[UV]] = None) -> None:
+        """Add one quad given its four corners in drawing order."""
+        for i, corner in enumerate(corners):
+            self.vertices.extend(corner)
+            self.vertices.extend(color)
+            if self.textured:
+                self.vertices.extend(uvs[i] if uvs else (0.0, 0.0))
+
+    def add_box(self, x0: float, x1: float, y0: float, y1: float, z0: float, z1: float,
+                color: Color, faces: Sequence[str] = BOX_FACES) -> None:
+        """Add an axis-aligned box; `faces` picks which sides to emit."""
+        quads = {
+            "front": ((x0, y0, z1), (x1, y0, z1), (x1, y1, z1), (x0, y1, z1)),
+            "back": ((x1, y0, z0), (x0, y0, z0), (x0, y1, z0), (x1, y1, z0)),
+            "left": ((x0, y0, z0), (x0, y0, z1), (x0, y1, z1), (x0, y1, z0)),
+            "right": ((x1, y0, z1), (x1, y0, z0), (x1, y1, z0), (x1, y1, z1)),
+            "top": ((x0, y1, z1), (x1, y1, z1), (x1, y1, z0), (x0, y1, z0)),
+            "bottom": ((x0, y0, z0), (x1, y0, z0), (x1, y0, z1), (x0, y0, z1)),
+        }
+        for face in faces:
+            self.add_quad(quads[face], color)
+
+    def draw_immediate(self) -> None:
+        """Emit the collected quads with glBegin/glEnd, for geometry that changes often."""
+        step = 8 if self.textured else 6
+        v = self.vertices
+        gl.glBegin(gl.GL_QUADS)
+        for i in range(0, len(v), step):
+            gl.glColor3f(v[i + 3], v[i + 4], v[i + 5])
+            if self.textured:
+                gl.glTexCoord2f(v[i + 6], v[i + 7])
+            gl.glVertex3f(v[i], v[i + 1], v[i + 2])
+        gl.glEnd()
+
+    def build(self) -> Mesh:
+        """Bake collected vertices into a Mesh (GPU upload happens on first draw)."""
+        return Mesh(np.array(self.vertices, dtype=np.float32), textured=self.textured)
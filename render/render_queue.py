@@ -0,0 +1,77 @@
+"""Per-frame queue of draw calls, sorted by render state before submission."""
+
+from typing import Callable, List, NamedTuple, Optional, Tuple
+from render.backend import gl
+from modules.base_classes import Vec3
+
+# Passes are drawn in this order
+PASS_OPAQUE = 0
+PASS_TRANSPARENT = 1
+PASS_OVERLAY = 2
+
+
+class DrawCommand(NamedTuple):
+    sort_key: Tuple
+    texture: int
+    blend: bool
+    draw: Callable[[], None]
+
+
+class RenderQueue:
+    """
+    Collects draw callbacks for a frame and submits them grouped by state.
+
+    Opaque draws are sorted by (texture, front-to-back depth), so every
+    texture is bound once per frame; transparent draws are sorted back to
+    front as blending requires. The queue owns the texture binding and the
+    blend toggle: callbacks draw with whatever texture they were submitted
+    with and must leave both as they found them.
+    """
+
+    def __init__(self):
+        self.commands: List[DrawCommand] = []
+        self.eye: Vec3 = (0.0, 0.0, 0.0)
+        self.texture_binds = 0  # binds issued by the last flush, for profiling
+
+    def begin(self, eye: Vec3) -> None:
+        """Start a frame; depth is measured from the camera position `eye`."""
+        self.commands.clear()
+        self.eye = eye
+
+    def submit(self, draw: Callable[[], None], texture: int = 0, position: Optional[Vec3] = None,
+               blend: bool = False, render_pass: int = PASS_OPAQUE) -> None:
+        """Queue a draw call; `position` is used for depth sorting."""
+        depth = 0.0
+        if position is not None:
+            ex, ey, ez = self.eye
+            depth = (position[0] - ex) ** 2 + (position[1] - ey) ** 2 + (position[2] - ez) ** 2
+        if render_pass == PASS_OPAQUE:
+            sort_key = (render_pass, blend, texture, depth)
+        else:
+            sort_key = (render_pass, blend, -depth, texture)
+        self.commands.append(DrawCommand(sort_key, texture, blend, draw))
+
+    def flush(self) -> None:
+        """Sort and execute every queued draw, then empty the queue."""
+        self.commands.sort(key=lambda command: command.sort_key)
+        bound_texture = 0
+        blending = False
+        self.texture_binds = 0
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        for command in self.commands:
+            if command.texture != bound_texture:
+                gl.glBindTexture(gl.GL_TEXTURE_2D, command.texture)
+                bound_texture = command.texture
+                self.texture_binds += 1
+            if command.blend != blending:
+                if command.blend:
+                    gl.glEnable(gl.GL_BLEND)
+                    gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+                else:
+                    gl.glDisable(gl.GL_BLEND)
+                blending = command.blend
+            command.draw()
+        if blending:
+            gl.glDisable(gl.GL_BLEND)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        self.commands.clear()
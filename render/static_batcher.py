@@ -0,0 +1,128 @@
+"""Bake props that never move into shared world-space vertex buffers."""
+
+import math
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+import numpy as np
+from modules.base_classes import BoundingBox, GameObject, Batchable, Vec3
+from render.lod import LOD_FULL, LODSettings, add_proxy_box, box_distance
+from render.mesh import Mesh, MeshBuilder
+from render.render_queue import RenderQueue
+
+if TYPE_CHECKING:
+    from render.frustum import Frustum
+
+BatchKey = Tuple[str, int, int]  # material, cell x, cell z
+
+
+class StaticBatcher:
+    """
+    Groups static props by material and map cell and draws each group with one call.
+
+    Geometry is pre-transformed the same way the main loop transforms an
+    object (translate by position, then scale by size). Objects that stop
+    being static (an opened chest, a picked-up hoe) drop out of their batch
+    and are drawn individually until they become static again. Each batch
+    also keeps a proxy mesh (one box per prop) for distant LOD, and its
+    bounds for culling.
+    """
+
+    def __init__(self, cell_size: float = 16.0):
+        self.cell_size = cell_size
+        self._members: Dict[BatchKey, List[GameObject]] = {}  # batch -> registered objects
+        self._keys: Dict[GameObject, BatchKey] = {}
+        self._baked: Set[GameObject] = set()  # objects currently inside a batch
+        self._meshes: Dict[BatchKey, Mesh] = {}
+        self._proxy_meshes: Dict[BatchKey, Mesh] = {}
+        self._bounds: Dict[BatchKey, BoundingBox] = {}
+        self._dirty: Set[BatchKey] = set()
+
+    def __contains__(self, obj: GameObject) -> bool:
+        """True if the object is drawn by a batch and should be skipped by the draw loop."""
+        return obj in self._baked
+
+    def _batch_key(self, obj: GameObject) -> BatchKey:
+        x, _, z = obj.position
+        return obj.batch_material, math.floor(x / self.cell_size), math.floor(z / self.cell_size)  # type: ignore
+
+    def add(self, obj: GameObject) -> None:
+        """Register a batchable object."""
+        if not isinstance(obj, Batchable):
+            return
+        key = self._keys[obj] = self._batch_key(obj)
+        self._members.setdefault(key, []).append(obj)
+        if obj.is_static():
+            self._baked.add(obj)
+            self._dirty.add(key)
+
+    def remove(self, obj: GameObject) -> None:
+        """Stop batching an object."""
+        key = self._keys.pop(obj, None)
+        if key is None:
+            return
+        members = self._members.get(key, [])
+        if obj in members:
+            members.remove(obj)
+        if obj in self._baked:
+            self._baked.discard(obj)
+            self._dirty.add(key)
+
+    def refresh(self, obj: GameObject) -> None:
+        """Re-check an object after its state changed; only its own batch is rebuilt."""
+        if obj not in self._keys:
+            return
+        if obj.is_static() != (obj in self._baked):  # type: ignore
+            if obj.is_static():  # type: ignore
+                self._baked.add(obj)
+            else:
+                self._baked.discard(obj)
+            self._dirty.add(self._keys[obj])
+
+    def _rebuild(self, key: BatchKey) -> None:
+        """Rebuild the world-space buffers of one batch."""
+        for meshes in (self._meshes, self._proxy_meshes):
+            old_mesh = meshes.pop(key, None)
+            if old_mesh is not None:
+                old_mesh.delete()
+        self._bounds.pop(key, None)
+
+        chunks = []
+        proxies = MeshBuilder()
+        for obj in self._members.get(key, []):
+            if obj not in self._baked:
+                continue
+            builder = MeshBuilder()
+            obj.build_mesh(builder)  # type: ignore
+            data = np.array(builder.vertices, dtype=np.float32).reshape(-1, 6)
+            data[:, :3] = data[:, :3] * np.asarray(obj.size, dtype=np.float32) + np.asarray(obj.position, dtype=np.float32)
+            chunks.append(data)
+            add_proxy_box(data, proxies)
+
+        if chunks:
+            data = np.concatenate(chunks)
+            (min_x, min_y, min_z), (max_x, max_y, max_z) = data[:, :3].min(axis=0), data[:, :3].max(axis=0)
+            self._bounds[key] = BoundingBox(min_x, max_x, min_y, max_y, min_z, max_z)
+            self._meshes[key] = Mesh(data.ravel())
+            self._proxy_meshes[key] = proxies.build()
+
+    def draw(self, render_queue: Optional[RenderQueue] = None, frustum: Optional["Frustum"] = None,
+             eye: Optional[Vec3] = None, lod: Optional[LODSettings] = None) -> None:
+        """
+        Rebuild dirty batches, then draw every batch (expects world-space modelview).
+        render_queue: submit the batches there instead of drawing them now
+        frustum: skip batches outside the view
+        eye, lod: draw batches far from the camera position as proxy boxes
+        """
+        for key in self._dirty:
+            self._rebuild(key)
+        self._dirty.clear()
+
+        for key, mesh in self._meshes.items():
+            bounds = self._bounds[key]
+            if frustum is not None and not frustum.box_visible(bounds):
+                continue
+            if eye is not None and lod is not None and lod.select(box_distance(eye, bounds)) > LOD_FULL:
+                mesh = self._proxy_meshes[key]
+            if render_queue is not None:
+                render_queue.submit(mesh.draw)
+            else:
+                mesh.draw()
@@ -1,7 +1,6 @@
-import pygame
-from OpenGL.GL import *
-from OpenGL.GLU import *
-from typing import Optional, List
+from render.backend import gl
+from typing import Optional, List, Tuple
+from collections import OrderedDict
 import math
 
 
@@ -13,16 +12,64 @@ class DialogueBox:
         self.display_time: float = 0.0
         self.max_display_time: float = 3.0  # seconds
 
-        # Initialize pygame font
-        pygame.font.init()
-        self.font = pygame.font.Font(None, 32)  # Default font, size 32
+        self.font_size = 32  # default pygame font, loaded on first draw
+        self._font = None
         self.text_color = (255, 255, 255)  # White text
 
+        # (message, color) -> (texture id, width, height), least recently shown first
+        self.max_cached_messages = 8
+        self._message_textures: "OrderedDict[Tuple[str, Tuple[int, int, int]], Tuple[int, int, int]]" = OrderedDict()
+
+    @property
+    def font(self):
+        """The message font; pygame is only imported once something is drawn."""
+        if self._font is None:
+            import pygame
+            pygame.font.init()
+            self._font = pygame.font.Font(None, self.font_size)
+        return self._font
+
     def show_message(self, message: str) -> None:
         """Display a new message."""
         self.current_message = message
         self.display_time = self.max_display_time
 
+    def _get_message_texture(self, message: str) -> Tuple[int, int, int]:
+        """Return (texture id, width, height) for a message, rendering it on a cache miss."""
+        import pygame
+        key = (message, self.text_color)
+        cached = self._message_textures.get(key)
+        if cached is not None:
+            self._message_textures.move_to_end(key)
+            return cached
+
+        text_surface = self.font.render(message, True, self.text_color)
+        text_data = pygame.image.tostring(text_surface, "RGBA", True)
+        text_width, text_height = text_surface.get_size()
+
+        texture_id = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, text_width, text_height, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, text_data)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        self._message_textures[key] = (texture_id, text_width, text_height)
+        if len(self._message_textures) > self.max_cached_messages:
+            _, (old_id, _, _) = self._message_textures.popitem(last=False)
+            gl.glDeleteTextures([old_id])
+        return self._message_textures[key]
+
+    def clear_cache(self) -> None:
+        """Free all cached message textures."""
+        for texture_id, _, _ in self._message_textures.values():
+            gl.glDeleteTextures([texture_id])
+        self._message_textures.clear()
+
+    def state_key(self) -> tuple:
+        """Snapshot of everything draw() depends on, for HUD change detection."""
+        return self.display_time > 0, self.current_message
+
     def update(self, delta_time: float) -> None:
         """Update dialogue display timer."""
         if self.display_time > 0:
@@ -34,54 +81,64 @@ class DialogueBox:
             return
 
         # Switch to 2D orthographic projection
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, window_width, 0, window_height)
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
+        gl.gluOrtho2D(0, window_width, 0, window_height)
 
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
+        gl.glMatrixMode(gl.GL_MODELVIEW)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
 
         # Disable depth test for UI rendering
-        glDisable(GL_DEPTH_TEST)
+        gl.glDisable(gl.GL_DEPTH_TEST)
 
         # Enable transparency
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        gl.glEnable(gl.GL_BLEND)
+        gl.glBlendFuncSeparate(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA, gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
 
         # Draw semi-transparent box at bottom
         box_height = 100
         padding = 20
 
-        glColor4f(0.0, 0.0, 0.0, 0.7)  # Semi-transparent black
-        glBegin(GL_QUADS)
-        glVertex2f(padding, padding)
-        glVertex2f(window_width - padding, padding)
-        glVertex2f(window_width - padding, padding + box_height)
-        glVertex2f(padding, padding + box_height)
-        glEnd()
+        gl.glColor4f(0.0, 0.0, 0.0, 0.7)  # Semi-transparent black
+        gl.glBegin(gl.GL_QUADS)
+        gl.glVertex2f(padding, padding)
+        gl.glVertex2f(window_width - padding, padding)
+        gl.glVertex2f(window_width - padding, padding + box_height)
+        gl.glVertex2f(padding, padding + box_height)
+        gl.glEnd()
 
-        # Render text using pygame
-        text_surface = self.font.render(self.current_message, True, self.text_color)
-        text_data = pygame.image.tostring(text_surface, "RGBA", True)
-        text_width, text_height = text_surface.get_size()
+        # Text comes from the cached message texture
+        texture_id, text_width, text_height = self._get_message_texture(self.current_message)
 
         # Calculate text position (centered in the box)
         text_x = padding + 15
         text_y = padding + (box_height - text_height) // 2
 
-        # Draw text as texture
-        glRasterPos2f(text_x, text_y)
-        glDrawPixels(text_width, text_height, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
-
-        glDisable(GL_BLEND)
+        # Draw text as a textured quad
+        gl.glEnable(gl.GL_TEXTURE_2D)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
+        gl.glColor4f(1.0, 1.0, 1.0, 1.0)
+        gl.glBegin(gl.GL_QUADS)
+        gl.glTexCoord2f(0, 0)
+        gl.glVertex2f(text_x, text_y)
+        gl.glTexCoord2f(1, 0)
+        gl.glVertex2f(text_x + text_width, text_y)
+        gl.glTexCoord2f(1, 1)
+        gl.glVertex2f(text_x + text_width, text_y + text_height)
+        gl.glTexCoord2f(0, 1)
+        gl.glVertex2f(text_x, text_y + text_height)
+        gl.glEnd()
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        gl.glDisable(gl.GL_BLEND)
 
         # Re-enable depth test
-        glEnable(GL_DEPTH_TEST)
+        gl.glEnable(gl.GL_DEPTH_TEST)
 
         # Restore previous projection
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_MODELVIEW)
@@ -1,9 +1,7 @@
-import pygame
 from typing import List, Optional
 from modules.items import Item, ItemType
-from OpenGL.GL import *
-from OpenGL.GLU import *
-from utils.texture_cache import TextureCache
+from render.backend import gl
+from ui.sprite_batch import SpriteBatch, ItemIcons, LAYER_BACKGROUND, LAYER_ICON, LAYER_BADGE, LAYER_LABEL, LAYER_BORDER
 
 
 class Hotbar:
@@ -18,6 +16,7 @@ class Hotbar:
         self.color_selected = (1.0, 1.0, 0.0, 0.8)  # Yellow, semi-transparent
         self.color_default = (0.2, 0.2, 0.2, 0.5)  # Dark Gray, semi-transparent
         self.border_color = (1.0, 1.0, 1.0, 1.0)  # White border
+        self._batch = SpriteBatch()
 
     def select_slot(self, index: int):
         """Change the selected slot (0-indexed)."""
@@ -51,18 +50,22 @@ class Hotbar:
                 return True
         return False
 
+    def state_key(self) -> tuple:
+        """Snapshot of everything draw() depends on, for HUD change detection."""
+        return self.selected_slot, tuple(item and (item.type, item.stack_size) for item in self.items)
+
     def draw(self, window_width: int, window_height: int):
         """Draw the hotbar with items."""
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, window_width, 0, window_height)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        glDisable(GL_DEPTH_TEST)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
+        gl.gluOrtho2D(0, window_width, 0, window_height)
+        gl.glMatrixMode(gl.GL_MODELVIEW)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
+        gl.glDisable(gl.GL_DEPTH_TEST)
+        gl.glEnable(gl.GL_BLEND)
+        gl.glBlendFuncSeparate(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA, gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
 
         slot_size = 50
         padding = 5
@@ -70,111 +73,46 @@ class Hotbar:
         start_x = (window_width - total_width) / 2
         start_y = 20
 
+        batch = self._batch
         for i, item in enumerate(self.items):
             slot_x = start_x + (i * (slot_size + padding))
             slot_y = start_y
 
-            # Draw slot background
-            if i == self.selected_slot:
-                glColor4f(1.0, 1.0, 0.0, 0.8)  # Yellow for selected
-            else:
-                glColor4f(0.3, 0.3, 0.3, 0.5)  # Gray for unselected
-
-            glBegin(GL_QUADS)
-            glVertex2f(slot_x, slot_y)
-            glVertex2f(slot_x + slot_size, slot_y)
-            glVertex2f(slot_x + slot_size, slot_y + slot_size)
-            glVertex2f(slot_x, slot_y + slot_size)
-            glEnd()
+            # Slot background: yellow for selected, gray otherwise
+            color = (1.0, 1.0, 0.0, 0.8) if i == self.selected_slot else (0.3, 0.3, 0.3, 0.5)
+            batch.add_quad(slot_x, slot_y, slot_x + slot_size, slot_y + slot_size, color, layer=LAYER_BACKGROUND)
 
             # Draw item if present
             if item:
-                # Try to load and draw texture
-                texture_path = item.get_texture_path()
-                texture_id = TextureCache.get_texture(texture_path) if texture_path else None
-                
-                if texture_id:
-                    # Draw textured quad
-                    glBindTexture(GL_TEXTURE_2D, texture_id)
-                    glColor3f(1.0, 1.0, 1.0)
-                    margin = 5
-                    glBegin(GL_QUADS)
-                    glTexCoord2f(0, 0)
-                    glVertex2f(slot_x + margin, slot_y + margin)
-                    glTexCoord2f(1, 0)
-                    glVertex2f(slot_x + slot_size - margin, slot_y + margin)
-                    glTexCoord2f(1, 1)
-                    glVertex2f(slot_x + slot_size - margin, slot_y + slot_size - margin)
-                    glTexCoord2f(0, 1)
-                    glVertex2f(slot_x + margin, slot_y + slot_size - margin)
-                    glEnd()
-                    glBindTexture(GL_TEXTURE_2D, 0)
+                margin = 5
+                sprite = ItemIcons.get(item.type)
+                if sprite:
+                    icon_color = (1.0, 1.0, 1.0, 1.0)
                 else:
                     # Fallback to color if texture not found
-                    color = item.get_color()
-                    glColor3f(*color)
-                    glBegin(GL_QUADS)
-                    margin = 5
-                    glVertex2f(slot_x + margin, slot_y + margin)
-                    glVertex2f(slot_x + slot_size - margin, slot_y + margin)
-                    glVertex2f(slot_x + slot_size - margin, slot_y + slot_size - margin)
-                    glVertex2f(slot_x + margin, slot_y + slot_size - margin)
-                    glEnd()
+                    icon_color = (*item.get_color(), 1.0)
+                batch.add_quad(
+                    slot_x + margin, slot_y + margin, slot_x + slot_size - margin, slot_y + slot_size - margin,
+                    icon_color, sprite, layer=LAYER_ICON,
+                )
 
                 # Draw stack count if > 1
                 if item.stack_size > 1:
-                    # Draw white background for stack count
-                    glColor3f(1.0, 1.0, 1.0)
-                    glBegin(GL_QUADS)
-                    glVertex2f(slot_x + slot_size - 18, slot_y + 2)
-                    glVertex2f(slot_x + slot_size - 2, slot_y + 2)
-                    glVertex2f(slot_x + slot_size - 2, slot_y + 18)
-                    glVertex2f(slot_x + slot_size - 18, slot_y + 18)
-                    glEnd()
-                    
-                    # Render stack count text using pygame
-                    font = pygame.font.Font(None, 20)
-                    text_surface = font.render(str(item.stack_size), True, (0, 0, 0))
-                    text_data = pygame.image.tostring(text_surface, "RGBA", True)
-                    
-                    text_id = glGenTextures(1)
-                    glBindTexture(GL_TEXTURE_2D, text_id)
-                    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-                    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-                    glTexImage2D(
-                        GL_TEXTURE_2D, 0, GL_RGBA,
-                        text_surface.get_width(), text_surface.get_height(),
-                        0, GL_RGBA, GL_UNSIGNED_BYTE, text_data
+                    batch.add_quad(
+                        slot_x + slot_size - 18, slot_y + 2, slot_x + slot_size - 2, slot_y + 18,
+                        (1.0, 1.0, 1.0, 1.0), layer=LAYER_BADGE,
+                    )
+                    batch.add_text(
+                        str(item.stack_size), slot_x + slot_size - 16, slot_y + 4, 20,
+                        (0.0, 0.0, 0.0, 1.0), fit_size=(12, 12), layer=LAYER_LABEL,
                     )
-                    
-                    glColor3f(1.0, 1.0, 1.0)
-                    glBegin(GL_QUADS)
-                    glTexCoord2f(0, 0)
-                    glVertex2f(slot_x + slot_size - 16, slot_y + 4)
-                    glTexCoord2f(1, 0)
-                    glVertex2f(slot_x + slot_size - 4, slot_y + 4)
-                    glTexCoord2f(1, 1)
-                    glVertex2f(slot_x + slot_size - 4, slot_y + 16)
-                    glTexCoord2f(0, 1)
-                    glVertex2f(slot_x + slot_size - 16, slot_y + 16)
-                    glEnd()
-                    
-                    glDeleteTextures([text_id])
-                    glBindTexture(GL_TEXTURE_2D, 0)
 
-            # Draw border
-            glColor4f(1.0, 1.0, 1.0, 1.0)
-            glLineWidth(2.0)
-            glBegin(GL_LINE_LOOP)
-            glVertex2f(slot_x, slot_y)
-            glVertex2f(slot_x + slot_size, slot_y)
-            glVertex2f(slot_x + slot_size, slot_y + slot_size)
-            glVertex2f(slot_x, slot_y + slot_size)
-            glEnd()
+            batch.add_outline(slot_x, slot_y, slot_x + slot_size, slot_y + slot_size, (1.0, 1.0, 1.0, 1.0), layer=LAYER_BORDER)
+        batch.flush()
 
-        glDisable(GL_BLEND)
-        glEnable(GL_DEPTH_TEST)
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        gl.glDisable(gl.GL_BLEND)
+        gl.glEnable(gl.GL_DEPTH_TEST)
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_MODELVIEW)
@@ -0,0 +1,118 @@
+"""Retained HUD layer: widgets are drawn into an offscreen texture only when they change."""
+
+from typing import Callable, Hashable, Optional
+from render.backend import gl
+
+
+class HUDCompositor:
+    """
+    Caches the whole 2D UI in a framebuffer texture.
+
+    Every frame the caller passes a hashable snapshot of the HUD state; the
+    widgets are redrawn into the texture only when that snapshot differs from
+    the last one, otherwise the cached texture is composited with one quad.
+
+    Widgets must blend with (SRC_ALPHA, ONE_MINUS_SRC_ALPHA) for color and
+    (ONE, ONE_MINUS_SRC_ALPHA) for alpha, so the texture ends up with
+    premultiplied color and correct coverage.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.enabled = True  # falls back to direct drawing if the FBO can't be created
+        self._framebuffer: Optional[int] = None
+        self._texture: Optional[int] = None
+        self._state: Optional[Hashable] = None
+        self._valid = False
+
+    def _create_target(self) -> None:
+        self._texture = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._texture)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA8, self.width, self.height, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, None)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        self._framebuffer = gl.glGenFramebuffers(1)
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, self._framebuffer)
+        gl.glFramebufferTexture2D(gl.GL_FRAMEBUFFER, gl.GL_COLOR_ATTACHMENT0, gl.GL_TEXTURE_2D, self._texture, 0)
+        complete = gl.glCheckFramebufferStatus(gl.GL_FRAMEBUFFER) == gl.GL_FRAMEBUFFER_COMPLETE
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, 0)
+        if not complete:
+            self.delete()
+            self.enabled = False
+
+    def invalidate(self) -> None:
+        """Force a redraw on the next frame."""
+        self._valid = False
+
+    def resize(self, width: int, height: int) -> None:
+        """Match a new window size (recreates the texture on next draw)."""
+        if (width, height) != (self.width, self.height):
+            self.delete()
+            self.width, self.height = width, height
+
+    def draw(self, state: Hashable, draw_widgets: Callable[[], None]) -> None:
+        """Composite the HUD, re-rendering it first if `state` changed."""
+        if self.enabled and self._framebuffer is None:
+            self._create_target()
+        if not self.enabled:
+            draw_widgets()
+            return
+
+        if not self._valid or state != self._state:
+            self._render(draw_widgets)
+            self._state = state
+            self._valid = True
+        self._composite()
+
+    def _render(self, draw_widgets: Callable[[], None]) -> None:
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, self._framebuffer)
+        gl.glClearColor(0.0, 0.0, 0.0, 0.0)
+        gl.glClear(gl.GL_COLOR_BUFFER_BIT)
+        draw_widgets()
+        gl.glBindFramebuffer(gl.GL_FRAMEBUFFER, 0)
+
+    def _composite(self) -> None:
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
+        gl.gluOrtho2D(0, self.width, 0, self.height)
+        gl.glMatrixMode(gl.GL_MODELVIEW)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
+        gl.glDisable(gl.GL_DEPTH_TEST)
+        gl.glEnable(gl.GL_BLEND)
+        gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)  # texture holds premultiplied color
+
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self._texture)
+        gl.glColor4f(1.0, 1.0, 1.0, 1.0)
+        gl.glBegin(gl.GL_QUADS)
+        gl.glTexCoord2f(0, 0)
+        gl.glVertex2f(0, 0)
+        gl.glTexCoord2f(1, 0)
+        gl.glVertex2f(self.width, 0)
+        gl.glTexCoord2f(1, 1)
+        gl.glVertex2f(self.width, self.height)
+        gl.glTexCoord2f(0, 1)
+        gl.glVertex2f(0, self.height)
+        gl.glEnd()
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        gl.glDisable(gl.GL_BLEND)
+        gl.glEnable(gl.GL_DEPTH_TEST)
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_MODELVIEW)
+
+    def delete(self) -> None:
+        """Free the framebuffer and its texture."""
+        if self._framebuffer is not None:
+            gl.glDeleteFramebuffers(1, [self._framebuffer])
+            self._framebuffer = None
+        if self._texture is not None:
+            gl.glDeleteTextures([self._texture])
+            self._texture = None
+        self._valid = False
@@ -1,9 +1,7 @@
 from modules.items import Item, ItemType
 from typing import List, Optional
-import pygame
-from OpenGL.GL import *
-from OpenGL.GLU import *
-from utils.texture_cache import TextureCache
+from render.backend import gl
+from ui.sprite_batch import SpriteBatch, ItemIcons, LAYER_BACKGROUND, LAYER_ICON, LAYER_BADGE, LAYER_LABEL, LAYER_BORDER
 
 
 class Inventory:
@@ -19,6 +17,7 @@ class Inventory:
         self.color_selected = (1.0, 1.0, 0.0, 0.8)
         self.color_default = (0.2, 0.2, 0.2, 0.5)
         self.border_color = (1.0, 1.0, 1.0, 1.0)
+        self._batch = SpriteBatch()
 
     # todo modify this to stack if possible
     def add_item(self, item: Item) -> bool:
@@ -87,20 +86,26 @@ class Inventory:
                 return True
         return False
 
+    def state_key(self) -> tuple:
+        """Snapshot of everything draw() depends on, for HUD change detection."""
+        return self.is_open, self.selected_slot, tuple(
+            item and (item.type, item.stack_size) for row in self.items for item in row
+        )
+
     def draw(self, window_width: int, window_height: int, title: str = "Inventory", offset_y: int = 0):
         """Draw the inventory grid with optional title and vertical offset."""
         # Setup 2D projection (same as hotbar)
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, window_width, 0, window_height)
-
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        glDisable(GL_DEPTH_TEST)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
+        gl.gluOrtho2D(0, window_width, 0, window_height)
+
+        gl.glMatrixMode(gl.GL_MODELVIEW)
+        gl.glPushMatrix()
+        gl.glLoadIdentity()
+        gl.glDisable(gl.GL_DEPTH_TEST)
+        gl.glEnable(gl.GL_BLEND)
+        gl.glBlendFuncSeparate(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA, gl.GL_ONE, gl.GL_ONE_MINUS_SRC_ALPHA)
 
         # Center the inventory
         total_width = (self.slot_size * self.cols) + (self.padding * (self.cols - 1))
@@ -108,16 +113,14 @@ class Inventory:
         start_x = (window_width - total_width) / 2
         start_y = offset_y
 
+        batch = self._batch
+
         # Draw title if provided
         if title:
             # Simple title rendering (you might want to use pygame font later)
-            glColor3f(1.0, 1.0, 1.0)
             title_y = start_y + total_height + 20
             # For now, just draw a line as title placeholder
-            glBegin(GL_LINES)
-            glVertex2f(start_x, title_y)
-            glVertex2f(start_x + total_width, title_y)
-            glEnd()
+            batch.add_line(start_x, title_y, start_x + total_width, title_y, (1.0, 1.0, 1.0, 1.0), layer=LAYER_BORDER)
 
         # Draw slots
         for row in range(self.rows):
@@ -126,108 +129,43 @@ class Inventory:
                 y = start_y + (row * (self.slot_size + self.padding))
 
                 # Color based on selection
-                if (row, col) == self.selected_slot:
-                    glColor4f(*self.color_selected)
-                else:
-                    glColor4f(*self.color_default)
-
-                # Draw slot
-                glBegin(GL_QUADS)
-                glVertex2f(x, y)
-                glVertex2f(x + self.slot_size, y)
-                glVertex2f(x + self.slot_size, y + self.slot_size)
-                glVertex2f(x, y + self.slot_size)
-                glEnd()
+                color = self.color_selected if (row, col) == self.selected_slot else self.color_default
+                batch.add_quad(x, y, x + self.slot_size, y + self.slot_size, color, layer=LAYER_BACKGROUND)
 
                 # Draw item if present
                 item = self.items[row][col]
                 if item:
-                    # Try to load and draw texture
-                    texture_path = item.get_texture_path()
-                    texture_id = TextureCache.get_texture(texture_path) if texture_path else None
-                    
-                    if texture_id:
-                        # Draw textured quad
-                        glBindTexture(GL_TEXTURE_2D, texture_id)
-                        glColor3f(1.0, 1.0, 1.0)
-                        item_margin = 5
-                        glBegin(GL_QUADS)
-                        glTexCoord2f(0, 0)
-                        glVertex2f(x + item_margin, y + item_margin)
-                        glTexCoord2f(1, 0)
-                        glVertex2f(x + self.slot_size - item_margin, y + item_margin)
-                        glTexCoord2f(1, 1)
-                        glVertex2f(x + self.slot_size - item_margin, y + self.slot_size - item_margin)
-                        glTexCoord2f(0, 1)
-                        glVertex2f(x + item_margin, y + self.slot_size - item_margin)
-                        glEnd()
-                        glBindTexture(GL_TEXTURE_2D, 0)
+                    item_margin = 5
+                    sprite = ItemIcons.get(item.type)
+                    if sprite:
+                        icon_color = (1.0, 1.0, 1.0, 1.0)
                     else:
                         # Fallback to color if texture not found
-                        glColor3f(*item.get_color())
-                        item_margin = 5
-                        glBegin(GL_QUADS)
-                        glVertex2f(x + item_margin, y + item_margin)
-                        glVertex2f(x + self.slot_size - item_margin, y + item_margin)
-                        glVertex2f(x + self.slot_size - item_margin, y + self.slot_size - item_margin)
-                        glVertex2f(x + item_margin, y + self.slot_size - item_margin)
-                        glEnd()
+                        icon_color = (*item.get_color(), 1.0)
+                    batch.add_quad(
+                        x + item_margin, y + item_margin,
+                        x + self.slot_size - item_margin, y + self.slot_size - item_margin,
+                        icon_color, sprite, layer=LAYER_ICON,
+                    )
 
                     # Draw stack count if > 1
                     if item.stack_size > 1:
-                        # Draw white background for stack count
-                        glColor3f(1.0, 1.0, 1.0)
-                        glBegin(GL_QUADS)
-                        glVertex2f(x + self.slot_size - 12, y + 2)
-                        glVertex2f(x + self.slot_size - 2, y + 2)
-                        glVertex2f(x + self.slot_size - 2, y + 12)
-                        glVertex2f(x + self.slot_size - 12, y + 12)
-                        glEnd()
-                        
-                        # Render stack count text using pygame
-                        font = pygame.font.Font(None, 16)
-                        text_surface = font.render(str(item.stack_size), True, (0, 0, 0))
-                        text_data = pygame.image.tostring(text_surface, "RGBA", True)
-                        
-                        text_id = glGenTextures(1)
-                        glBindTexture(GL_TEXTURE_2D, text_id)
-                        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-                        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-                        glTexImage2D(
-                            GL_TEXTURE_2D, 0, GL_RGBA,
-                            text_surface.get_width(), text_surface.get_height(),
-                            0, GL_RGBA, GL_UNSIGNED_BYTE, text_data
+                        batch.add_quad(
+                            x + self.slot_size - 12, y + 2, x + self.slot_size - 2, y + 12,
+                            (1.0, 1.0, 1.0, 1.0), layer=LAYER_BADGE,
+                        )
+                        batch.add_text(
+                            str(item.stack_size), x + self.slot_size - 11, y + 3, 16,
+                            (0.0, 0.0, 0.0, 1.0), fit_size=(8, 8), layer=LAYER_LABEL,
                         )
-                        
-                        glColor3f(1.0, 1.0, 1.0)
-                        glBegin(GL_QUADS)
-                        glTexCoord2f(0, 0)
-                        glVertex2f(x + self.slot_size - 11, y + 3)
-                        glTexCoord2f(1, 0)
-                        glVertex2f(x + self.slot_size - 3, y + 3)
-                        glTexCoord2f(1, 1)
-                        glVertex2f(x + self.slot_size - 3, y + 11)
-                        glTexCoord2f(0, 1)
-                        glVertex2f(x + self.slot_size - 11, y + 11)
-                        glEnd()
-                        
-                        glDeleteTextures([text_id])
-                        glBindTexture(GL_TEXTURE_2D, 0)
-
-                # Draw border
-                glColor4f(*self.border_color)
-                glLineWidth(2.0)
-                glBegin(GL_LINE_LOOP)
-                glVertex2f(x, y)
-                glVertex2f(x + self.slot_size, y)
-                glVertex2f(x + self.slot_size, y + self.slot_size)
-                glVertex2f(x, y + self.slot_size)
-                glEnd()
+
+                batch.add_outline(x, y, x + self.slot_size, y + self.slot_size, self.border_color, layer=LAYER_BORDER)
+        batch.flush()
 
         # Restore state
-        glDisable(GL_BLEND)
-        glEnable(GL_DEPTH_TEST)
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        gl.glDisable(gl.GL_BLEND)
+        gl.glEnable(gl.GL_DEPTH_TEST)
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_PROJECTION)
+        gl.glPopMatrix()
+        gl.glMatrixMode(gl.GL_MODELVIEW)
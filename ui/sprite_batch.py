@@ -0,0 +1,131 @@
+"""Batched 2D quad/line drawing for the UI."""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from render.backend import gl
+from modules.items import Item, ItemType
+from utils.texture_atlas import TextureAtlas
+from ui.text_renderer import TextRenderer
+
+Color = Tuple[float, float, float, float]
+UVRect = Tuple[float, float, float, float]  # u0, v0, u1, v1
+
+# Draw order of the slot widgets
+LAYER_BACKGROUND = 0
+LAYER_ICON = 1
+LAYER_BADGE = 2
+LAYER_LABEL = 3
+LAYER_BORDER = 4
+
+
+class Sprite(NamedTuple):
+    """A texture and the UV rectangle to sample from it."""
+    texture_id: int
+    uv: UVRect = (0.0, 0.0, 1.0, 1.0)
+
+
+class ItemIcons:
+    """Icon sprite (atlas page + UVs) per ItemType, resolved once instead of per slot per frame."""
+
+    _sprites: Dict[ItemType, Optional[Sprite]] = {}
+
+    @classmethod
+    def get(cls, item_type: ItemType) -> Optional[Sprite]:
+        if item_type not in cls._sprites:
+            texture_path = Item(item_type).get_texture_path()
+            region = TextureAtlas.get_region(texture_path) if texture_path else None
+            cls._sprites[item_type] = Sprite(region.texture_id, region.uv) if region else None
+        return cls._sprites[item_type]
+
+    @classmethod
+    def clear_cache(cls):
+        cls._sprites.clear()
+
+
+class _Group:
+    """Vertex data for one (layer, primitive, texture, line width) run."""
+
+    def __init__(self):
+        self.positions: List[float] = []
+        self.texcoords: List[float] = []
+        self.colors: List[float] = []
+
+
+class SpriteBatch:
+    """
+    Collects UI quads and lines, then draws them with one glDrawArrays per
+    layer/texture group. Layers are drawn in ascending order; within a layer
+    primitives are grouped by texture, so overlapping shapes must go on
+    different layers.
+    """
+
+    def __init__(self):
+        self._groups: Dict[Tuple[int, int, int, float], _Group] = {}
+
+    def _group(self, layer: int, mode: int, texture_id: int, line_width: float = 1.0) -> _Group:
+        key = (layer, mode, texture_id, line_width)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _Group()
+        return group
+
+    def add_quad(self, x0: float, y0: float, x1: float, y1: float, color: Color,
+                 sprite: Optional[Sprite] = None, layer: int = 0) -> None:
+        """Add an axis-aligned quad, textured with `sprite` if given."""
+        group = self._group(layer, gl.GL_QUADS, sprite.texture_id if sprite else 0)
+        group.positions.extend((x0, y0, x1, y0, x1, y1, x0, y1))
+        u0, v0, u1, v1 = sprite.uv if sprite else (0.0, 0.0, 0.0, 0.0)
+        group.texcoords.extend((u0, v0, u1, v0, u1, v1, u0, v1))
+        group.colors.extend(color * 4)
+
+    def add_outline(self, x0: float, y0: float, x1: float, y1: float, color: Color,
+                    width: float = 2.0, layer: int = 0) -> None:
+        """Add a rectangle outline (the four edges as line segments)."""
+        group = self._group(layer, gl.GL_LINES, 0, width)
+        group.positions.extend((x0, y0, x1, y0, x1, y0, x1, y1, x1, y1, x0, y1, x0, y1, x0, y0))
+        group.texcoords.extend((0.0,) * 16)
+        group.colors.extend(color * 8)
+
+    def add_line(self, x0: float, y0: float, x1: float, y1: float, color: Color,
+                 width: float = 2.0, layer: int = 0) -> None:
+        group = self._group(layer, gl.GL_LINES, 0, width)
+        group.positions.extend((x0, y0, x1, y1))
+        group.texcoords.extend((0.0,) * 4)
+        group.colors.extend(color * 2)
+
+    def add_text(self, text: str, x: float, y: float, font_size: int, color: Color,
+                 fit_size: Optional[Tuple[float, float]] = None, layer: int = 0) -> None:
+        """Add a string from the cached glyph atlas; (x, y) is the bottom-left corner."""
+        if not text:
+            return
+        atlas = TextRenderer.get_atlas(font_size)
+        positions, texcoords = atlas.build_fitted_quads(text, x, y, fit_size)
+        group = self._group(layer, gl.GL_QUADS, atlas.get_texture())
+        group.positions.extend(positions.ravel().tolist())
+        group.texcoords.extend(texcoords.ravel().tolist())
+        group.colors.extend(color * len(positions))
+
+    def flush(self) -> None:
+        """Draw everything collected so far (expects a 2D pixel projection) and reset."""
+        if not self._groups:
+            return
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glEnableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glEnableClientState(gl.GL_COLOR_ARRAY)
+        for (_, mode, texture_id, line_width), group in sorted(self._groups.items(), key=lambda kv: kv[0]):
+            if mode == gl.GL_LINES:
+                gl.glLineWidth(line_width)
+            positions = np.array(group.positions, dtype=np.float32)
+            texcoords = np.array(group.texcoords, dtype=np.float32)
+            colors = np.array(group.colors, dtype=np.float32)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
+            gl.glVertexPointer(2, gl.GL_FLOAT, 0, positions)
+            gl.glTexCoordPointer(2, gl.GL_FLOAT, 0, texcoords)
+            gl.glColorPointer(4, gl.GL_FLOAT, 0, colors)
+            gl.glDrawArrays(mode, 0, len(positions) // 2)
+        gl.glDisableClientState(gl.GL_COLOR_ARRAY)
+        gl.glDisableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        gl.glColor4f(1.0, 1.0, 1.0, 1.0)
+        self._groups.clear()
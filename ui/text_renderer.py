@@ -0,0 +1,144 @@
+"""Glyph-atlas text rendering for HUD labels and stack counts."""
+
+from typing import Dict, Optional, Tuple
+import numpy as np
+from render.backend import gl
+
+ATLAS_WIDTH = 512
+CHARSET = "".join(chr(c) for c in range(32, 127))  # printable ASCII
+
+
+class GlyphAtlas:
+    """A font at one size, rasterized once into a single texture."""
+
+    def __init__(self, font_size: int, font_name: Optional[str] = None):
+        import pygame
+        pygame.font.init()
+        font = pygame.font.Font(font_name, font_size)
+        self.line_height = font.get_height()
+
+        # Shelf-pack every glyph into rows of a white-on-transparent surface
+        surfaces = {ch: font.render(ch, True, (255, 255, 255)) for ch in CHARSET}
+        rects: Dict[str, Tuple[int, int, int, int]] = {}
+        x = y = 0
+        for ch, surface in surfaces.items():
+            width = surface.get_width()
+            if x + width > ATLAS_WIDTH:
+                x = 0
+                y += self.line_height + 1
+            rects[ch] = (x, y, width, surface.get_height())
+            x += width + 1
+        atlas_height = y + self.line_height + 1
+
+        self.surface = pygame.Surface((ATLAS_WIDTH, atlas_height), pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        for ch, surface in surfaces.items():
+            self.surface.blit(surface, rects[ch][:2])
+
+        # Per glyph: advance width and UV rectangle (texture is uploaded flipped)
+        self.glyphs: Dict[str, Tuple[int, int, float, float, float, float]] = {}
+        for ch, (gx, gy, width, height) in rects.items():
+            u0, u1 = gx / ATLAS_WIDTH, (gx + width) / ATLAS_WIDTH
+            v_top, v_bottom = 1 - gy / atlas_height, 1 - (gy + height) / atlas_height
+            self.glyphs[ch] = (width, height, u0, v_bottom, u1, v_top)
+
+        self.texture_id: Optional[int] = None
+
+    def _upload(self) -> None:
+        """Upload the atlas texture (needs a GL context, so done on first draw)."""
+        import pygame
+        data = pygame.image.tostring(self.surface, "RGBA", True)
+        self.texture_id = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture_id)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, self.surface.get_width(), self.surface.get_height(), 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, data)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+    def get_texture(self) -> int:
+        """Return the atlas texture, uploading it on first use."""
+        if self.texture_id is None:
+            self._upload()
+        return self.texture_id  # type: ignore
+
+    def measure(self, text: str) -> Tuple[int, int]:
+        """Return (width, height) of a string in pixels."""
+        width = sum(self.glyphs.get(ch, self.glyphs["?"])[0] for ch in text)
+        return width, self.line_height
+
+    def build_quads(self, text: str, x: float, y: float, scale_x: float = 1.0, scale_y: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (positions, texcoords) for a string whose bottom-left corner is (x, y)."""
+        positions = np.empty((len(text) * 4, 2), dtype=np.float32)
+        texcoords = np.empty((len(text) * 4, 2), dtype=np.float32)
+        pen_x = x
+        for i, ch in enumerate(text):
+            width, height, u0, v0, u1, v1 = self.glyphs.get(ch, self.glyphs["?"])
+            x1 = pen_x + width * scale_x
+            y1 = y + height * scale_y
+            positions[i * 4:i * 4 + 4] = ((pen_x, y), (x1, y), (x1, y1), (pen_x, y1))
+            texcoords[i * 4:i * 4 + 4] = ((u0, v0), (u1, v0), (u1, v1), (u0, v1))
+            pen_x = x1
+        return positions, texcoords
+
+    def build_fitted_quads(self, text: str, x: float, y: float,
+                           fit_size: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """build_quads, optionally stretched so the string covers exactly fit_size pixels."""
+        scale_x = scale_y = 1.0
+        if fit_size:
+            width, height = self.measure(text)
+            scale_x, scale_y = fit_size[0] / width, fit_size[1] / height
+        return self.build_quads(text, x, y, scale_x, scale_y)
+
+    def draw(self, text: str, x: float, y: float, color: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+             fit_size: Optional[Tuple[float, float]] = None) -> None:
+        """
+        Draw a string in one glDrawArrays call (expects a 2D pixel projection).
+        fit_size: stretch the string to exactly (width, height) pixels.
+        """
+        if not text:
+            return
+        positions, texcoords = self.build_fitted_quads(text, x, y, fit_size)
+
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.get_texture())
+        gl.glColor3f(*color)
+        gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glEnableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glVertexPointer(2, gl.GL_FLOAT, 0, positions)
+        gl.glTexCoordPointer(2, gl.GL_FLOAT, 0, texcoords)
+        gl.glDrawArrays(gl.GL_QUADS, 0, len(positions))
+        gl.glDisableClientState(gl.GL_TEXTURE_COORD_ARRAY)
+        gl.glDisableClientState(gl.GL_VERTEX_ARRAY)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+
+class TextRenderer:
+    """Cache of glyph atlases, one per font/size."""
+
+    _atlases: Dict[Tuple[Optional[str], int], GlyphAtlas] = {}
+
+    @classmethod
+    def get_atlas(cls, font_size: int, font_name: Optional[str] = None) -> GlyphAtlas:
+        """Return the atlas for a font/size, rasterizing it the first time."""
+        key = (font_name, font_size)
+        if key not in cls._atlases:
+            cls._atlases[key] = GlyphAtlas(font_size, font_name)
+        return cls._atlases[key]
+
+    @classmethod
+    def measure(cls, text: str, font_size: int) -> Tuple[int, int]:
+        return cls.get_atlas(font_size).measure(text)
+
+    @classmethod
+    def draw_text(cls, text: str, x: float, y: float, font_size: int,
+                  color: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+                  fit_size: Optional[Tuple[float, float]] = None) -> None:
+        """Draw text with the default font; (x, y) is the bottom-left corner."""
+        cls.get_atlas(font_size).draw(text, x, y, color, fit_size)
+
+    @classmethod
+    def clear_cache(cls):
+        """Free all atlas textures."""
+        for atlas in cls._atlases.values():
+            if atlas.texture_id is not None:
+                gl.glDeleteTextures([atlas.texture_id])
+        cls._atlases.clear()
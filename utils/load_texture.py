@@ -1,5 +1,4 @@
-from OpenGL.GL import *
-from OpenGL.GLU import *
+from render.backend import gl
 from modules.base_classes import BoundingBox
 import math
 from game.game_world import GameWorld
@@ -7,11 +6,9 @@ from modules.player import Player
 from modules.crate import Crate
 import pygame
 from pygame.locals import DOUBLEBUF, OPENGL
-from OpenGL.GL import *
-from OpenGL.GLU import gluPerspective, gluLookAt
 
-def pls_load_texture(filename):
-    """Load an image file and convert it into an OpenGL texture."""
+def pls_load_texture(filename, mipmaps=True):
+    """Load an image file and convert it into an OpenGL texture (with a mipmap chain unless mipmaps=False)."""
     try:
         # 1. Load the image using Pygame
         surface = pygame.image.load(filename)
@@ -25,17 +22,20 @@ def pls_load_texture(filename):
         height = surface.get_height()
 
         # 2. Generate and bind a texture ID
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
+        texture_id = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
 
         # Set filtering and wrapping (tiling) parameters
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+        # Mipmaps keep distant, low-angle surfaces from aliasing and sampling the full-size image
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR_MIPMAP_LINEAR if mipmaps else gl.GL_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_REPEAT)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_REPEAT)
 
         # Upload image data to the GPU
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, width, height, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, texture_data)
+        if mipmaps:
+            gl.glGenerateMipmap(gl.GL_TEXTURE_2D)
 
         return texture_id
 
@@ -0,0 +1,116 @@
+"""Texture atlas: small asset images packed into shared GL textures."""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from render.backend import gl
+
+# Images packed at startup; anything else requested later is added on demand
+ATLAS_IMAGES = [
+    "assets/dirt.png",
+    "assets/farmland.png",
+    "assets/tomato.png",
+    "assets/tomato_seed.png",
+    "assets/burger.png",
+    "assets/cow.png",
+    "assets/hoe.png",
+    "assets/coin.png",
+]
+
+
+class AtlasRegion(NamedTuple):
+    """Atlas page texture and the UV rectangle (u0, v0, u1, v1) of one image in it."""
+    texture_id: int
+    uv: Tuple[float, float, float, float]
+
+    def map_uv(self, u: float, v: float) -> Tuple[float, float]:
+        """Map a 0..1 UV of the original image into this region."""
+        u0, v0, u1, v1 = self.uv
+        return u0 + u * (u1 - u0), v0 + v * (v1 - v0)
+
+
+class TextureAtlas:
+    """
+    Packs images into fixed-size pages split into a grid of equal cells.
+
+    Every image is scaled to one cell (textures were always stretched over
+    0..1 UVs, so the aspect ratio was never kept anyway). UVs are inset by
+    half a texel so linear filtering never samples a neighbouring cell.
+    """
+
+    page_size = 1024
+    cell_size = 256
+
+    _pages: List[int] = []
+    _next_cell = 0
+    _regions: Dict[str, Optional[AtlasRegion]] = {}
+
+    @classmethod
+    def build(cls, paths: Optional[List[str]] = None) -> None:
+        """Pack a set of images up front (defaults to ATLAS_IMAGES)."""
+        for path in paths if paths is not None else ATLAS_IMAGES:
+            if path not in cls._regions:
+                cls._regions[path] = cls._pack(path)
+
+    @classmethod
+    def get_region(cls, texture_path: str) -> Optional[AtlasRegion]:
+        """Return the atlas region of an image, packing it on first use."""
+        if not cls._regions:
+            cls.build()  # pack the startup set together on first use
+        if texture_path not in cls._regions:
+            cls._regions[texture_path] = cls._pack(texture_path)
+        return cls._regions[texture_path]
+
+    @classmethod
+    def _new_page(cls) -> int:
+        texture_id = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, cls.page_size, cls.page_size, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, None)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        cls._pages.append(texture_id)
+        return texture_id
+
+    @classmethod
+    def _pack(cls, texture_path: str) -> Optional[AtlasRegion]:
+        import pygame
+        try:
+            image = pygame.image.load(texture_path)
+        except Exception as e:
+            print(f"Failed to load texture {texture_path}: {e}")
+            return None
+
+        cells_per_row = cls.page_size // cls.cell_size
+        cells_per_page = cells_per_row * cells_per_row
+        page_index, cell = divmod(cls._next_cell, cells_per_page)
+        if page_index == len(cls._pages):
+            cls._new_page()
+        cls._next_cell += 1
+
+        # Cells are laid out in GL texel space (row 0 at the bottom); the image
+        # is uploaded flipped, like TextureCache, so v=0 is its bottom edge
+        x = (cell % cells_per_row) * cls.cell_size
+        y = (cell // cells_per_row) * cls.cell_size
+        image = pygame.image.frombuffer(pygame.image.tostring(image, "RGBA"), image.get_size(), "RGBA")
+        image = pygame.transform.smoothscale(image, (cls.cell_size, cls.cell_size))
+        data = pygame.image.tostring(image, "RGBA", True)
+
+        texture_id = cls._pages[page_index]
+        gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
+        gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, x, y, cls.cell_size, cls.cell_size, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, data)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+        half_texel = 0.5 / cls.page_size
+        u0, v0 = x / cls.page_size, y / cls.page_size
+        u1, v1 = (x + cls.cell_size) / cls.page_size, (y + cls.cell_size) / cls.page_size
+        return AtlasRegion(texture_id, (u0 + half_texel, v0 + half_texel, u1 - half_texel, v1 - half_texel))
+
+    @classmethod
+    def clear_cache(cls):
+        """Delete all atlas pages."""
+        for texture_id in cls._pages:
+            gl.glDeleteTextures([texture_id])
+        cls._pages = []
+        cls._next_cell = 0
+        cls._regions.clear()
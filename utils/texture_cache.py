@@ -1,8 +1,7 @@
 """Texture caching system for item icons."""
 
 from typing import Dict, Optional
-from OpenGL.GL import *
-import pygame
+from render.backend import gl
 
 
 class TextureCache:
@@ -13,6 +12,7 @@ class TextureCache:
     @classmethod
     def get_texture(cls, texture_path: str) -> Optional[int]:
         """Load and cache a texture, return texture ID."""
+        import pygame
         # Return cached texture if available
         if texture_path in cls._cache:
             return cls._cache[texture_path]
@@ -23,16 +23,16 @@ class TextureCache:
             image_data = pygame.image.tostring(image, "RGBA", True)
             
             # Create OpenGL texture
-            texture_id = glGenTextures(1)
-            glBindTexture(GL_TEXTURE_2D, texture_id)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            glTexImage2D(
-                GL_TEXTURE_2D, 0, GL_RGBA,
+            texture_id = gl.glGenTextures(1)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, texture_id)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
+            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+            gl.glTexImage2D(
+                gl.GL_TEXTURE_2D, 0, gl.GL_RGBA,
                 image.get_width(), image.get_height(),
-                0, GL_RGBA, GL_UNSIGNED_BYTE, image_data
+                0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, image_data
             )
-            glBindTexture(GL_TEXTURE_2D, 0)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
             
             # Cache it
             cls._cache[texture_path] = texture_id
@@ -45,5 +45,5 @@ class TextureCache:
     def clear_cache(cls):
         """Clear all cached textures."""
         for texture_id in cls._cache.values():
-            glDeleteTextures([texture_id])
+            gl.glDeleteTextures([texture_id])
         cls._cache.clear()
@@ -1,5 +1,4 @@
-from OpenGL.GL import *
-from OpenGL.GLU import *
+from render.backend import gl
 from modules.base_classes import BoundingBox
 import math
 
@@ -11,56 +10,55 @@ def draw_collision_box(bbox: BoundingBox, color: tuple = (1.0, 0.0, 0.0, 0.3)):
         bbox: BoundingBox to draw
         color: RGBA color tuple (default: semi-transparent red)
     """
-    from OpenGL.GL import glBegin, glEnd, glVertex3f, glColor4f, glEnable, glDisable, GL_BLEND, GL_LINES, glBlendFunc, GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA
     
     # Enable transparency
-    glEnable(GL_BLEND)
-    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    gl.glEnable(gl.GL_BLEND)
+    gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
     
-    glColor4f(*color)
+    gl.glColor4f(*color)
     
     # Draw wireframe box
-    glBegin(GL_LINES)
+    gl.glBegin(gl.GL_LINES)
     
     # Bottom face
-    glVertex3f(bbox.min_x, bbox.min_y, bbox.min_z)
-    glVertex3f(bbox.max_x, bbox.min_y, bbox.min_z)
+    gl.glVertex3f(bbox.min_x, bbox.min_y, bbox.min_z)
+    gl.glVertex3f(bbox.max_x, bbox.min_y, bbox.min_z)
     
-    glVertex3f(bbox.max_x, bbox.min_y, bbox.min_z)
-    glVertex3f(bbox.max_x, bbox.min_y, bbox.max_z)
+    gl.glVertex3f(bbox.max_x, bbox.min_y, bbox.min_z)
+    gl.glVertex3f(bbox.max_x, bbox.min_y, bbox.max_z)
     
-    glVertex3f(bbox.max_x, bbox.min_y, bbox.max_z)
-    glVertex3f(bbox.min_x, bbox.min_y, bbox.max_z)
+    gl.glVertex3f(bbox.max_x, bbox.min_y, bbox.max_z)
+    gl.glVertex3f(bbox.min_x, bbox.min_y, bbox.max_z)
     
-    glVertex3f(bbox.min_x, bbox.min_y, bbox.max_z)
-    glVertex3f(bbox.min_x, bbox.min_y, bbox.min_z)
+    gl.glVertex3f(bbox.min_x, bbox.min_y, bbox.max_z)
+    gl.glVertex3f(bbox.min_x, bbox.min_y, bbox.min_z)
     
     # Top face
-    glVertex3f(bbox.min_x, bbox.max_y, bbox.min_z)
-    glVertex3f(bbox.max_x, bbox.max_y, bbox.min_z)
+    gl.glVertex3f(bbox.min_x, bbox.max_y, bbox.min_z)
+    gl.glVertex3f(bbox.max_x, bbox.max_y, bbox.min_z)
     
-    glVertex3f(bbox.max_x, bbox.max_y, bbox.min_z)
-    glVertex3f(bbox.max_x, bbox.max_y, bbox.max_z)
+    gl.glVertex3f(bbox.max_x, bbox.max_y, bbox.min_z)
+    gl.glVertex3f(bbox.max_x, bbox.max_y, bbox.max_z)
     
-    glVertex3f(bbox.max_x, bbox.max_y, bbox.max_z)
-    glVertex3f(bbox.min_x, bbox.max_y, bbox.max_z)
+    gl.glVertex3f(bbox.max_x, bbox.max_y, bbox.max_z)
+    gl.glVertex3f(bbox.min_x, bbox.max_y, bbox.max_z)
     
-    glVertex3f(bbox.min_x, bbox.max_y, bbox.max_z)
-    glVertex3f(bbox.min_x, bbox.max_y, bbox.min_z)
+    gl.glVertex3f(bbox.min_x, bbox.max_y, bbox.max_z)
+    gl.glVertex3f(bbox.min_x, bbox.max_y, bbox.min_z)
     
     # Vertical edges
-    glVertex3f(bbox.min_x, bbox.min_y, bbox.min_z)
-    glVertex3f(bbox.min_x, bbox.max_y, bbox.min_z)
+    gl.glVertex3f(bbox.min_x, bbox.min_y, bbox.min_z)
+    gl.glVertex3f(bbox.min_x, bbox.max_y, bbox.min_z)
     
-    glVertex3f(bbox.max_x, bbox.min_y, bbox.min_z)
-    glVertex3f(bbox.max_x, bbox.max_y, bbox.min_z)
+    gl.glVertex3f(bbox.max_x, bbox.min_y, bbox.min_z)
+    gl.glVertex3f(bbox.max_x, bbox.max_y, bbox.min_z)
     
-    glVertex3f(bbox.max_x, bbox.min_y, bbox.max_z)
-    glVertex3f(bbox.max_x, bbox.max_y, bbox.max_z)
+    gl.glVertex3f(bbox.max_x, bbox.min_y, bbox.max_z)
+    gl.glVertex3f(bbox.max_x, bbox.max_y, bbox.max_z)
     
-    glVertex3f(bbox.min_x, bbox.min_y, bbox.max_z)
-    glVertex3f(bbox.min_x, bbox.max_y, bbox.max_z)
+    gl.glVertex3f(bbox.min_x, bbox.min_y, bbox.max_z)
+    gl.glVertex3f(bbox.min_x, bbox.max_y, bbox.max_z)
     
-    glEnd()
+    gl.glEnd()
     
-    glDisable(GL_BLEND)
+    gl.glDisable(gl.GL_BLEND)